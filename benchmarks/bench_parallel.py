@@ -0,0 +1,48 @@
+"""Benchmark of `dateint.add` on series computed by 1 to N processes.
+
+Run with `python benchmarks/bench_parallel.py [N]`, where N defaults to the number of
+CPUs.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import dateint as di
+
+SIZE = 20_000_000
+
+
+def _dates(dtype: str) -> pd.Series:
+    rng = np.random.default_rng(0)
+    days = rng.integers(0, 20_000, SIZE) + 5000
+    dates = pd.Series(days.astype("datetime64[D]").astype("datetime64[s]"))
+    return dates.dt.strftime("%Y%m%d").astype(dtype)
+
+
+def _elapsed(dates: pd.Series, n_jobs: int) -> float:
+    start = time.perf_counter()
+    di.add(dates, months=1, days=1, unique=False, n_jobs=n_jobs)
+    return time.perf_counter() - start
+
+
+def main():
+    max_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    for dtype in ("int64", "str"):
+        dates = _dates(dtype)
+        # the first run starts the process pool
+        _elapsed(dates.head(1000), max_jobs)
+        serial = _elapsed(dates, 1)
+        for n_jobs in range(1, max_jobs + 1):
+            elapsed = _elapsed(dates, n_jobs)
+            print(
+                f"{dtype:>5} n_jobs {n_jobs:3}: {elapsed:7.3f}s"
+                f" ({serial / elapsed:5.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Micro-benchmark of the per-call latency of `dateint.add` on single values.
+
+Run with `python benchmarks/bench_scalar.py`.
+"""
+
+import datetime
+import timeit
+
+from dateutil.relativedelta import relativedelta
+
+import dateint as di
+from dateint.config import get_format_candidates
+from dateint.convert import _from_date, _to_datetime
+
+NUMBER = 100_000
+
+
+def _first_matching_format(value):
+    # Format detection probing every candidate with `strptime`.
+    text = str(int(value)) if isinstance(value, float) else str(value)
+    for fmt, expected_length in get_format_candidates():
+        if len(text) != expected_length:
+            continue
+        try:
+            datetime.datetime.strptime(text, fmt)
+            return fmt
+        except ValueError:
+            pass
+    raise ValueError(text)
+
+
+def _datetime_path(value, **kwargs):
+    # Conversion path used for every single value before the integer fast path.
+    fmt = _first_matching_format(value)
+    dt_obj = _to_datetime(value, fmt)
+    return _from_date(dt_obj + relativedelta(**kwargs), fmt, type(value))
+
+
+def main():
+    for value in (20220510, "20220510", 202205, 20220510235959):
+        for kwargs in ({"days": 1}, {"months": 1, "days": 1}):
+            assert di.add(value, **kwargs) == _datetime_path(value, **kwargs)
+            fast = timeit.timeit(lambda: di.add(value, **kwargs), number=NUMBER)
+            slow = timeit.timeit(lambda: _datetime_path(value, **kwargs), number=NUMBER)
+            print(
+                f"{value!r:>18} {str(kwargs):<26}"
+                f" integer: {fast / NUMBER * 1e6:6.2f} us/call"
+                f" datetime: {slow / NUMBER * 1e6:6.2f} us/call"
+                f" ({slow / fast:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
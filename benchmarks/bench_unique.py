@@ -0,0 +1,45 @@
+"""Benchmark of `dateint.add` on series computed on every element vs on uniques.
+
+Run with `python benchmarks/bench_unique.py`.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import dateint as di
+
+SIZE = 2_000_000
+RATIOS = (0.0001, 0.001, 0.01, 0.1, 0.5, 1.0)
+
+
+def _dates(n_unique: int, dtype: str) -> pd.Series:
+    rng = np.random.default_rng(0)
+    days = rng.integers(0, n_unique, SIZE) + 18000
+    dates = pd.Series(pd.to_datetime(days, unit="D").strftime("%Y%m%d"))
+    return dates.astype(dtype)
+
+
+def _elapsed(dates: pd.Series, unique: bool) -> float:
+    start = time.perf_counter()
+    di.add(dates, months=1, days=1, unique=unique)
+    return time.perf_counter() - start
+
+
+def main():
+    for dtype in ("int64", "str"):
+        for ratio in RATIOS:
+            dates = _dates(max(1, int(SIZE * ratio)), dtype)
+            actual_ratio = dates.nunique() / SIZE
+            every = _elapsed(dates, unique=False)
+            uniques = _elapsed(dates, unique=True)
+            print(
+                f"{dtype:>5} unique ratio {actual_ratio:7.4f}"
+                f" every element: {every:7.3f}s uniques: {uniques:7.3f}s"
+                f" ({every / uniques:5.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,20 @@
 """Helper library for manipulation of formatted date/datetime values."""
 
-from .core import add, isoweekday, sub, today, weekday
+from . import business
+from .core import (
+    add,
+    add_business_days,
+    diff,
+    end_of,
+    is_business_day,
+    isoweekday,
+    range,
+    start_of,
+    sub,
+    today,
+    validate,
+    weekday,
+)
+from .expr import expr
 
 __version__ = "0.2.0"
@@ -0,0 +1,89 @@
+"""Command line interface of dateint, to transform CSV/Parquet files.
+
+Run `python -m dateint --help` for its usage.
+"""
+
+import argparse
+from typing import List, Optional
+
+from .stream import OPERATIONS, transform_file
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m dateint",
+        description=(
+            "Apply a date/datetime operation to columns of a CSV/Parquet file, chunk "
+            "by chunk, so that files larger than memory are supported."
+        ),
+    )
+    parser.add_argument("operation", choices=sorted(OPERATIONS))
+    parser.add_argument("input", help="input file (.csv or .parquet)")
+    parser.add_argument("output", help="output file (.csv or .parquet)")
+    parser.add_argument(
+        "-c",
+        "--column",
+        action="append",
+        required=True,
+        dest="columns",
+        help="column to transform (may be repeated)",
+    )
+    parser.add_argument("--years", type=int, default=0)
+    parser.add_argument("--months", type=int, default=0)
+    parser.add_argument("--days", type=int, default=0)
+    parser.add_argument("--hours", type=int, default=0)
+    parser.add_argument("--minutes", type=int, default=0)
+    parser.add_argument("--seconds", type=int, default=0)
+    parser.add_argument("--fmt", help="format of the columns (detected by default)")
+    parser.add_argument(
+        "--out-fmt",
+        help="format of the result of add/sub (the input format by default)",
+    )
+    parser.add_argument("--chunksize", type=int, help="number of rows of each chunk")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the command line interface.
+
+    Args:
+        argv (Optional[List[str]], optional): command line arguments. Defaults to the
+            arguments of the process.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    kwargs = {}
+    if args.operation in ("add", "sub"):
+        kwargs = {
+            "years": args.years,
+            "months": args.months,
+            "days": args.days,
+            "hours": args.hours,
+            "minutes": args.minutes,
+            "seconds": args.seconds,
+            "out_fmt": args.out_fmt,
+        }
+    elif (
+        any(
+            getattr(args, name)
+            for name in ("years", "months", "days", "hours", "minutes", "seconds")
+        )
+        or args.out_fmt
+    ):
+        parser.error(
+            "--years, --months, --days, --hours, --minutes, --seconds and --out-fmt "
+            f"are not valid for {args.operation}"
+        )
+    transform_file(
+        args.input,
+        args.output,
+        args.columns,
+        args.operation,
+        chunksize=args.chunksize,
+        fmt=args.fmt,
+        **kwargs,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""Module for fixed-width formatted dates/datetimes stored in Apache Arrow arrays.
+
+The offsets and data buffers of Arrow string/binary arrays are viewed as NumPy arrays,
+without any copy, so that values are parsed and formatted as matrices of bytes by
+`dateint.numeric`, without creating one Python object per value. Arrays of other
+types and formats are handled with Arrow compute kernels. `pyarrow` is an optional
+dependency, imported only when these functions are called.
+"""
+
+from __future__ import annotations
+
+import datetime
+import sys
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+from .exception import FloatFormatError, FormatError
+from .numeric import (
+    Ordinal,
+    codes_to_ordinal,
+    fixed_width,
+    is_numeric_format,
+    ordinal_to_codes,
+)
+from .numeric import from_ordinal as numeric_from_ordinal
+from .numeric import to_ordinal as numeric_to_ordinal
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _offset_type(type: pa.DataType):
+    """Return the type of the offsets of a string/binary type (`None` if other type)."""
+    import pyarrow as pa
+
+    if pa.types.is_string(type) or pa.types.is_binary(type):
+        return np.int32
+    if pa.types.is_large_string(type) or pa.types.is_large_binary(type):
+        return np.int64
+    return None
+
+
+def _ascii_width(fmt: str) -> Optional[int]:
+    """Return the width, in bytes, of values with fixed-width format `fmt`.
+
+    `None` is returned if the format is not fixed-width or has non-ASCII literals,
+    whose width in bytes is different from their number of characters.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None or any(ord(char) > 127 for _, char in fixed.literals):
+        return None
+    return fixed.width
+
+
+def _chunks(array: Union[pa.Array, pa.ChunkedArray]) -> list:
+    return array.chunks if hasattr(array, "chunks") else [array]
+
+
+def _concatenate(arrays: list, empty: np.ndarray) -> np.ndarray:
+    if len(arrays) == 1:
+        return arrays[0]
+    if not arrays:
+        return empty
+    return np.concatenate(arrays)
+
+
+def _placeholder(fmt: str) -> str:
+    """Return the value that missing values are parsed as: 1970-01-01 formatted."""
+    return datetime.date(1970, 1, 1).strftime(fmt)
+
+
+def _chunk_to_codes(chunk: pa.Array, fmt: str) -> np.ndarray:
+    """View the data buffer of a string/binary array as a matrix of bytes.
+
+    Missing values are filled with the placeholder value, copying the data buffer.
+    """
+    width = len(_placeholder(fmt))
+    offset_type = _offset_type(chunk.type)
+    _, offsets_buffer, data_buffer = chunk.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)
+    offsets = offsets[chunk.offset : chunk.offset + len(chunk) + 1]
+    mask = null_mask(chunk)
+    invalid = np.diff(offsets) != width
+    if mask is not None:
+        invalid &= ~mask
+    if invalid.any():
+        invalid_value = chunk[int(np.argmax(invalid))].as_py()
+        if isinstance(invalid_value, bytes):
+            invalid_value = invalid_value.decode(errors="replace")
+        raise FormatError(f'Value "{invalid_value}" does not have {width} characters.')
+    if data_buffer is None:
+        data = np.zeros(0, dtype=np.uint8)
+    else:
+        data = np.frombuffer(data_buffer, dtype=np.uint8)
+    if mask is None:
+        return data[offsets[0] : offsets[-1]].reshape(len(chunk), width)
+
+    codes = np.empty((len(chunk), width), dtype=np.uint8)
+    codes[:] = np.frombuffer(_placeholder(fmt).encode(), dtype=np.uint8)
+    valid = ~mask
+    codes[valid] = data[offsets[:-1][valid, np.newaxis] + np.arange(width)]
+    return codes
+
+
+def _text_to_codes(array: Union[pa.Array, pa.ChunkedArray], fmt: str) -> np.ndarray:
+    # several chunks are concatenated as bytes, one copy of their data buffers
+    return _concatenate(
+        [_chunk_to_codes(chunk, fmt) for chunk in _chunks(array)],
+        np.zeros((0, len(_placeholder(fmt))), dtype=np.uint8),
+    )
+
+
+def to_codes(array: Union[pa.Array, pa.ChunkedArray], fmt: str) -> Optional[np.ndarray]:
+    """View an Arrow array of fixed-width formatted dates/datetimes as bytes.
+
+    Args:
+        array (Union[pa.Array, pa.ChunkedArray]): string or binary array (regular or
+            large) of formatted dates/datetimes.
+        fmt (str): fixed-width format of the values.
+
+    Raises:
+        FormatError: if any value does not have the width of the format.
+
+    Returns:
+        (Optional[np.ndarray]): matrix with the bytes of each value in a row, or `None`
+            if the array is not a string/binary array, has missing values or the
+            format is not fixed-width.
+    """
+    if _ascii_width(fmt) is None or _offset_type(array.type) is None:
+        return None
+    if array.null_count:
+        return None
+    return _text_to_codes(array, fmt)
+
+
+def to_ordinal(array: Union[pa.Array, pa.ChunkedArray], fmt: str) -> Optional[Ordinal]:
+    """Convert an Arrow array of fixed-width formatted dates/datetimes into ordinals.
+
+    Args:
+        array (Union[pa.Array, pa.ChunkedArray]): string or binary array (regular or
+            large) of formatted dates/datetimes.
+        fmt (str): fixed-width format of the values.
+
+    Raises:
+        FormatError: if any value does not represent a valid date/datetime.
+
+    Returns:
+        (Optional[Ordinal]): day ordinals and seconds of day, or `None` if the array
+            is not a string/binary array, has missing values or the format is not
+            fixed-width.
+    """
+    codes = to_codes(array, fmt)
+    if codes is None:
+        return None
+    return codes_to_ordinal(codes, fmt)
+
+
+def from_codes(chars: np.ndarray, type: pa.DataType) -> pa.Array:
+    """Wrap a matrix with the bytes of one value in each row into an Arrow array.
+
+    Args:
+        chars (np.ndarray): C-contiguous `uint8` matrix, which becomes the data buffer
+            of the array, without any copy.
+        type (pa.DataType): string or binary type (regular or large) of the result.
+
+    Returns:
+        (pa.Array): array with one value per row of `chars`.
+    """
+    import pyarrow as pa
+
+    length, width = chars.shape
+    offsets = np.arange(0, (length + 1) * width, width, dtype=_offset_type(type))
+    return pa.Array.from_buffers(
+        type, length, [None, pa.py_buffer(offsets), pa.py_buffer(chars)]
+    )
+
+
+def from_ordinal(ordinal: Ordinal, fmt: str, type: pa.DataType) -> Optional[pa.Array]:
+    """Convert ordinals into an Arrow array of fixed-width formatted dates/datetimes.
+
+    The characters of the result are written into a single preallocated buffer, which
+    becomes the data buffer of the array.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        fmt (str): fixed-width format of the result.
+        type (pa.DataType): string or binary type (regular or large) of the result.
+
+    Raises:
+        OverflowError: if any resulting year is out of the supported range.
+
+    Returns:
+        (Optional[pa.Array]): array of formatted dates/datetimes, or `None` if `type`
+            is not a string/binary type or the format is not fixed-width.
+    """
+    if _ascii_width(fmt) is None or _offset_type(type) is None:
+        return None
+    return from_codes(ordinal_to_codes(ordinal, fmt, np.uint8), type)
+
+
+def is_arrow_array(value) -> bool:
+    """Return whether `value` is an Arrow array or chunked array."""
+    # pyarrow is imported lazily: if it has not been imported yet, no array exists
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(value, (pa.Array, pa.ChunkedArray))
+
+
+def null_mask(array: Union[pa.Array, pa.ChunkedArray]) -> Optional[np.ndarray]:
+    """Return a boolean array of missing values, or `None` if there are none."""
+    if not array.null_count:
+        return None
+    masks = []
+    for chunk in _chunks(array):
+        validity = chunk.buffers()[0]
+        if validity is None:
+            # arrays of the null type have no validity bitmap, and only nulls
+            masks.append(np.full(len(chunk), chunk.null_count == len(chunk)))
+            continue
+        bits = np.unpackbits(
+            np.frombuffer(validity, dtype=np.uint8),
+            count=chunk.offset + len(chunk),
+            bitorder="little",
+        )
+        masks.append(bits[chunk.offset :] == 0)
+    return _concatenate(masks, np.zeros(0, dtype=bool))
+
+
+def _primitive_values(array: Union[pa.Array, pa.ChunkedArray]) -> np.ndarray:
+    """View the values of an array of numbers as a numpy array.
+
+    Buffers are viewed directly, instead of calling `to_numpy`, which imports pandas.
+    """
+    dtype = np.dtype(array.type.to_pandas_dtype())
+    values = [
+        np.frombuffer(chunk.buffers()[1], dtype=dtype)[
+            chunk.offset : chunk.offset + len(chunk)
+        ]
+        for chunk in _chunks(array)
+    ]
+    return _concatenate(values, np.zeros(0, dtype=dtype))
+
+
+def _validity_buffer(mask: Optional[np.ndarray]):
+    """Return the validity bitmap of an array with missing values `mask`."""
+    import pyarrow as pa
+
+    if mask is None:
+        return None
+    return pa.py_buffer(np.packbits(~mask, bitorder="little"))
+
+
+def _primitive_array(values: np.ndarray, mask: Optional[np.ndarray]) -> pa.Array:
+    """Wrap a numpy array of numbers (or booleans) into an Arrow array, without any
+    copy of numbers."""
+    import pyarrow as pa
+
+    # unlike `pyarrow.array`, `from_buffers` never imports pandas
+    type = pa.from_numpy_dtype(values.dtype)
+    if values.dtype == np.bool_:
+        # Arrow booleans are bit-packed
+        buffer = pa.py_buffer(np.packbits(values, bitorder="little"))
+    else:
+        buffer = pa.py_buffer(np.ascontiguousarray(values))
+    return pa.Array.from_buffers(type, len(values), [_validity_buffer(mask), buffer])
+
+
+def array_to_ordinal(array: Union[pa.Array, pa.ChunkedArray], fmt: str) -> Ordinal:
+    """Convert an Arrow array of formatted dates/datetimes into ordinals.
+
+    Integer arrays with a numeric format and string/binary arrays with a fixed-width
+    format are handled with integer arithmetic (see `to_ordinal`), and any other
+    array is parsed with the `strptime` compute kernel of Arrow. Missing values are
+    converted into the ordinal of 1970-01-01 (see `null_mask`).
+
+    Args:
+        array (Union[pa.Array, pa.ChunkedArray]): integer, float, string or binary
+            array of formatted dates/datetimes.
+        fmt (str): format of the values.
+
+    Raises:
+        FormatError: if any value does not represent a valid date/datetime.
+        FloatFormatError: if any float value has a non-zero decimal part.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_floating(array.type):
+        try:
+            array = pc.cast(array, pa.int64())
+        except pa.ArrowInvalid as error:
+            raise FloatFormatError(
+                f"Float values with a non-zero decimal part are not accepted ({error})."
+            ) from error
+    mask = null_mask(array)
+    if pa.types.is_integer(array.type) and is_numeric_format(fmt):
+        values = _primitive_values(array)
+        if mask is not None:
+            values = np.where(mask, int(_placeholder(fmt)), values)
+        return numeric_to_ordinal(values, fmt)
+    if _ascii_width(fmt) is not None and _offset_type(array.type) is not None:
+        return codes_to_ordinal(_text_to_codes(array, fmt), fmt)
+
+    if not pa.types.is_string(array.type) and not pa.types.is_large_string(array.type):
+        array = pc.cast(array, pa.large_string())
+    try:
+        timestamps = pc.strptime(array, format=fmt, unit="s")
+    except pa.ArrowInvalid as error:
+        raise FormatError(f'Values do not match format "{fmt}" ({error}).') from error
+    seconds = _primitive_values(pc.cast(timestamps, pa.int64()))
+    if mask is not None:
+        seconds = np.where(mask, 0, seconds)
+    days, seconds = np.divmod(seconds, 86400)
+    return Ordinal(days, seconds)
+
+
+def ordinal_to_array(
+    ordinal: Ordinal, fmt: str, like: Union[pa.Array, pa.ChunkedArray]
+) -> pa.Array:
+    """Convert ordinals into an Arrow array with the type and missing values of `like`.
+
+    Integer/float arrays with a numeric format and string/binary arrays with a
+    fixed-width format are formatted with integer arithmetic (see `from_ordinal`),
+    and any other array is formatted with the `strftime` compute kernel of Arrow.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        fmt (str): format of the result.
+        like (Union[pa.Array, pa.ChunkedArray]): original array of the operation.
+
+    Raises:
+        OverflowError: if any resulting year is out of the supported range.
+
+    Returns:
+        (pa.Array): array of formatted dates/datetimes.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    type = like.type
+    if pa.types.is_null(type):
+        return pa.nulls(len(like))
+    mask = null_mask(like)
+    if (pa.types.is_integer(type) or pa.types.is_floating(type)) and is_numeric_format(
+        fmt
+    ):
+        values = numeric_from_ordinal(ordinal, fmt)
+        return _primitive_array(values.astype(type.to_pandas_dtype()), mask)
+
+    result = from_ordinal(ordinal, fmt, type)
+    if result is not None:
+        if mask is None:
+            return result
+        return pa.Array.from_buffers(
+            type, len(result), [_validity_buffer(mask), *result.buffers()[1:]]
+        )
+
+    seconds = np.asarray(ordinal.days, dtype=np.int64) * 86400 + ordinal.seconds
+    seconds = np.broadcast_to(seconds, len(like))
+    timestamps = pc.cast(_primitive_array(seconds, mask), pa.timestamp("s"))
+    return pc.cast(pc.strftime(timestamps, format=fmt), type)
+
+
+def values_to_array(
+    values: np.ndarray, like: Union[pa.Array, pa.ChunkedArray]
+) -> pa.Array:
+    """Convert an array of results into an Arrow array with the missing values of
+    `like`."""
+    return _primitive_array(values, null_mask(like))
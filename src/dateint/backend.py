@@ -0,0 +1,99 @@
+"""Module for the backends of array types handled as Apache Arrow arrays.
+
+Besides pandas series and numpy arrays, `dateint` accepts any array type with a
+registered backend, which converts the arrays to and from Arrow arrays (ideally
+without any copy). The operations are computed on the Arrow arrays by
+`dateint.arrow`, without any conversion through pandas, and the result is converted
+back into the type of the input. Backends of `pyarrow` arrays and `polars` series are
+registered by default.
+"""
+
+import sys
+from typing import Any, Callable, List, NamedTuple, Optional
+
+
+class Backend(NamedTuple):
+    """Conversion of an array type to and from Arrow arrays.
+
+    `module` is the name of the module defining the array type: the other functions are
+    only called if that module has already been imported (by the user), so that
+    backends never import their module by themselves.
+    """
+
+    module: str
+    is_instance: Callable[[Any], bool]
+    to_arrow: Callable[[Any], Any]
+    from_arrow: Callable[[Any, Any], Any]
+
+
+_backends: List[Backend] = []
+
+
+def register_backend(backend: Backend):
+    """Register a backend, so that its array type is accepted by every operation.
+
+    Args:
+        backend (Backend): backend of an array type. Backends registered later take
+            precedence.
+    """
+    _backends.insert(0, backend)
+
+
+def get_backend(value) -> Optional[Backend]:
+    """Return the backend of the type of `value`.
+
+    Args:
+        value: any value.
+
+    Returns:
+        (Optional[Backend]): backend of the type of `value`, or `None` if no backend
+            handles it.
+    """
+    for backend in _backends:
+        if backend.module in sys.modules and backend.is_instance(value):
+            return backend
+    return None
+
+
+def _is_pyarrow_array(value) -> bool:
+    import pyarrow as pa
+
+    return isinstance(value, (pa.Array, pa.ChunkedArray))
+
+
+def _from_pyarrow(result, value):
+    import pyarrow as pa
+
+    if isinstance(value, pa.ChunkedArray):
+        return pa.chunked_array([result], type=result.type)
+    return result
+
+
+def _is_polars_series(value) -> bool:
+    import polars as pl
+
+    return isinstance(value, pl.Series)
+
+
+def _from_polars(result, value):
+    import polars as pl
+
+    return pl.Series(value.name, result)
+
+
+register_backend(
+    Backend(
+        module="pyarrow",
+        is_instance=_is_pyarrow_array,
+        to_arrow=lambda value: value,
+        from_arrow=_from_pyarrow,
+    )
+)
+register_backend(
+    Backend(
+        module="polars",
+        is_instance=_is_polars_series,
+        to_arrow=lambda value: value.to_arrow(),
+        from_arrow=_from_polars,
+    )
+)
@@ -0,0 +1,251 @@
+"""Module for business-day arithmetic on day ordinals.
+
+Business days are the days of the week set by a week mask (Monday to Friday by
+default) that are not holidays. Holiday calendars are registered by name, from a list
+of formatted dates (`register_holidays`) or from a file with one formatted date per
+line (`load_holidays`).
+
+Each holiday calendar is precomputed, the first time it is used, into arrays of the
+business days of the years of `dateint.config.set_calendar_years`, so that business
+days are added and counted with array lookups. Days outside that range fall back to
+`numpy.busday_offset` and `numpy.busday_count`, with the same results.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .calendar import get_calendar
+from .convert import _parse_value, _to_ordinal
+
+DEFAULT_WEEKMASK = "1111100"
+
+
+class Holidays(NamedTuple):
+    """Holiday calendar, as the day ordinals of its holidays and a week mask.
+
+    The week mask has seven characters, from Monday to Sunday, where `"1"` is a
+    business day (e.g. `"1111100"` for Monday to Friday).
+    """
+
+    days: Tuple[int, ...]
+    weekmask: str = DEFAULT_WEEKMASK
+
+
+_holidays: Dict[str, Holidays] = {}
+
+
+def register_holidays(
+    name: str,
+    holidays: Iterable,
+    *,
+    fmt: Optional[str] = None,
+    weekmask: str = DEFAULT_WEEKMASK,
+):
+    """Register a holiday calendar, replacing any calendar with the same name.
+
+    Args:
+        name (str): name of the holiday calendar.
+        holidays (Iterable): formatted dates of the holidays.
+        fmt (Optional[str], optional): format of the holidays. Detected from the first
+            holiday if not specified.
+        weekmask (str, optional): business days of the week, from Monday to Sunday
+            (e.g. `"1111110"` for Monday to Saturday). Defaults to Monday to Friday.
+    """
+    if len(weekmask) != 7 or set(weekmask) - {"0", "1"}:
+        raise ValueError(f'Invalid week mask "{weekmask}".')
+    values = np.asarray(list(holidays))
+    days: Tuple[int, ...] = ()
+    if len(values):
+        _, parsed = _parse_value(values, fmt)
+        ordinal, missing = _to_ordinal(parsed)
+        ordinals = np.asarray(ordinal.days)
+        if missing is not None:
+            ordinals = ordinals[~missing]
+        days = tuple(np.unique(ordinals).tolist())
+    _holidays[name] = Holidays(days, weekmask)
+
+
+def load_holidays(
+    name: str,
+    path: Union[str, Path],
+    *,
+    fmt: Optional[str] = None,
+    weekmask: str = DEFAULT_WEEKMASK,
+):
+    """Register a holiday calendar from a file with one formatted date per line.
+
+    Blank lines and lines starting with `#` are ignored.
+
+    Args:
+        name (str): name of the holiday calendar.
+        path (Union[str, Path]): path of the file.
+        fmt (Optional[str], optional): format of the holidays. Detected from the first
+            holiday if not specified.
+        weekmask (str, optional): business days of the week, from Monday to Sunday.
+            Defaults to Monday to Friday.
+    """
+    lines = (line.strip() for line in Path(path).read_text().splitlines())
+    holidays = [line for line in lines if line and not line.startswith("#")]
+    register_holidays(name, holidays, fmt=fmt, weekmask=weekmask)
+
+
+def get_holidays(name: Optional[str] = None) -> Holidays:
+    """Return a registered holiday calendar.
+
+    Args:
+        name (Optional[str], optional): name of the holiday calendar. Defaults to
+            `None`, a calendar without holidays, from Monday to Friday.
+
+    Returns:
+        (Holidays): holiday calendar.
+    """
+    if name is None:
+        return Holidays(())
+    try:
+        return _holidays[name]
+    except KeyError:
+        raise KeyError(f'Holiday calendar "{name}" is not registered.') from None
+
+
+class BusinessCalendar(NamedTuple):
+    """Business days of the range of years of `dateint.calendar`.
+
+    Arrays indexed by day are indexed by `ordinal - first_day`.
+    """
+
+    first_day: int
+    # indexed by day
+    is_business: np.ndarray
+    # number of business days before each day
+    rank: np.ndarray
+    # day ordinals of every business day
+    business_days: np.ndarray
+    # for days out of the range of the arrays
+    numpy_calendar: np.busdaycalendar
+
+
+@lru_cache(maxsize=16)
+def _build(holidays: Holidays, first_day: int, last_day: int) -> BusinessCalendar:
+    days = np.arange(first_day, last_day + 1)
+    numpy_calendar = np.busdaycalendar(
+        weekmask=holidays.weekmask,
+        holidays=np.asarray(holidays.days, dtype="datetime64[D]"),
+    )
+    is_business = np.is_busday(days.astype("datetime64[D]"), busdaycal=numpy_calendar)
+    rank = np.cumsum(is_business) - is_business
+    return BusinessCalendar(
+        first_day=first_day,
+        is_business=is_business,
+        rank=rank,
+        business_days=days[is_business],
+        numpy_calendar=numpy_calendar,
+    )
+
+
+def get_business_calendar(holidays: Holidays) -> BusinessCalendar:
+    """Return the business days of a holiday calendar, building them if needed.
+
+    Args:
+        holidays (Holidays): holiday calendar.
+
+    Returns:
+        (BusinessCalendar): business days of the range of years of the calendar.
+    """
+    calendar = get_calendar()
+    return _build(holidays, calendar.first_day, calendar.last_day)
+
+
+def _index(days, calendar: BusinessCalendar) -> Optional[np.ndarray]:
+    """Return the indexes of days in the arrays of the calendar, if all are in range."""
+    index = np.asarray(days) - calendar.first_day
+    if not index.size or index.min() < 0 or index.max() >= len(calendar.is_business):
+        return None
+    return index
+
+
+def _to_datetime64(days) -> np.ndarray:
+    return np.asarray(days).astype("datetime64[D]")
+
+
+def is_business_day(days, holidays: Holidays):
+    """Return whether day ordinals are business days.
+
+    Args:
+        days: day ordinals.
+        holidays (Holidays): holiday calendar.
+
+    Returns:
+        (Union[np.ndarray, bool]): whether each day is a business day.
+    """
+    calendar = get_business_calendar(holidays)
+    index = _index(days, calendar)
+    if index is None:
+        result = np.is_busday(_to_datetime64(days), busdaycal=calendar.numpy_calendar)
+    else:
+        result = calendar.is_business[index]
+    return result if result.ndim else bool(result)
+
+
+def add_business_days(days, business_days: int, holidays: Holidays):
+    """Add business days to day ordinals.
+
+    Days that are not business days are first rolled forward to the next business
+    day, as `numpy.busday_offset` with `roll="forward"` does (e.g. one business day
+    after a Saturday is the Tuesday).
+
+    Args:
+        days: day ordinals.
+        business_days (int): number of business days to add (may be negative).
+        holidays (Holidays): holiday calendar.
+
+    Returns:
+        (Union[np.ndarray, int]): day ordinals.
+    """
+    calendar = get_business_calendar(holidays)
+    index = _index(days, calendar)
+    if index is not None:
+        target = calendar.rank[index] + business_days
+        if target.min() >= 0 and target.max() < len(calendar.business_days):
+            result = calendar.business_days[target]
+            return result if result.ndim else int(result)
+    result = np.busday_offset(
+        _to_datetime64(days),
+        business_days,
+        roll="forward",
+        busdaycal=calendar.numpy_calendar,
+    ).astype(np.int64)
+    return result if result.ndim else int(result)
+
+
+def count_business_days(days, other, holidays: Holidays):
+    """Count the business days from `other` (included) to `days` (excluded).
+
+    If `days` is before `other`, the count is the opposite of the count from `days`
+    to `other` (unlike `numpy.busday_count`, which then counts the business days
+    after `days` and up to `other`).
+
+    Args:
+        days: day ordinals.
+        other: day ordinals, broadcast against `days`.
+        holidays (Holidays): holiday calendar.
+
+    Returns:
+        (Union[np.ndarray, int]): number of business days.
+    """
+    calendar = get_business_calendar(holidays)
+    index = _index(days, calendar)
+    other_index = _index(other, calendar)
+    if index is None or other_index is None:
+        begin, end = _to_datetime64(other), _to_datetime64(days)
+        result = np.sign(end - begin).astype(np.int64) * np.busday_count(
+            np.minimum(begin, end),
+            np.maximum(begin, end),
+            busdaycal=calendar.numpy_calendar,
+        )
+    else:
+        result = calendar.rank[index] - calendar.rank[other_index]
+    result = np.asarray(result, dtype=np.int64)
+    return result if result.ndim else int(result)
@@ -0,0 +1,255 @@
+"""Module for a precomputed calendar of day ordinals.
+
+The calendar covers a configurable range of years (see
+`dateint.config.set_calendar_years`) and is built lazily, the first time it is used.
+Conversions between calendar fields and day ordinals inside that range are array
+lookups instead of civil calendar arithmetic. Every function returns `None` if any
+value is outside the range of the calendar, so that callers can fall back to
+arithmetic.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .config import get_calendar_years
+
+# Day ordinal of invalid dates (e.g. February 30th) in `Calendar.ordinal`.
+INVALID = np.iinfo(np.int32).min
+
+# Slots per month and per year in `Calendar.ordinal`, so that every (year, month, day)
+# triple with month from 1 to 12 and day from 1 to 31 has its own slot.
+_MONTH_SLOTS = 31
+_YEAR_SLOTS = 12 * _MONTH_SLOTS
+
+
+class Calendar(NamedTuple):
+    """Calendar fields of every day of a range of years.
+
+    Day ordinals are counted from 1970-01-01, as in `dateint.numeric.Ordinal`.
+    Arrays indexed by day are indexed by `ordinal - first_day` and arrays indexed by
+    month are indexed by `(year - start_year) * 12 + month - 1`.
+    """
+
+    start_year: int
+    end_year: int
+    first_day: int
+    # indexed by day
+    year: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    weekday: np.ndarray
+    iso_year: np.ndarray
+    iso_week: np.ndarray
+    month_end: np.ndarray
+    month_index: np.ndarray
+    # indexed by month
+    month_start: np.ndarray
+    month_length: np.ndarray
+    # indexed by `(year - start_year) * 372 + (month - 1) * 31 + day - 1`
+    ordinal: np.ndarray
+
+    @property
+    def last_day(self) -> int:
+        """Day ordinal of the last day of the calendar."""
+        return self.first_day + len(self.year) - 1
+
+
+def _to_ordinal(dates: np.ndarray) -> np.ndarray:
+    return dates.astype("datetime64[D]").astype(np.int64)
+
+
+@lru_cache(maxsize=1)
+def _build(start_year: int, end_year: int) -> Calendar:
+    first_day, end_day = _to_ordinal(
+        np.array([f"{start_year:04}", f"{end_year + 1:04}"], dtype="datetime64[Y]")
+    )
+    days = np.arange(first_day, end_day)
+    dates = days.astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    years = dates.astype("datetime64[Y]")
+
+    year = years.astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = days - _to_ordinal(months) + 1
+    weekday = (days + 3) % 7
+    month_index = (year - start_year) * 12 + month - 1
+
+    # the ISO year of a day is the year of the Thursday of its week
+    thursday = (days - weekday + 3).astype("datetime64[D]")
+    iso_year_start = thursday.astype("datetime64[Y]")
+    iso_year = iso_year_start.astype(np.int64) + 1970
+    iso_week = (_to_ordinal(thursday) - _to_ordinal(iso_year_start)) // 7 + 1
+
+    month_starts = np.arange(
+        np.datetime64(f"{start_year:04}-01"),
+        np.datetime64(f"{end_year + 1:04}-02"),
+        dtype="datetime64[M]",
+    )
+    month_start = _to_ordinal(month_starts)
+    month_length = np.diff(month_start)
+    month_start = month_start[:-1]
+
+    ordinal = np.full((end_year - start_year + 1) * _YEAR_SLOTS, INVALID, np.int32)
+    ordinal[
+        (year - start_year) * _YEAR_SLOTS + (month - 1) * _MONTH_SLOTS + day - 1
+    ] = days
+
+    return Calendar(
+        start_year=start_year,
+        end_year=end_year,
+        first_day=int(first_day),
+        year=year.astype(np.int16),
+        month=month.astype(np.int8),
+        day=day.astype(np.int8),
+        weekday=weekday.astype(np.int8),
+        iso_year=iso_year.astype(np.int16),
+        iso_week=iso_week.astype(np.int8),
+        month_end=day == month_length[month_index],
+        month_index=month_index.astype(np.int32),
+        month_start=month_start.astype(np.int32),
+        month_length=month_length.astype(np.int8),
+        ordinal=ordinal,
+    )
+
+
+def get_calendar() -> Calendar:
+    """Return the calendar of the configured range of years, building it if needed.
+
+    Returns:
+        (Calendar): calendar fields of every day of the configured range of years.
+    """
+    return _build(*get_calendar_years())
+
+
+def _in_range(values, low: int, high: int) -> bool:
+    values = np.asarray(values)
+    if not values.size:
+        return False
+    return bool(values.min() >= low and values.max() <= high)
+
+
+def lookup_days(year, month, day) -> Optional[np.ndarray]:
+    """Convert calendar fields into day ordinals.
+
+    Args:
+        year: array of years.
+        month: array (or single value) of months.
+        day: array (or single value) of days.
+
+    Returns:
+        (Optional[np.ndarray]): int64 array of day ordinals, with `INVALID` for
+            fields that do not represent a valid date, or `None` if any year is out of
+            the range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(year, calendar.start_year, calendar.end_year):
+        return None
+    valid = (month >= 1) & (month <= 12) & (day >= 1) & (day <= _MONTH_SLOTS)
+    slot = (
+        (year - calendar.start_year) * _YEAR_SLOTS
+        + (month - 1) * _MONTH_SLOTS
+        + (day - 1)
+    )
+    days = calendar.ordinal[np.where(valid, slot, 0)].astype(np.int64)
+    return np.where(valid, days, INVALID)
+
+
+def lookup_fields(days) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Convert day ordinals into calendar fields.
+
+    Args:
+        days: array of day ordinals.
+
+    Returns:
+        (Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]): int64 arrays of years,
+            months and days, or `None` if any day is out of the range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(days, calendar.first_day, calendar.last_day):
+        return None
+    index = np.asarray(days) - calendar.first_day
+    return (
+        calendar.year[index].astype(np.int64),
+        calendar.month[index].astype(np.int64),
+        calendar.day[index].astype(np.int64),
+    )
+
+
+def add_months(days, months: Union[int, np.ndarray]) -> Optional[np.ndarray]:
+    """Add months to day ordinals, clamping the day to the end of the resulting month.
+
+    Args:
+        days: array of day ordinals.
+        months (Union[int, np.ndarray]): number of months to add, either to every
+            day or element-wise.
+
+    Returns:
+        (Optional[np.ndarray]): int64 array of day ordinals, or `None` if any day or
+            result is out of the range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(days, calendar.first_day, calendar.last_day):
+        return None
+    index = np.asarray(days) - calendar.first_day
+    month_index = calendar.month_index[index]
+    target = month_index + months
+    if not _in_range(target, 0, len(calendar.month_start) - 1):
+        return None
+    day_of_month = np.minimum(
+        calendar.day[index], calendar.month_length[target]
+    ).astype(np.int64)
+    return calendar.month_start[target] + day_of_month - 1
+
+
+def lookup_weekday(days) -> Optional[np.ndarray]:
+    """Return the day of week of day ordinals, where Monday is 0 and Sunday is 6.
+
+    Args:
+        days: array of day ordinals.
+
+    Returns:
+        (Optional[np.ndarray]): int64 array of days of week, or `None` if any day is
+            out of the range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(days, calendar.first_day, calendar.last_day):
+        return None
+    return calendar.weekday[np.asarray(days) - calendar.first_day].astype(np.int64)
+
+
+def lookup_iso_week(days) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return the ISO year and ISO week of day ordinals.
+
+    Args:
+        days: array of day ordinals.
+
+    Returns:
+        (Optional[Tuple[np.ndarray, np.ndarray]]): int64 arrays of ISO years and ISO
+            weeks, or `None` if any day is out of the range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(days, calendar.first_day, calendar.last_day):
+        return None
+    index = np.asarray(days) - calendar.first_day
+    return (
+        calendar.iso_year[index].astype(np.int64),
+        calendar.iso_week[index].astype(np.int64),
+    )
+
+
+def lookup_month_end(days) -> Optional[np.ndarray]:
+    """Return whether day ordinals are the last day of their month.
+
+    Args:
+        days: array of day ordinals.
+
+    Returns:
+        (Optional[np.ndarray]): boolean array, or `None` if any day is out of the
+            range of the calendar.
+    """
+    calendar = get_calendar()
+    if not _in_range(days, calendar.first_day, calendar.last_day):
+        return None
+    return calendar.month_end[np.asarray(days) - calendar.first_day]
@@ -4,6 +4,23 @@ from typing import List, Tuple
 
 DEFAULT_FORMAT = "%Y%m%d"
 
+# Series with fewer elements than this are never factorized automatically.
+UNIQUE_MIN_SIZE = 10_000
+
+# Maximum ratio of unique values to series length to automatically compute operations
+# only on the unique values of a series.
+UNIQUE_RATIO_THRESHOLD = 0.5
+
+# Number of rows of each chunk read by `dateint.stream`.
+STREAM_CHUNK_SIZE = 100_000
+
+# Number of rows of each block operated and written into the `out` array of an
+# operation (e.g. `dateint.add`).
+BLOCK_SIZE = 65_536
+
+# First and last years (inclusive) of the precomputed calendar.
+DEFAULT_CALENDAR_YEARS = (1900, 2200)
+
 DEFAULT_FORMAT_CANDIDATES = [
     ("%Y%m", 6),
     ("%Y%m%d", 8),
@@ -21,6 +38,9 @@ def get_date_format() -> str:
     return DEFAULT_FORMAT
 
 
+_format_candidates = DEFAULT_FORMAT_CANDIDATES
+
+
 def get_format_candidates() -> List[Tuple[str, int]]:
     """Return a sequence of date format candidates to try parsing the input value.
 
@@ -29,4 +49,82 @@ def get_format_candidates() -> List[Tuple[str, int]]:
             element of the tuple the format string, and the second the expected length
             of the input value.
     """
-    return DEFAULT_FORMAT_CANDIDATES
+    return _format_candidates
+
+
+def set_format_candidates(candidates: List[Tuple[str, int]]) -> None:
+    """Set the sequence of date format candidates to try parsing the input value.
+
+    Args:
+        candidates (List[Tuple[str, int]]): sequence of date format candidates, in
+            the same layout returned by `get_format_candidates`.
+    """
+    global _format_candidates
+    _format_candidates = list(candidates)
+
+
+def get_unique_min_size() -> int:
+    """Return the minimum length of a series to automatically compute on its uniques.
+
+    Returns:
+        int: minimum length of a series.
+    """
+    return UNIQUE_MIN_SIZE
+
+
+def get_unique_ratio_threshold() -> float:
+    """Return the maximum unique ratio to automatically compute on uniques of a series.
+
+    Returns:
+        float: maximum ratio of unique values to series length.
+    """
+    return UNIQUE_RATIO_THRESHOLD
+
+
+def get_stream_chunk_size() -> int:
+    """Return the number of rows of each chunk read by `dateint.stream`.
+
+    Returns:
+        int: number of rows of each chunk.
+    """
+    return STREAM_CHUNK_SIZE
+
+
+def get_block_size() -> int:
+    """Return the number of rows of each block written into an output array.
+
+    Returns:
+        int: number of rows of each block.
+    """
+    return BLOCK_SIZE
+
+
+_calendar_years = DEFAULT_CALENDAR_YEARS
+
+
+def get_calendar_years() -> Tuple[int, int]:
+    """Return the range of years covered by the precomputed calendar.
+
+    Returns:
+        Tuple[int, int]: first and last years (inclusive) of the calendar.
+    """
+    return _calendar_years
+
+
+def set_calendar_years(start_year: int, end_year: int) -> None:
+    """Set the range of years covered by the precomputed calendar.
+
+    Dates out of this range are still supported, but handled with slower arithmetic
+    instead of array lookups.
+
+    Args:
+        start_year (int): first year of the calendar.
+        end_year (int): last year (inclusive) of the calendar.
+    """
+    if not 1 <= start_year <= end_year <= 9999:
+        raise ValueError(
+            f"Invalid calendar years ({start_year}, {end_year}): years must be between "
+            "1 and 9999 and the start year must not be after the end year."
+        )
+    global _calendar_years
+    _calendar_years = (start_year, end_year)
@@ -1,22 +1,98 @@
 """Module for date/datetime conversion."""
 
+from __future__ import annotations
+
 import datetime
-from functools import wraps
+import sys
+from functools import lru_cache, partial, wraps
 from math import isclose
-from typing import Union
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
 
-import pandas as pd
+import numpy as np
 
-from .config import get_format_candidates
+from .arrow import array_to_ordinal as arrow_array_to_ordinal
+from .arrow import from_codes as arrow_from_codes
+from .arrow import is_arrow_array
+from .arrow import null_mask as arrow_null_mask
+from .arrow import ordinal_to_array as arrow_ordinal_to_array
+from .arrow import to_codes as arrow_to_codes
+from .backend import Backend, get_backend
+from .config import (
+    get_block_size,
+    get_date_format,
+    get_format_candidates,
+    get_unique_min_size,
+    get_unique_ratio_threshold,
+)
 from .exception import FloatFormatError, FormatError
+from .numeric import (
+    Ordinal,
+    fixed_width,
+    from_ordinal,
+    is_numeric_format,
+    is_valid,
+    is_valid_text,
+    scalar_from_ordinal,
+    scalar_ordinal_to_text,
+    ordinal_to_text,
+    scalar_text_to_ordinal,
+    scalar_to_ordinal,
+    shift,
+    text_to_ordinal,
+    to_ordinal,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from typing_extensions import TypeGuard
+
+DateRepresentationType = Union[float, int, str, "pd.Series", np.ndarray, list, tuple]
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _is_series(value) -> TypeGuard[pd.Series]:
+    # pandas is imported lazily: if it has not been imported yet, no series exists
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.Series)
+
 
-DateRepresentationType = Union[float, int, str, pd.Series]
+def _is_dateint(value) -> TypeGuard[pd.Series]:
+    """Return whether `value` is a series of dtype `dateint`.
+
+    See `dateint.extension`.
+    """
+    # the dtype only exists once its module has been imported
+    extension = sys.modules.get("dateint.extension")
+    return (
+        extension is not None
+        and _is_series(value)
+        and isinstance(value.dtype, extension.DateintDtype)
+    )
+
+
+def _missing(value) -> Optional[np.ndarray]:
+    """Return a boolean array of the missing values of a series/array of floats.
+
+    Missing values are `NaN` in float series/arrays and `None`/`NA` in series of
+    nullable (e.g. `Int64`, `string`) or object dtype. `None` is returned if there are
+    none, or if the values can not be missing (e.g. numpy integers).
+    """
+    if _is_series(value):
+        if isinstance(value.dtype, np.dtype) and value.dtype.kind in "iub":
+            return None
+        missing = np.asarray(value.isna(), dtype=bool)
+    elif isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        missing = np.isnan(value)
+    else:
+        return None
+    return missing if missing.any() else None
 
 
 def _from_date(
     dt: Union[datetime.date, datetime.datetime, pd.Series], fmt: str, return_type: type
 ) -> DateRepresentationType:
-    if isinstance(dt, pd.Series):
+    if _is_series(dt):
         fmtted = dt.dt.strftime(fmt)
         return fmtted.astype(return_type)
     elif isinstance(dt, (datetime.date, datetime.datetime)):
@@ -28,7 +104,9 @@ def _from_date(
 
 
 def _to_datetime(value: DateRepresentationType, fmt: str) -> datetime.datetime:
-    if isinstance(value, pd.Series):
+    if _is_series(value):
+        import pandas as pd
+
         return pd.Series(pd.to_datetime(value, format=fmt))
     if isinstance(value, float):
         value = int(value)
@@ -37,82 +115,1060 @@ def _to_datetime(value: DateRepresentationType, fmt: str) -> datetime.datetime:
     return dt
 
 
-def _first_matching_format(value: DateRepresentationType) -> str:
-    if isinstance(value, pd.Series):
-        first_value = value.iloc[0]
-        original_value = first_value
-        if isinstance(first_value, float):
-            frac = first_value % 1
-            if not isclose(frac, 0):
-                raise FloatFormatError(
-                    "Float values with a non-zero decimal part are not accepted "
-                    f'(first element of series: "{original_value}").'
-                )
-            first_value = int(first_value)
-        first_value = str(first_value)
+class _Candidate(NamedTuple):
+    fmt: str
+    # Whether `fmt` is fixed-width, so that values can be parsed with integer
+    # arithmetic instead of `strptime`.
+    compiled: bool
 
-        value_length = len(first_value)
-        candidates = get_format_candidates()
-        for fmt, expected_length in candidates:
-            try:
-                if value_length != expected_length:
-                    continue
-                datetime.datetime.strptime(first_value, fmt)
-                return fmt
-            except ValueError:
-                pass
-        raise FormatError(
-            f'First value "{original_value}" does not match any of configured formats: '
-            f"{[c[0] for c in candidates]}.\n"
-            "Hint: to prevent ambiguity issues, if no format is explicitly specified by"
-            " the user, all values (year, month, day, ...) must be zero-padded."
-        )
+
+@lru_cache(maxsize=1)
+def _format_table(
+    candidates: Tuple[Tuple[str, int], ...],
+) -> Dict[Tuple[str, int], Tuple[_Candidate, ...]]:
+    """Build the format detection table from the sequence of format candidates.
+
+    Candidates are grouped by the kind of input (`"int"` for numbers and `"str"` for
+    strings) and the length of its string representation, preserving their order, so
+    that detection only tries the few candidates that can possibly match.
+    """
+    table: Dict[Tuple[str, int], List[_Candidate]] = {}
+    for fmt, expected_length in candidates:
+        fixed = fixed_width(fmt)
+        compiled = fixed is not None and fixed.width == expected_length
+        table.setdefault(("str", expected_length), []).append(_Candidate(fmt, compiled))
+        if compiled and fixed is not None and fixed.literals:
+            # string representations of numbers never contain literal characters
+            continue
+        table.setdefault(("int", expected_length), []).append(_Candidate(fmt, compiled))
+    return {key: tuple(value) for key, value in table.items()}
+
+
+def _match_format(text: str, kind: str) -> Optional[Tuple[str, Optional[Ordinal]]]:
+    table = _format_table(tuple(get_format_candidates()))
+    for candidate in table.get((kind, len(text)), ()):
+        if candidate.compiled:
+            ordinal = scalar_text_to_ordinal(text, candidate.fmt)
+            if ordinal is not None:
+                return candidate.fmt, ordinal
+            continue
+        try:
+            datetime.datetime.strptime(text, candidate.fmt)
+            return candidate.fmt, None
+        except ValueError:
+            pass
+    return None
+
+
+def _detect_format(value) -> Tuple[str, Optional[Ordinal]]:
+    """Detect the format of a value, or of the first element of a series.
+
+    Returns:
+        (Tuple[str, Optional[Ordinal]]): the first matching format candidate and, if
+            the format is fixed-width, the value (or first element) as an ordinal.
+    """
+    if _is_dateint(value):
+        return value.dtype.fmt, None
+    arrow = is_arrow_array(value)
+    if _is_vector(value) or arrow:
+        missing = arrow_null_mask(value) if arrow else _missing(value)
+        if len(value) == 0 or (missing is not None and missing.all()):
+            # the format of missing values (or of no value) is irrelevant
+            return get_date_format(), None
+        # missing values are skipped
+        position = 0 if missing is None else int(missing.argmin())
+        if _is_series(value):
+            first_value = value.iloc[position]
+            context = f'first valid element of series: "{first_value}"'
+        elif arrow:
+            first_value = value[position].as_py()
+            context = f'first valid element of array: "{first_value}"'
+        else:
+            first_value = value[position]
+            context = f'first valid element of array: "{first_value}"'
+        if isinstance(first_value, np.generic):
+            first_value = first_value.item()
     else:
-        original_value = value
-        if isinstance(value, float):
-            frac = value % 1
-            if not isclose(frac, 0):
-                raise FloatFormatError(
-                    "Float values with a non-zero decimal part are not accepted "
-                    f"({original_value})."
-                )
-            value = int(value)
-        value = str(value)
+        first_value = value
+        context = str(first_value)
+
+    original_value = first_value
+    if isinstance(first_value, float):
+        frac = first_value % 1
+        if not isclose(frac, 0):
+            raise FloatFormatError(
+                "Float values with a non-zero decimal part are not accepted "
+                f"({context})."
+            )
+        first_value = int(first_value)
+    if isinstance(first_value, bytes):
+        first_value = first_value.decode()
 
-        value_length = len(value)
+    kind = "str" if isinstance(first_value, str) else "int"
+    match = _match_format(str(first_value), kind)
+    if match is None:
         candidates = get_format_candidates()
-        for fmt, expected_length in candidates:
-            try:
-                if value_length != expected_length:
-                    continue
-                datetime.datetime.strptime(value, fmt)
-                return fmt
-            except ValueError:
-                pass
         raise FormatError(
             f'First value "{original_value}" does not match any of configured formats: '
             f"{[c[0] for c in candidates]}.\n"
             "Hint: to prevent ambiguity issues, if no format is explicitly specified by"
             " the user, all values (year, month, day, ...) must be zero-padded."
         )
+    return match
+
+
+def _first_matching_format(value: DateRepresentationType) -> str:
+    return _detect_format(value)[0]
+
+
+def _first_parsable_format(value) -> str:
+    """Detect the format of a series/array from its first value that parses.
+
+    Unlike `_first_matching_format`, values that do not match any format candidate
+    are skipped, so that invalid values never prevent detection: every candidate
+    that may match the kind of values is validated on the whole series/array (see
+    `_invalid`), and the candidate of the first valid value is returned (the first
+    candidate if no value is valid). Only the first value is checked when it matches.
+    """
+    try:
+        return _first_matching_format(value)
+    except (FormatError, FloatFormatError):
+        pass
+    numeric = value.dtype.kind in "iuf"
+    missing = _missing(value)
+    candidates = [fmt for fmt, _ in get_format_candidates()]
+    best, best_position = candidates[0], len(value)
+    for candidate in candidates:
+        if numeric and not is_numeric_format(candidate):
+            continue
+        valid = np.ones(len(value), dtype=bool)
+        for mask in (missing, _invalid(value, candidate)):
+            if mask is not None:
+                valid &= ~mask
+        position = int(valid.argmax()) if valid.any() else len(value)
+        if position < best_position:
+            best, best_position = candidate, position
+    return best
 
 
 def _get_return_type(value):
-    if isinstance(value, pd.Series):
+    if _is_vector(value):
         return value.dtype
     else:
         return type(value)
 
 
+def _scalar_to_ordinal(value, fmt: str) -> Optional[Ordinal]:
+    """Convert a single value with a known format into an ordinal.
+
+    `None` is returned if `fmt` is not fixed-width, so that the value is parsed with
+    `strptime` instead.
+    """
+    if fixed_width(fmt) is None:
+        return None
+
+    original_value = value
+    if isinstance(value, float):
+        if not isclose(value % 1, 0):
+            raise FloatFormatError(
+                "Float values with a non-zero decimal part are not accepted "
+                f"({original_value})."
+            )
+        value = int(value)
+
+    if isinstance(value, int) and is_numeric_format(fmt):
+        ordinal = scalar_to_ordinal(value, fmt)
+    else:
+        ordinal = scalar_text_to_ordinal(str(value), fmt)
+    if ordinal is None:
+        raise FormatError(f'Value "{original_value}" does not match format "{fmt}".')
+    return ordinal
+
+
+def _ordinal_to_datetime(ordinal: Ordinal, value):
+    if _is_vector(value):
+        import pandas as pd
+
+        seconds = np.asarray(ordinal.days, dtype=np.int64) * 86400 + ordinal.seconds
+        datetimes = seconds.astype("datetime64[s]")
+        if _is_series(value):
+            return pd.Series(datetimes, index=value.index, name=value.name)
+        return pd.Series(datetimes)
+    return _EPOCH + datetime.timedelta(days=ordinal.days, seconds=ordinal.seconds)
+
+
+def _to_ordinal(parsed) -> Tuple[Ordinal, Optional[np.ndarray]]:
+    """Convert the result of `_parse_value` into ordinals.
+
+    Returns:
+        (Tuple[Ordinal, Optional[np.ndarray]]): day ordinals and seconds of day, and a
+            boolean array of missing values (`NaT`), or `None` if there are none.
+    """
+    if isinstance(parsed, Ordinal):
+        return parsed, None
+    if _is_series(parsed):
+        values = parsed.to_numpy()
+        isnat = np.isnat(values)
+        seconds = np.where(isnat, 0, values.astype("datetime64[s]").view(np.int64))
+        days, seconds = np.divmod(seconds, 86400)
+        return Ordinal(days, seconds), isnat if isnat.any() else None
+    delta = parsed - _EPOCH
+    return Ordinal(delta.days, delta.seconds), None
+
+
+def _shift_datetime(
+    dt: pd.Series,
+    *,
+    years: int = 0,
+    months: int = 0,
+    days: int = 0,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: int = 0,
+) -> pd.Series:
+    """Shift a datetime series with the same semantics as `dateutil.relativedelta`.
+
+    The dates are shifted as day ordinals with integer arithmetic, keeping the time of
+    day, instead of applying `pandas.DateOffset`, which is not vectorized for years and
+    months. Missing values (`NaT`) are kept.
+    """
+    import pandas as pd
+
+    values = dt.to_numpy()
+    unit, _ = np.datetime_data(values.dtype)
+    per_day = int(
+        np.timedelta64(1, "D").astype(f"timedelta64[{unit}]").astype(np.int64)
+    )
+    isnat = np.isnat(values)
+    dates, time_of_day = np.divmod(values.view(np.int64), per_day)
+
+    ordinal = Ordinal(np.where(isnat, 0, dates), 0)
+    shifted = shift(ordinal, years=years, months=months, days=days).days
+    if np.any(np.abs(shifted) >= np.iinfo(np.int64).max // per_day):
+        raise OverflowError("date value out of range")
+
+    per_second = per_day // 86400
+    total_seconds = hours * 3600 + minutes * 60 + seconds
+    result = shifted * per_day + time_of_day + total_seconds * per_second
+    result[isnat] = np.iinfo(np.int64).min
+    return pd.Series(result.view(values.dtype), index=dt.index, name=dt.name)
+
+
+def _scalar_from_ordinal(ordinal: Ordinal, fmt: str, return_type: type):
+    fmtted: Union[int, str]
+    if issubclass(return_type, str):
+        fmtted = scalar_ordinal_to_text(ordinal, fmt)
+    else:
+        fmtted = scalar_from_ordinal(ordinal, fmt)
+    return return_type(fmtted)
+
+
+def _is_vector(value) -> bool:
+    return _is_series(value) or isinstance(value, np.ndarray)
+
+
+def _check_out_fmt(value, out_fmt: Optional[str]):
+    """Check that the result of an operation on `value` can be formatted with `out_fmt`.
+
+    Numeric values (integers/floats, and series/arrays of them) keep their type, so
+    their results can only be formatted with a numeric format (e.g. `%Y%m%d`).
+    Series of dtype `dateint` change their dtype to the new format.
+
+    Raises:
+        ValueError: if `value` is numeric and `out_fmt` is not a numeric format.
+    """
+    if out_fmt is None or is_numeric_format(out_fmt) or _is_dateint(value):
+        return
+    if isinstance(value, (list, tuple)):
+        value = np.asarray(value)
+    if is_arrow_array(value):
+        import pyarrow as pa
+
+        numeric = pa.types.is_integer(value.type) or pa.types.is_floating(value.type)
+    elif _is_vector(value):
+        numeric = value.dtype.kind in "iuf"
+    else:
+        numeric = isinstance(value, (int, float, np.integer, np.floating))
+    if numeric:
+        raise ValueError(
+            f'out_fmt "{out_fmt}" is not a numeric format, so it can not format the '
+            "results of numeric dates/datetimes, which keep their type. Convert them "
+            "to strings first to change their format."
+        )
+
+
+def _array_to_ordinal(values: np.ndarray, fmt: str) -> Optional[Ordinal]:
+    """Convert an array of integers or strings into ordinals without any `strptime`.
+
+    `None` is returned if the values can not be handled as integers or fixed-width
+    strings with format `fmt`.
+    """
+    if values.dtype.kind in "iu" and is_numeric_format(fmt):
+        return to_ordinal(values, fmt)
+    if values.dtype.kind in "US" and fixed_width(fmt) is not None:
+        return text_to_ordinal(values, fmt)
+    return None
+
+
+def _arrow_array(value: pd.Series):
+    """Return the Arrow array backing a series, or `None` if it is not Arrow-backed."""
+    if "pyarrow" not in sys.modules:
+        return None
+    import pandas as pd
+
+    dtype = value.dtype
+    if getattr(dtype, "storage", None) == "pyarrow" or isinstance(dtype, pd.ArrowDtype):
+        import pyarrow as pa
+
+        # the Arrow array of the series is returned without any copy
+        return pa.array(value.array)
+    return None
+
+
+def _placeholder(fmt: str) -> str:
+    """Return the value that missing values are parsed as: 1970-01-01 formatted."""
+    return _EPOCH.strftime(fmt)
+
+
+def _fill_missing(value, fmt: str) -> Optional[np.ndarray]:
+    """Return the values of a series/array as integers or strings, without NA.
+
+    Missing values are replaced with the placeholder value (see `_placeholder`), so
+    that every value is parsed with integer arithmetic, and the missing values of the
+    result are restored from `value` (see `_restore_missing`). `None` is returned if
+    the values can not be handled as numbers or fixed-width strings with format `fmt`.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        return None
+    missing = _missing(value)
+    kind = value.dtype.kind
+    if kind in "iuf":
+        if not is_numeric_format(fmt):
+            return None
+        if isinstance(value, np.ndarray):
+            values = value if missing is None else np.where(missing, 0, value)
+        else:
+            # nullable dtypes (e.g. `Int64`) are converted without any object array
+            numpy_dtype = getattr(value.dtype, "numpy_dtype", value.dtype)
+            values = value.to_numpy(dtype=numpy_dtype, na_value=0)
+        if missing is not None:
+            values[missing] = int(_placeholder(fmt))
+        return values
+    if isinstance(value, np.ndarray):
+        return value if kind in "US" else None
+    import pandas as pd
+
+    if pd.api.types.infer_dtype(value, skipna=True) != "string":
+        return None
+    values = value.to_numpy(dtype=object, na_value=_placeholder(fmt))
+    # one extra character, so that longer strings do not match the format
+    return values.astype(f"U{fixed.width + 1}")
+
+
+def _vector_to_ordinal(value, fmt: str) -> Optional[Ordinal]:
+    if not isinstance(value, np.ndarray) and fixed_width(fmt) is not None:
+        array = _arrow_array(value)
+        if array is not None:
+            # missing values are handled by the Arrow module, with a validity bitmap
+            return arrow_array_to_ordinal(array, fmt)
+    values = _fill_missing(value, fmt)
+    if values is None:
+        return None
+    if values.dtype.kind == "f":
+        if np.any(values % 1):
+            raise FloatFormatError(
+                "Float values with a non-zero decimal part are not accepted."
+            )
+        values = values.astype(np.int64)
+    return _array_to_ordinal(values, fmt)
+
+
+def _invalid(value, fmt: str) -> Optional[np.ndarray]:
+    """Return a boolean array of the values of a series/array that are not valid.
+
+    Values are checked with integer arithmetic (see `numeric.is_valid`) if they can
+    be handled as numbers or fixed-width strings, and with `pandas.to_datetime`
+    otherwise. Missing values are not invalid.
+
+    Returns:
+        (Optional[np.ndarray]): `True` for values that are not valid dates/datetimes
+            with format `fmt`, or `None` if every value is valid.
+    """
+    if _is_dateint(value):
+        return None
+    values = _fill_missing(value, fmt)
+    if values is None:
+        import pandas as pd
+
+        if isinstance(value, np.ndarray) and value.dtype.kind == "S":
+            value = np.char.decode(value)
+        series = pd.Series(value)
+        if series.dtype.kind == "f":
+            # floats are formatted without their decimal part
+            series = series.astype("Int64")
+        text = series.astype("string")
+        parsed = pd.to_datetime(text, format=fmt, errors="coerce")
+        invalid = parsed.isna().to_numpy() & ~series.isna().to_numpy()
+    elif values.dtype.kind == "f":
+        with np.errstate(invalid="ignore"):
+            # infinite values have no remainder, and are not valid either
+            fractional = ~np.isfinite(values) | (values % 1 != 0)
+        numbers = np.where(fractional, int(_placeholder(fmt)), values).astype(np.int64)
+        invalid = fractional | ~is_valid(numbers, fmt)
+    elif values.dtype.kind in "iu":
+        invalid = ~is_valid(values, fmt)
+    else:
+        invalid = ~is_valid_text(values, fmt)
+    return invalid if invalid.any() else None
+
+
+def _parse_value(value, fmt: Optional[str] = None):
+    """Convert a value into ordinals, or into date/datetime if that is not possible.
+
+    Args:
+        value: a series or array of formatted dates/datetimes, or a single one.
+        fmt (Optional[str]): format of the value. Detected from the value (or from the
+            first element of a series/array) if not specified.
+
+    Returns:
+        (Tuple[str, Union[Ordinal, datetime.datetime, pd.Series]]): format of the value
+            and its conversion.
+    """
+    if is_arrow_array(value):
+        fmt = fmt or _first_matching_format(value)
+        return fmt, arrow_array_to_ordinal(value, fmt)
+    if _is_dateint(value):
+        # already parsed: the format of the dtype is the format of the values
+        return value.dtype.fmt, value.array.to_ordinal()
+    if fmt is None:
+        fmt, ordinal = _detect_format(value)
+    elif not _is_vector(value):
+        ordinal = _scalar_to_ordinal(value, fmt)
+
+    if _is_vector(value):
+        ordinal = _vector_to_ordinal(value, fmt)
+        if isinstance(value, np.ndarray) and ordinal is None:
+            import pandas as pd
+
+            if value.dtype.kind == "S":
+                value = np.char.decode(value)
+            return fmt, _to_datetime(pd.Series(value), fmt)
+    if ordinal is not None:
+        return fmt, ordinal
+    return fmt, _to_datetime(value, fmt)
+
+
+def _like(values: np.ndarray, value, dtype=None):
+    """Wrap an array of results with the container of `value` (series or array)."""
+    if _is_series(value):
+        import pandas as pd
+
+        return pd.Series(values, index=value.index, name=value.name, dtype=dtype)
+    return values
+
+
+def _ordinal_to_array(ordinal: Ordinal, fmt: str, dtype) -> Optional[np.ndarray]:
+    """Convert ordinals into an array of `dtype` without any `strftime`.
+
+    `None` is returned if values of `dtype` can not be formatted with `fmt` by integer
+    arithmetic.
+    """
+    if fixed_width(fmt) is None:
+        return None
+    if dtype.kind in "iuf":
+        if not is_numeric_format(fmt):
+            return None
+        return from_ordinal(ordinal, fmt).astype(dtype, copy=False)
+    if dtype.kind in "US":
+        return ordinal_to_text(ordinal, fmt, dtype.kind)
+    import pandas as pd
+
+    if pd.api.types.is_string_dtype(dtype):
+        return ordinal_to_text(ordinal, fmt)
+    return None
+
+
+def _restore_missing(values: np.ndarray, value):
+    """Wrap formatted values like `value`, with the missing values of `value`.
+
+    Series of nullable dtypes (e.g. `Int64`) are built from the values and the mask
+    of missing values, without any object array.
+    """
+    missing = _missing(value)
+    if missing is None:
+        return _like(values, value, dtype=_get_return_type(value))
+    if values.dtype.kind == "f":
+        values[missing] = np.nan
+        return _like(values, value, dtype=_get_return_type(value))
+    import pandas as pd
+
+    if isinstance(value.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray)):
+        array = type(value.array)(values, missing)
+        return pd.Series(array, index=value.index, name=value.name)
+    values = values.astype(object)
+    values[missing] = getattr(value.dtype, "na_value", None)
+    return _like(values, value, dtype=value.dtype)
+
+
+def _ordinal_to_arrow(ordinal: Ordinal, fmt: str, value) -> Optional[pd.Series]:
+    """Convert ordinals into a series backed by an Arrow array of the type of `value`.
+
+    Missing values of `value` are kept. `None` is returned if `value` is not an
+    Arrow-backed series or `fmt` is not fixed-width.
+    """
+    if not _is_series(value) or fixed_width(fmt) is None:
+        return None
+    array = _arrow_array(value)
+    if array is None:
+        return None
+    result = arrow_ordinal_to_array(ordinal, fmt, array)
+    return _like(result, value, dtype=value.dtype)
+
+
+def _format_result(result, value, fmt: str):
+    """Convert the result of an operation back into the representation of `value`.
+
+    Args:
+        result (Union[Ordinal, datetime.date, datetime.datetime, pd.Series]): result
+            of the operation.
+        value: original value of the operation, whose type is preserved.
+        fmt (str): format of the result.
+    """
+    return_type = _get_return_type(value)
+    if isinstance(result, Ordinal):
+        if _is_vector(value):
+            series = _ordinal_to_arrow(result, fmt, value)
+            if series is not None:
+                return series
+            numpy_dtype = getattr(return_type, "numpy_dtype", return_type)
+            values = _ordinal_to_array(result, fmt, numpy_dtype)
+            if values is not None:
+                return _restore_missing(values, value)
+            result = _ordinal_to_datetime(result, value)
+        elif fixed_width(fmt) is None:
+            result = _ordinal_to_datetime(result, value)
+        else:
+            return _scalar_from_ordinal(result, fmt, return_type)
+    if isinstance(value, np.ndarray):
+        fmtted = result.dt.strftime(fmt).to_numpy()
+        # unicode/bytes arrays are resized to the width of the result
+        return fmtted.astype(
+            return_type.kind if return_type.kind in "US" else return_type
+        )
+    return _from_date(result, fmt, return_type)
+
+
+def _factorize(value: pd.Series, unique: Optional[bool]):
+    """Factorize a series if the operation should be computed only on its uniques.
+
+    Returns:
+        (Optional[Tuple[np.ndarray, pd.Series]]): codes and unique values, or `None`
+            if the operation should be computed on every element.
+    """
+    import pandas as pd
+
+    if unique is False or (unique is None and len(value) < get_unique_min_size()):
+        return None
+    codes, uniques = value.factorize()
+    if len(uniques) == 0:
+        return None
+    if unique is None and len(uniques) > get_unique_ratio_threshold() * len(value):
+        return None
+    return codes, pd.Series(uniques, dtype=value.dtype)
+
+
+def _series_to_array(value: pd.Series, fmt: str) -> Optional[np.ndarray]:
+    """Return the values of a series as an array of integers or fixed-width strings.
+
+    Arrow strings are viewed as a bytes (`S`) array without any copy. `None` is
+    returned if the series can not be handled as such an array (e.g. missing values).
+    """
+    import pandas as pd
+
+    if value.dtype.kind in "iu":
+        return value.to_numpy()
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        return None
+    array = _arrow_array(value)
+    if array is not None:
+        codes = arrow_to_codes(array, fmt)
+        if codes is None:
+            return None
+        return codes.view(f"S{codes.shape[1]}").reshape(-1)
+    if value.hasnans or pd.api.types.infer_dtype(value, skipna=False) != "string":
+        return None
+    # one extra character, so that longer strings do not match the format
+    return value.to_numpy().astype(f"U{fixed.width + 1}")
+
+
+def _map_series(
+    function, value: pd.Series, fmt: str, n_jobs: int, dtype=None
+) -> Optional[pd.Series]:
+    """Apply a function to blocks of the values of a series in a process pool.
+
+    Args:
+        function: picklable function of an array of integers/strings into an array.
+        value (pd.Series): series of formatted dates/datetimes.
+        fmt (str): format of the series.
+        n_jobs (int): number of workers (see `dateint.parallel.get_workers`).
+        dtype (optional): dtype of the resulting series. Defaults to the dtype of
+            `value`.
+
+    Returns:
+        (Optional[pd.Series]): result of `function`, with the index and name of
+            `value`, or `None` if the series can not be split into an array (see
+            `_series_to_array`).
+    """
+    # the process pool (multiprocessing, shared memory) is imported only when used
+    from .parallel import map_blocks
+
+    values = _series_to_array(value, fmt)
+    if values is None:
+        return None
+    result = map_blocks(function, values, n_jobs)
+    if result.dtype.kind == "S":
+        # results of Arrow strings are written back into an Arrow buffer
+        chars = result.view(np.uint8).reshape(len(result), result.dtype.itemsize)
+        result = arrow_from_codes(chars, _arrow_array(value).type)
+    return _like(result, value, dtype=value.dtype if dtype is None else dtype)
+
+
+def _apply_conversion(values: np.ndarray, f, args, fmt, out_fmt, kwargs):
+    # module-level function, so that it can be pickled for the process pool
+    return conversion(f)(values, *args, fmt=fmt, out_fmt=out_fmt, **kwargs)
+
+
+def _apply_dateint(f, value: pd.Series, args, out_fmt: Optional[str], kwargs):
+    """Apply an operation to the ordinals of a series of dtype `dateint`.
+
+    The result is a series of dtype `dateint` with format `out_fmt` (the format of
+    `value` by default), without any parsing or formatting.
+    """
+    import pandas as pd
+
+    from .extension import DateintArray, DateintDtype
+
+    array = value.array
+    dtype = array.dtype if out_fmt is None else DateintDtype(out_fmt)
+    result = f(array.to_ordinal(), *args, **kwargs)
+    result = DateintArray.from_ordinal(result, dtype, array.isna())
+    return pd.Series(result, index=value.index, name=value.name)
+
+
+def _apply_into(operation, value, out, fmt: Optional[str], errors: str = "raise"):
+    """Apply an operation to blocks of a series/array, writing the results into `out`.
+
+    Each block of `config.BLOCK_SIZE` rows is parsed, operated and formatted on its
+    own, and its result is written into `out`, so that no temporary array of the size
+    of `value` is allocated.
+
+    Args:
+        operation: function of a block of `value` and its format.
+        value: a series or array of formatted dates/datetimes.
+        out: array or series with the length of `value`, into which the results are
+            written (it may be `value` itself).
+        fmt (Optional[str]): format of the value.
+        errors (str, optional): how invalid values are handled (see `_with_errors`).
+            Defaults to `"raise"`.
+
+    Returns:
+        (Union[np.ndarray, pd.Series]): `out`.
+    """
+    _check_out(value, out, errors)
+    fmt = fmt or _first_matching_format(value)
+    size = get_block_size()
+    for start in range(0, len(value), size):
+        stop = min(start + size, len(value))
+        if _is_series(value):
+            result = operation(value.iloc[start:stop], fmt)
+        else:
+            result = operation(value[start:stop], fmt)
+        _write(out, start, stop, result)
+    return out
+
+
+def _check_out(value, out, errors: str = "raise"):
+    if not _is_vector(value) or not _is_vector(out):
+        raise TypeError(
+            "Results can only be written into a numpy array or pandas series, from a "
+            "numpy array or pandas series."
+        )
+    if len(out) != len(value):
+        raise ValueError(
+            f"Length of out ({len(out)}) does not match length of value ({len(value)})."
+        )
+    if (
+        errors == "coerce"
+        and isinstance(out.dtype, np.dtype)
+        and out.dtype.kind not in "fO"
+    ):
+        raise TypeError(
+            f"Out of dtype {out.dtype} can not hold the missing values of "
+            'errors="coerce", expected a nullable (e.g. "Int64"), float or object '
+            "dtype."
+        )
+
+
+def _check_result(out, result):
+    """Check that a block of results can be written into `out` without any loss.
+
+    Raises:
+        TypeError: if the results can not be cast to the dtype of `out` (e.g. missing
+            values or floats into integers).
+        ValueError: if the results do not fit into the dtype of `out` (integers out of
+            its range, or strings longer than its width).
+    """
+    dtype = out.dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind == "O":
+        # extension dtypes of pandas (e.g. `Int64`) check the values set into them
+        return
+    missing = _missing(result)
+    values = result.to_numpy() if _is_series(result) else np.asarray(result)
+    if values.dtype.kind == "O":
+        # strings of object/`string` series, or results of arrays with `None`
+        if missing is None:
+            none = np.equal(values, None)
+            missing = none if none.any() else None
+        present = values if missing is None else values[~missing]
+        values = np.asarray(present.tolist())
+    if (missing is not None and dtype.kind != "f") or not np.can_cast(
+        values.dtype, dtype, "same_kind"
+    ):
+        raise TypeError(
+            f"Results of dtype {result.dtype}"
+            f"{' with missing values' if missing is not None else ''} can not be "
+            f"written into out of dtype {dtype}."
+        )
+    if len(values) == 0:
+        return
+    if dtype.kind in "iu" and values.dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        if values.min() < info.min or values.max() > info.max:
+            raise ValueError(
+                f"Results from {values.min()} to {values.max()} do not fit into out "
+                f"of dtype {dtype}."
+            )
+    elif dtype.kind in "US":
+        width = int(np.char.str_len(values).max())
+        if width > dtype.itemsize // (4 if dtype.kind == "U" else 1):
+            raise ValueError(
+                f"Results of {width} characters do not fit into out of dtype {dtype}."
+            )
+
+
+def _write(out, start: int, stop: int, result):
+    """Write a series/array of results into rows `start:stop` of `out`.
+
+    The results are checked before being written (see `_check_result`), so that
+    they are never truncated or wrapped around by an unsafe cast.
+    """
+    _check_result(out, result)
+    if _is_series(out):
+        # the values are set by position, without aligning the indexes
+        out.iloc[start:stop] = result.array if _is_series(result) else result
+    else:
+        out[start:stop] = result.to_numpy() if _is_series(result) else result
+
+
+# Modes of handling invalid values (see `_with_errors`).
+ERRORS = ("raise", "coerce", "ignore")
+
+
+def _replace_invalid(value, invalid: np.ndarray, fmt: str):
+    """Replace the invalid values of a series/array with the placeholder value."""
+    text = _placeholder(fmt)
+    placeholder: Union[int, str, bytes] = text
+    if value.dtype.kind in "iuf" and is_numeric_format(fmt):
+        placeholder = int(text)
+    elif value.dtype.kind == "S":
+        placeholder = text.encode()
+    if isinstance(value, np.ndarray):
+        return np.where(invalid, placeholder, value)
+    return value.where(~invalid, placeholder)
+
+
+def _restore_invalid(result, value, invalid: np.ndarray, errors: str):
+    """Replace the results of invalid values with missing values or the values."""
+    if errors == "ignore":
+        if isinstance(value, np.ndarray):
+            return np.where(invalid, value, result)
+        return result.where(~invalid, value)
+    if isinstance(result, np.ndarray):
+        if result.dtype.kind == "f":
+            return np.where(invalid, np.nan, result)
+        # missing values of other arrays are `None`, as in lists
+        result = result.astype(object)
+        result[invalid] = None
+        return result
+    return result.mask(invalid)
+
+
+def _overflow(apply, length: int) -> np.ndarray:
+    """Return a boolean array of the values whose results are out of range.
+
+    `apply(start, stop)` computes the operation on the values `start:stop`, raising
+    an `OverflowError` if any result is out of the range of years (it raised on every
+    value). The values are split in halves until the values that overflow are
+    isolated, so that only the slices around them are computed again.
+    """
+    overflow = np.zeros(length, dtype=bool)
+    pending = [(0, length)]
+    while pending:
+        start, stop = pending.pop()
+        if stop - start == 1:
+            overflow[start] = True
+            continue
+        middle = (start + stop) // 2
+        for half in ((start, middle), (middle, stop)):
+            try:
+                apply(*half)
+            except OverflowError:
+                pending.append(half)
+    return overflow
+
+
+def _arrow_with_errors(
+    operation, value, backend: Backend, fmt: Optional[str], errors: str
+):
+    """Apply an operation to an array of a backend, as `_with_errors` does.
+
+    Invalid values are replaced with nulls (`errors="coerce"`) or kept, using the
+    validity bitmap of Arrow arrays.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = backend.to_arrow(value)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    values = array.to_pandas()
+    fmt = fmt or _first_parsable_format(values)
+    invalid = _invalid(values, fmt)
+
+    placeholder: Union[int, str] = _placeholder(fmt)
+    if pa.types.is_integer(array.type) or pa.types.is_floating(array.type):
+        placeholder = int(placeholder)
+
+    def clean(invalid: Optional[np.ndarray]):
+        if invalid is None:
+            return array
+        return pc.if_else(pa.array(invalid), pa.scalar(placeholder, array.type), array)
+
+    cleaned = clean(invalid)
+    try:
+        result = operation(backend.from_arrow(cleaned, value), fmt)
+    except OverflowError:
+        # values whose results are out of range are invalid too
+        def apply(start: int, stop: int):
+            operation(
+                backend.from_arrow(cleaned.slice(start, stop - start), value), fmt
+            )
+
+        overflow = _overflow(apply, len(array))
+        invalid = overflow if invalid is None else invalid | overflow
+        result = operation(backend.from_arrow(clean(invalid), value), fmt)
+    if invalid is None:
+        return result
+    result = backend.to_arrow(result)
+    if isinstance(result, pa.ChunkedArray):
+        result = result.combine_chunks()
+    fill = pa.nulls(len(array), result.type) if errors == "coerce" else array
+    return backend.from_arrow(pc.if_else(pa.array(invalid), fill, result), value)
+
+
+def _with_errors(operation, value, fmt: Optional[str], errors: str):
+    """Apply an operation to a value with invalid dates/datetimes.
+
+    The values are validated with integer arithmetic (see `_invalid`), invalid values
+    are replaced with the placeholder value before the operation, and their results
+    are replaced with missing values (`errors="coerce"`) or with the invalid values
+    themselves (`errors="ignore"`). Values whose results are out of the range of
+    years are handled as invalid values. The format is detected from the first value
+    that parses (see `_first_parsable_format`).
+
+    Args:
+        operation: function of a value and its format.
+        value: a series or array of formatted dates/datetimes, or a single one.
+        fmt (Optional[str]): format of the value.
+        errors (str): `"raise"`, `"coerce"` or `"ignore"`.
+    """
+    if errors not in ERRORS:
+        raise ValueError(f'Invalid errors "{errors}", expected one of {ERRORS}.')
+    if errors == "raise":
+        return operation(value, fmt)
+    backend = get_backend(value)
+    if backend is not None:
+        return _arrow_with_errors(operation, value, backend, fmt, errors)
+    if not _is_vector(value):
+        try:
+            fmt = fmt or _first_matching_format(value)
+            invalid = _invalid(np.asarray([value]), fmt)
+            if invalid is None:
+                return operation(value, fmt)
+        except (FormatError, FloatFormatError, OverflowError):
+            pass
+        return None if errors == "coerce" else value
+
+    fmt = fmt or _first_parsable_format(value)
+    invalid = _invalid(value, fmt)
+    cleaned = value if invalid is None else _replace_invalid(value, invalid, fmt)
+    try:
+        result = operation(cleaned, fmt)
+    except OverflowError:
+        # values whose results are out of range are invalid too
+        def apply(start: int, stop: int):
+            if _is_series(cleaned):
+                operation(cleaned.iloc[start:stop], fmt)
+            else:
+                operation(cleaned[start:stop], fmt)
+
+        overflow = _overflow(apply, len(value))
+        invalid = overflow if invalid is None else invalid | overflow
+        result = operation(_replace_invalid(value, invalid, fmt), fmt)
+    if invalid is None:
+        return result
+    return _restore_invalid(result, value, invalid, errors)
+
+
+@lru_cache(maxsize=None)
 def conversion(f):
-    """Decorator that wraps the date/datetime operation."""
+    """Decorator that wraps the date/datetime operation.
+
+    Series and arrays of integers with a numeric format (e.g. `%Y%m%d`) or of strings
+    with a fixed-width format, and single values with a fixed-width format, are
+    handled as day ordinals with pure integer arithmetic, without any string parsing
+    or formatting. Any other value is converted to date/datetime before the
+    operation. Lists and tuples are handled as arrays, and the result is converted
+    back into a list/tuple. Array types with a backend (see `dateint.backend`), such
+    as Arrow arrays and Polars series, are handled as Arrow arrays, without any
+    conversion through pandas, and the result is converted back into the same type.
+
+    The wrapped function accepts five extra keyword arguments: `fmt`, the format of
+    the input (which skips format detection), `out_fmt`, the format of the result
+    (which defaults to the format of the input), `unique`, whether to compute the
+    operation only on the unique values of a series, scattering the results back
+    (by default, only when the series has a high enough ratio of duplicates),
+    `n_jobs`, the number of processes that compute the operation on blocks of a
+    series (see `dateint.parallel`), `errors`, whether invalid values raise an error
+    (`"raise"`, the default), result in missing values (`"coerce"`) or are kept
+    unchanged (`"ignore"`), and `out`, an array or series into which the result is
+    written block by block (see `_apply_into`), which is returned.
+    """
 
     @wraps(f)
-    def wrapper(value, *args, **kwargs):
-        fmt = _first_matching_format(value)
-        dt_obj = _to_datetime(value, fmt)
-        dt_result = f(dt_obj, *args, **kwargs)
-        return_type = _get_return_type(value)
-        return _from_date(dt_result, fmt, return_type)
+    def wrapper(
+        value,
+        *args,
+        fmt: Optional[str] = None,
+        out_fmt: Optional[str] = None,
+        unique: Optional[bool] = None,
+        n_jobs: Optional[int] = None,
+        errors: str = "raise",
+        out=None,
+        **kwargs,
+    ):
+        _check_out_fmt(value, out_fmt)
+        if out is not None:
+            if n_jobs is not None and n_jobs != 1:
+                # the process pool writes a single result of the size of `value`
+                _check_out(value, out, errors)
+                result = wrapper(
+                    value,
+                    *args,
+                    fmt=fmt,
+                    out_fmt=out_fmt,
+                    unique=unique,
+                    n_jobs=n_jobs,
+                    errors=errors,
+                    **kwargs,
+                )
+                _write(out, 0, len(out), result)
+                return out
+
+            def write(value, fmt: Optional[str]):
+                return wrapper(
+                    value,
+                    *args,
+                    fmt=fmt,
+                    out_fmt=out_fmt,
+                    unique=unique,
+                    errors=errors,
+                    **kwargs,
+                )
+
+            return _apply_into(write, value, out, fmt, errors)
+        if errors != "raise" and not isinstance(value, (list, tuple)):
+
+            def operation(value, fmt: Optional[str]):
+                return wrapper(
+                    value,
+                    *args,
+                    fmt=fmt,
+                    out_fmt=out_fmt,
+                    unique=unique,
+                    n_jobs=n_jobs,
+                    **kwargs,
+                )
+
+            return _with_errors(operation, value, fmt, errors)
+        backend = get_backend(value)
+        if backend is not None:
+            array = backend.to_arrow(value)
+            _check_out_fmt(array, out_fmt)
+            fmt, parsed = _parse_value(array, fmt)
+            result = f(parsed, *args, **kwargs)
+            result = arrow_ordinal_to_array(result, out_fmt or fmt, array)
+            return backend.from_arrow(result, value)
+        if isinstance(value, (list, tuple)):
+            result = wrapper(
+                np.asarray(value),
+                *args,
+                fmt=fmt,
+                out_fmt=out_fmt,
+                errors=errors,
+                **kwargs,
+            )
+            return type(value)(result.tolist())
+        if _is_dateint(value):
+            return _apply_dateint(f, value, args, out_fmt, kwargs)
+        if _is_series(value):
+            import pandas as pd
+
+            factorized = _factorize(value, unique)
+            if factorized is not None:
+                codes, uniques = factorized
+                result = wrapper(
+                    uniques,
+                    *args,
+                    fmt=fmt,
+                    out_fmt=out_fmt,
+                    unique=False,
+                    n_jobs=n_jobs,
+                    **kwargs,
+                )
+                return pd.Series(
+                    result.array.take(codes, allow_fill=True),
+                    index=value.index,
+                    name=value.name,
+                )
+            if n_jobs is not None and n_jobs != 1:
+                fmt = fmt or _first_matching_format(value)
+                function = partial(
+                    _apply_conversion,
+                    f=f,
+                    args=args,
+                    fmt=fmt,
+                    out_fmt=out_fmt,
+                    kwargs=kwargs,
+                )
+                result = _map_series(function, value, fmt, n_jobs)
+                if result is not None:
+                    return result
+
+        fmt, parsed = _parse_value(value, fmt)
+        result = f(parsed, *args, **kwargs)
+        return _format_result(result, value, out_fmt or fmt)
 
     return wrapper
@@ -1,79 +1,430 @@
 """Core module of dateint."""
 
+from __future__ import annotations
+
 import datetime
-from typing import Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Optional, Union
 
-import pandas as pd
-from dateutil.relativedelta import relativedelta
+import numpy as np
 
+from . import business, frame
+from .arrow import values_to_array
+from .backend import get_backend
 from .config import get_date_format
-from .convert import _from_date, _to_datetime, conversion
+from .convert import (
+    _apply_into,
+    _check_out,
+    _check_out_fmt,
+    _first_matching_format,
+    _first_parsable_format,
+    _format_result,
+    _from_date,
+    _invalid,
+    _is_dateint,
+    _is_series,
+    _missing,
+    _map_series,
+    _parse_value,
+    _shift_datetime,
+    _to_ordinal,
+    _with_errors,
+    _write,
+    conversion,
+)
+from .exception import FloatFormatError, FormatError
+from .numeric import (
+    DIFFERENCE_UNITS,
+    Ordinal,
+    day_of_week,
+    difference,
+    end_of_period,
+    iter_sequence,
+    sequence,
+    shift,
+    start_of_period,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 
+def today(fmt: Optional[str] = None) -> int:
+    """
+    Return current date as an integer, formatted as %Y%m%d by default.
+
+    Args:
+        fmt (Optional[str], optional): numeric format of the result. Defaults to the
+            configured date format (%Y%m%d).
 
-def today() -> int:
+    Returns:
+        (int): Current date as an integer.
     """
-    Return current date as an integer, formatted as %Y%m%d.
+    fmt = fmt or get_date_format()
+    return _from_date(datetime.date.today(), fmt, int)  # type:ignore
+
+
+def validate(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    fmt: Optional[str] = None,
+) -> Union[pd.Series, np.ndarray, list, tuple, bool]:
+    """Return whether formatted dates/datetimes are valid.
+
+    Integers and fixed-width strings are checked with integer arithmetic (digits,
+    literal characters, ranges of the fields and days of the month), without parsing
+    any value with `strptime`. Missing values are not valid.
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array that matches a format
+            candidate, skipping invalid ones) if not specified.
+
+    Examples:
+        ```py
+        import dateint as di
+        import pandas as pd
+
+        di.validate(pd.Series([20220131, 20220231, None]))
+        '''
+        0     True
+        1    False
+        2    False
+        dtype: bool
+        '''
+        ```
 
     Returns:
-        (int): Current date as an integer, formatted as %Y%m%d.
+        (Union[pd.Series, np.ndarray, list, tuple, bool]): whether each value is a
+            valid date/datetime with format `fmt`, in a series, array, list or tuple
+            (a boolean array for Arrow arrays and Polars series), or a single boolean.
     """
-    return _from_date(datetime.date.today(), get_date_format(), int)  # type:ignore
+    if isinstance(date, (list, tuple)):
+        return type(date)(_valid(np.asarray(date), fmt).tolist())
+    backend = get_backend(date)
+    if backend is not None:
+        import pyarrow as pa
+
+        array = backend.to_arrow(date)
+        return backend.from_arrow(pa.array(_valid(array.to_pandas(), fmt)), date)
+    if not _is_series(date) and not isinstance(date, np.ndarray):
+        try:
+            fmt = fmt or _first_matching_format(date)
+        except (FormatError, FloatFormatError):
+            return False
+        return bool(_valid(np.asarray([date]), fmt)[0])
+
+    valid = _valid(date, fmt)
+    if _is_series(date):
+        import pandas as pd
+
+        return pd.Series(valid, index=date.index, name=date.name)
+    return valid
+
 
+def _valid(date: Union[pd.Series, np.ndarray], fmt: Optional[str]) -> np.ndarray:
+    if _is_dateint(date):
+        return ~date.isna().to_numpy()
+    fmt = fmt or _first_parsable_format(date)
+    valid = np.ones(len(date), dtype=bool)
+    for mask in (_missing(date), _invalid(date, fmt)):
+        if mask is not None:
+            valid &= ~mask
+    return valid
 
-def weekday(date: Union[str, float, int]) -> Union[pd.Series, int]:
+
+def weekday(
+    date: Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    fmt: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    errors: str = "raise",
+    columns: Optional[List] = None,
+    out: Optional[Union[np.ndarray, pd.Series]] = None,
+    inplace: bool = False,
+) -> Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, None]:
     """
     Return day of week as returned by datetime.datetime.weekday() method.
 
-    Return the day of week as an integer, where Monday is 0 and Sunday is 6.
+    Return the day of week as an integer, where Monday is 0 and Sunday is 6. Series
+    and arrays of integers or fixed-width strings are handled with integer arithmetic,
+    resulting in `int8` series/arrays.
 
     Args:
-        date (Union[pd.Series, int, str, float]): a series of formatted dates/datetimes,
-            or a single formatted date/datetime.
+        date (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str,
+            float]): a data frame with columns of formatted dates/datetimes, a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+        errors (str, optional): how invalid dates/datetimes of a series/array are
+            handled: `"raise"` raises a `FormatError` and `"coerce"` results in
+            missing values (see `dateint.validate`). Defaults to `"raise"`.
+        columns (Optional[List], optional): names of the columns of a data frame to
+            operate, whose formats are detected once per column. Integer columns with
+            the same format and arguments are operated as a single block. Defaults to
+            every column.
+        out (Optional[Union[np.ndarray, pd.Series]], optional): array or series with
+            the length of `date` and the dtype of the result (not for data frames,
+            see `inplace`), into which the result is written block by block (see
+            `config.BLOCK_SIZE`), without allocating any temporary of the size of
+            `date`. Results that do not fit into its dtype (e.g. narrower strings or
+            integers, or missing values of `errors="coerce"` into integers) raise a
+            `TypeError`/`ValueError` before being written. Defaults to `None`.
+        inplace (bool, optional): whether to replace the columns of a data frame, or
+            the values of a series/array (as `out=date`), instead of returning a new
+            one. Defaults to False.
 
     Returns:
-        (Union[pandas.Series, int]): day of week (from 0 to 6)
+        (Union[pandas.DataFrame, pandas.Series, numpy.ndarray, list, tuple, int]): day
+            of week (from 0 to 6), in the operated columns of a data frame (`out` if
+            specified, `None` if `inplace`)
     """
-    dt_obj = _to_datetime(date, get_date_format())
-    if isinstance(dt_obj, pd.Series):
-        return dt_obj.dt.weekday
-    return dt_obj.weekday()
+    if frame.is_frame(date):
+        return frame.apply(
+            weekday,
+            date,
+            columns,
+            fmt=fmt,
+            inplace=inplace,
+            out=out,
+            n_jobs=n_jobs,
+            errors=errors,
+        )
+    if inplace or out is not None:
+        result = _weekday_into(date, fmt, 0, n_jobs, errors, date if inplace else out)
+        return None if inplace else result
+    if isinstance(date, (list, tuple)):
+        result = _weekday(np.asarray(date), fmt, 0, errors=errors)
+        return type(date)(np.asarray(result).tolist())
+    return _weekday(date, fmt, 0, n_jobs, errors)
+
+
+def _weekday_into(
+    date: Union[pd.Series, np.ndarray],
+    fmt: Optional[str],
+    first: int,
+    n_jobs: Optional[int],
+    errors: str,
+    out: Union[pd.Series, np.ndarray],
+) -> Union[pd.Series, np.ndarray]:
+    if n_jobs is not None and n_jobs != 1:
+        # the process pool writes a single result of the size of `date`
+        _check_out(date, out, errors)
+        _write(out, 0, len(out), _weekday(date, fmt, first, n_jobs, errors))
+        return out
+    function = partial(_weekday, first=first, errors=errors)
+    return _apply_into(function, date, out, fmt, errors)
+
+
+def _weekday(
+    date: Union[pd.Series, np.ndarray, int, str, float],
+    fmt: Optional[str],
+    first: int = 0,
+    n_jobs: Optional[int] = None,
+    errors: str = "raise",
+) -> Union[pd.Series, np.ndarray, int]:
+    # `first` is the number of Monday: 0 for `weekday` and 1 for `isoweekday`
+    if errors != "raise":
+        if errors == "ignore":
+            raise ValueError('Invalid errors "ignore" for the day of week.')
+        function = partial(_weekday, first=first, n_jobs=n_jobs)
+        return _with_errors(function, date, fmt, errors)
+    if n_jobs is not None and n_jobs != 1 and _is_series(date):
+        fmt = fmt or _first_matching_format(date)
+        function = partial(_weekday, fmt=fmt, first=first)
+        result = _map_series(function, date, fmt, n_jobs, dtype=np.int8)
+        if result is not None:
+            return result
+
+    backend = get_backend(date)
+    if backend is not None:
+        array = backend.to_arrow(date)
+        _, ordinal = _parse_value(array, fmt)
+        result = (day_of_week(ordinal.days) + first).astype(np.int8)
+        return backend.from_arrow(values_to_array(result, array), date)
+
+    _, parsed = _parse_value(date, fmt)
+    if isinstance(parsed, Ordinal):
+        result = day_of_week(parsed.days) + first
+        # missing values were parsed as placeholders
+        missing = _missing(date)
+        if _is_series(date):
+            import pandas as pd
+
+            if missing is not None and _is_dateint(date):
+                # missing values of the nullable dtype stay missing integers
+                array = pd.arrays.IntegerArray(result.astype(np.int64), missing)
+                return pd.Series(array, index=date.index, name=date.name)
+            result = pd.Series(result, index=date.index, name=date.name, dtype=np.int8)
+            return result if missing is None else result.mask(missing)
+        if isinstance(date, np.ndarray):
+            if missing is not None:
+                return np.where(missing, np.nan, result)
+            return result.astype(np.int8)
+        return result
+    if _is_series(parsed):
+        result = parsed.dt.weekday + first
+        if not result.hasnans:
+            result = result.astype(np.int8)
+        if isinstance(date, np.ndarray):
+            return result.to_numpy()
+        return result
+    return parsed.weekday() + first
 
 
-def isoweekday(date: Union[str, float, int]) -> Union[pd.Series, int]:
+def isoweekday(
+    date: Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    fmt: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    errors: str = "raise",
+    columns: Optional[List] = None,
+    out: Optional[Union[np.ndarray, pd.Series]] = None,
+    inplace: bool = False,
+) -> Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, None]:
     """
     Return day of week as returned by datetime.datetime.isoweekday() method.
 
-    Return the day of week as an integer, where Monday is 1 and Sunday is 7.
+    Return the day of week as an integer, where Monday is 1 and Sunday is 7. Series
+    and arrays of integers or fixed-width strings are handled with integer arithmetic,
+    resulting in `int8` series/arrays.
 
     Args:
-        date (Union[pd.Series, int, str, float]): a series of formatted dates/datetimes,
-            or a single formatted date/datetime.
+        date (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str,
+            float]): a data frame with columns of formatted dates/datetimes, a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+        errors (str, optional): how invalid dates/datetimes of a series/array are
+            handled: `"raise"` raises a `FormatError` and `"coerce"` results in
+            missing values (see `dateint.validate`). Defaults to `"raise"`.
+        columns (Optional[List], optional): names of the columns of a data frame to
+            operate, whose formats are detected once per column. Integer columns with
+            the same format and arguments are operated as a single block. Defaults to
+            every column.
+        out (Optional[Union[np.ndarray, pd.Series]], optional): array or series with
+            the length of `date` and the dtype of the result (not for data frames,
+            see `inplace`), into which the result is written block by block (see
+            `config.BLOCK_SIZE`), without allocating any temporary of the size of
+            `date`. Results that do not fit into its dtype (e.g. narrower strings or
+            integers, or missing values of `errors="coerce"` into integers) raise a
+            `TypeError`/`ValueError` before being written. Defaults to `None`.
+        inplace (bool, optional): whether to replace the columns of a data frame, or
+            the values of a series/array (as `out=date`), instead of returning a new
+            one. Defaults to False.
 
     Returns:
-        (Union[pandas.Series, int]): day of week (from 1 to 7)
+        (Union[pandas.DataFrame, pandas.Series, numpy.ndarray, list, tuple, int]): day
+            of week (from 1 to 7), in the operated columns of a data frame (`out` if
+            specified, `None` if `inplace`)
     """
-    dt_obj = _to_datetime(date, get_date_format())
-
-    if isinstance(dt_obj, pd.Series):
-        return dt_obj.apply(datetime.date.isoweekday)
-    return dt_obj.isoweekday()
+    if frame.is_frame(date):
+        return frame.apply(
+            isoweekday,
+            date,
+            columns,
+            fmt=fmt,
+            inplace=inplace,
+            out=out,
+            n_jobs=n_jobs,
+            errors=errors,
+        )
+    if inplace or out is not None:
+        result = _weekday_into(date, fmt, 1, n_jobs, errors, date if inplace else out)
+        return None if inplace else result
+    if isinstance(date, (list, tuple)):
+        result = _weekday(np.asarray(date), fmt, 1, errors=errors)
+        return type(date)(np.asarray(result).tolist())
+    return _weekday(date, fmt, 1, n_jobs, errors)
 
 
 def add(
-    date: Union[pd.Series, int, str, float],
+    date: Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float],
     *,
-    years: int = 0,
-    months: int = 0,
-    days: int = 0,
+    years: Union[int, Mapping[Any, int]] = 0,
+    months: Union[int, Mapping[Any, int]] = 0,
+    days: Union[int, Mapping[Any, int]] = 0,
+    hours: Union[int, Mapping[Any, int]] = 0,
+    minutes: Union[int, Mapping[Any, int]] = 0,
+    seconds: Union[int, Mapping[Any, int]] = 0,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    unique: Optional[bool] = None,
+    n_jobs: Optional[int] = None,
+    errors: str = "raise",
+    columns: Optional[List] = None,
+    out: Optional[Union[np.ndarray, pd.Series]] = None,
+    inplace: bool = False,
 ):
     """Add some time interval to a formatted date/datetime.
 
     Args:
-        date (Union[pd.Series, int, str, float]): a series of
-            formatted dates/datetimes, or a single formatted date/datetime.
-        years (int, optional): number of years to add. Defaults to 0.
-        months (int, optional): number of months to add. Defaults to 0.
-        days (int, optional): number of days to add. Defaults to 0.
+        date (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str,
+            float]): a data frame with columns of formatted dates/datetimes, a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        years (Union[int, Mapping[Any, int]], optional): number of years to add, or
+            a mapping from the columns of a data frame to their number of years.
+            Defaults to 0.
+        months (Union[int, Mapping[Any, int]], optional): number of months to add, or
+            a mapping from the columns of a data frame to their number of months.
+            Defaults to 0.
+        days (Union[int, Mapping[Any, int]], optional): number of days to add, or
+            a mapping from the columns of a data frame to their number of days.
+            Defaults to 0.
+        hours (Union[int, Mapping[Any, int]], optional): number of hours to add,
+            or a mapping from the columns of a data frame to their number of hours.
+            Defaults to 0.
+        minutes (Union[int, Mapping[Any, int]], optional): number of minutes to add,
+            or a mapping from the columns of a data frame to their number of minutes.
+            Defaults to 0.
+        seconds (Union[int, Mapping[Any, int]], optional): number of seconds to add,
+            or a mapping from the columns of a data frame to their number of seconds.
+            Defaults to 0.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `date` is numeric. Defaults to the format of
+            `date`.
+        unique (Optional[bool], optional): whether to compute the operation only on
+            the unique values of a series, which is faster for series with many
+            duplicates. Defaults to `None`, which does so only if the ratio of unique
+            values is below `config.UNIQUE_RATIO_THRESHOLD`.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+        errors (str, optional): how invalid dates/datetimes are handled: `"raise"`
+            raises a `FormatError`, `"coerce"` results in missing values and
+            `"ignore"` keeps them unchanged (see `dateint.validate`), as well as
+            results out of the range of years. Defaults to `"raise"`.
+        columns (Optional[List], optional): names of the columns of a data frame to
+            operate, whose formats are detected once per column. Integer columns with
+            the same format and arguments are operated as a single block. Defaults to
+            every column.
+        out (Optional[Union[np.ndarray, pd.Series]], optional): array or series with
+            the length of `date` and the dtype of the result (not for data frames,
+            see `inplace`), into which the result is written block by block (see
+            `config.BLOCK_SIZE`), without allocating any temporary of the size of
+            `date`. Results that do not fit into its dtype (e.g. narrower strings or
+            integers, or missing values of `errors="coerce"` into integers) raise a
+            `TypeError`/`ValueError` before being written. Defaults to `None`.
+        inplace (bool, optional): whether to replace the columns of a data frame, or
+            the values of a series/array (as `out=date`), instead of returning a new
+            one. Defaults to False.
 
     Examples:
         ```py
@@ -83,6 +434,9 @@ def add(
         di.add(20220510, days=15)
         # 20220525
 
+        di.add(20220510233000, hours=1, minutes=15)
+        # 20220511004500
+
         dates = pd.Series([202201, 202202, 202203])
         di.add(dates, months=2)
         '''
@@ -94,40 +448,165 @@ def add(
         ```
 
     Returns:
-        (Union[pd.Series, int, str, float]): a series of formatted dates/datetimes, or a
-            single formatted date/datetime.
+        (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float]): a
+            data frame with the operated columns, a series, array, list or tuple of
+            formatted dates/datetimes, or a single formatted date/datetime, of the
+            same type as `date` (`out` if specified, `None` if `inplace`).
     """
-    return conversion(_add)(date, years=years, months=months, days=days)
+    if frame.is_frame(date):
+        return frame.apply(
+            add,
+            date,
+            columns,
+            fmt=fmt,
+            inplace=inplace,
+            out=out,
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            out_fmt=out_fmt,
+            unique=unique,
+            n_jobs=n_jobs,
+            errors=errors,
+        )
+    result = conversion(_add)(
+        date,
+        years=years,
+        months=months,
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        fmt=fmt,
+        out_fmt=out_fmt,
+        unique=unique,
+        n_jobs=n_jobs,
+        errors=errors,
+        out=date if inplace else out,
+    )
+    return None if inplace else result
 
 
 def _add(
-    date: Union[pd.Series, datetime.date, datetime.datetime],
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal],
     *,
     years: int = 0,
     months: int = 0,
     days: int = 0,
-) -> Union[pd.Series, datetime.date, datetime.datetime]:
-    if isinstance(date, pd.Series):
-        return date + pd.offsets.DateOffset(years=years, months=months, days=days)
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: int = 0,
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    if isinstance(date, Ordinal):
+        return shift(
+            date,
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
+    if _is_series(date):
+        return _shift_datetime(
+            date,
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
     else:
-        return date + relativedelta(years=years, months=months, days=days)
+        from dateutil.relativedelta import relativedelta
+
+        return date + relativedelta(
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
 
 
 def sub(
-    date: Union[pd.Series, int, str, float],
+    date: Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float],
     *,
-    years: int = 0,
-    months: int = 0,
-    days: int = 0,
+    years: Union[int, Mapping[Any, int]] = 0,
+    months: Union[int, Mapping[Any, int]] = 0,
+    days: Union[int, Mapping[Any, int]] = 0,
+    hours: Union[int, Mapping[Any, int]] = 0,
+    minutes: Union[int, Mapping[Any, int]] = 0,
+    seconds: Union[int, Mapping[Any, int]] = 0,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    unique: Optional[bool] = None,
+    n_jobs: Optional[int] = None,
+    errors: str = "raise",
+    columns: Optional[List] = None,
+    out: Optional[Union[np.ndarray, pd.Series]] = None,
+    inplace: bool = False,
 ):
     """Subtract some time interval from a formatted date/datetime.
 
     Args:
-        date (Union[pd.Series, int, str, float]): a series of
-            formatted dates/datetimes, or a single formatted date/datetime.
-        years (int, optional): number of years to subtract. Defaults to 0.
-        months (int, optional): number of months to subtract. Defaults to 0.
-        days (int, optional): number of days to subtract. Defaults to 0.
+        date (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str,
+            float]): a data frame with columns of formatted dates/datetimes, a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        years (Union[int, Mapping[Any, int]], optional): number of years to subtract,
+            or a mapping from the columns of a data frame to their number of years.
+            Defaults to 0.
+        months (Union[int, Mapping[Any, int]], optional): number of months to
+            subtract, or a mapping from the columns of a data frame to their number of
+            months. Defaults to 0.
+        days (Union[int, Mapping[Any, int]], optional): number of days to subtract, or
+            a mapping from the columns of a data frame to their number of days.
+            Defaults to 0.
+        hours (Union[int, Mapping[Any, int]], optional): number of hours to subtract,
+            or a mapping from the columns of a data frame to their number of hours.
+            Defaults to 0.
+        minutes (Union[int, Mapping[Any, int]], optional): number of minutes to
+            subtract, or a mapping from the columns of a data frame to their number of
+            minutes. Defaults to 0.
+        seconds (Union[int, Mapping[Any, int]], optional): number of seconds to
+            subtract, or a mapping from the columns of a data frame to their number of
+            seconds. Defaults to 0.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `date` is numeric. Defaults to the format of
+            `date`.
+        unique (Optional[bool], optional): whether to compute the operation only on
+            the unique values of a series, which is faster for series with many
+            duplicates. Defaults to `None`, which does so only if the ratio of unique
+            values is below `config.UNIQUE_RATIO_THRESHOLD`.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+        errors (str, optional): how invalid dates/datetimes are handled: `"raise"`
+            raises a `FormatError`, `"coerce"` results in missing values and
+            `"ignore"` keeps them unchanged (see `dateint.validate`), as well as
+            results out of the range of years. Defaults to `"raise"`.
+        columns (Optional[List], optional): names of the columns of a data frame to
+            operate, whose formats are detected once per column. Integer columns with
+            the same format and arguments are operated as a single block. Defaults to
+            every column.
+        out (Optional[Union[np.ndarray, pd.Series]], optional): array or series with
+            the length of `date` and the dtype of the result (not for data frames,
+            see `inplace`), into which the result is written block by block (see
+            `config.BLOCK_SIZE`), without allocating any temporary of the size of
+            `date`. Results that do not fit into its dtype (e.g. narrower strings or
+            integers, or missing values of `errors="coerce"` into integers) raise a
+            `TypeError`/`ValueError` before being written. Defaults to `None`.
+        inplace (bool, optional): whether to replace the columns of a data frame, or
+            the values of a series/array (as `out=date`), instead of returning a new
+            one. Defaults to False.
 
     Examples:
         ```py
@@ -148,20 +627,587 @@ def sub(
         ```
 
     Returns:
-        (Union[pd.Series, int, str, float]): a series of formatted dates/datetimes, or a
-            single formatted date/datetime.
+        (Union[pd.DataFrame, pd.Series, np.ndarray, list, tuple, int, str, float]): a
+            data frame with the operated columns, a series, array, list or tuple of
+            formatted dates/datetimes, or a single formatted date/datetime, of the
+            same type as `date` (`out` if specified, `None` if `inplace`).
     """
-    return conversion(_sub)(date, years=years, months=months, days=days)
+    if frame.is_frame(date):
+        return frame.apply(
+            sub,
+            date,
+            columns,
+            fmt=fmt,
+            inplace=inplace,
+            out=out,
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            out_fmt=out_fmt,
+            unique=unique,
+            n_jobs=n_jobs,
+            errors=errors,
+        )
+    result = conversion(_sub)(
+        date,
+        years=years,
+        months=months,
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        fmt=fmt,
+        out_fmt=out_fmt,
+        unique=unique,
+        n_jobs=n_jobs,
+        errors=errors,
+        out=date if inplace else out,
+    )
+    return None if inplace else result
 
 
 def _sub(
-    date: Union[pd.Series, datetime.date, datetime.datetime],
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal],
     *,
     years: int = 0,
     months: int = 0,
     days: int = 0,
-) -> Union[pd.Series, datetime.date, datetime.datetime]:
-    if isinstance(date, pd.Series):
-        return date - pd.offsets.DateOffset(years=years, months=months, days=days)
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: int = 0,
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    if isinstance(date, Ordinal):
+        return shift(
+            date,
+            years=-years,
+            months=-months,
+            days=-days,
+            hours=-hours,
+            minutes=-minutes,
+            seconds=-seconds,
+        )
+    if _is_series(date):
+        return _shift_datetime(
+            date,
+            years=-years,
+            months=-months,
+            days=-days,
+            hours=-hours,
+            minutes=-minutes,
+            seconds=-seconds,
+        )
     else:
-        return date - relativedelta(years=years, months=months, days=days)
+        from dateutil.relativedelta import relativedelta
+
+        return date - relativedelta(
+            years=years,
+            months=months,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
+
+
+# Units of `diff`.
+DIFF_UNITS = (*DIFFERENCE_UNITS, "business_days")
+
+
+def diff(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    other: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    unit: str = "days",
+    fmt: Optional[str] = None,
+    other_fmt: Optional[str] = None,
+    calendar: Optional[str] = None,
+) -> Union[pd.Series, np.ndarray, list, tuple, int]:
+    """Return the difference between formatted dates/datetimes, in whole units.
+
+    The difference is the number of whole days, months or years from `other` to
+    `date`, rounded toward zero, where months and years have the same semantics as
+    `dateutil.relativedelta`: the largest number of units that `dateint.add` can add
+    to `other` without going past `date` (e.g. from 2022-01-31 to 2022-02-28 there is
+    1 month, and from 2022-02-28 to 2022-01-31 there are 0 months). Series and
+    arrays are compared element-wise, by position, and single values are broadcast
+    against them. Values are converted into day ordinals, so that the difference is
+    computed with integer arithmetic.
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series,
+            array, list or tuple of formatted dates/datetimes, or a single formatted
+            date/datetime.
+        other (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series,
+            array, list or tuple of formatted dates/datetimes, or a single formatted
+            date/datetime, subtracted from `date`.
+        unit (str, optional): one of `"days"`, `"months"`, `"years"` and
+            `"business_days"`, the number of business days from `other` (included) to
+            `date` (excluded). Defaults to `"days"`.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        other_fmt (Optional[str], optional): format of `other`. Defaults to `fmt`, or
+            to the format detected from `other` if `fmt` is not specified either.
+        calendar (Optional[str], optional): name of the holiday calendar of business
+            days (see `dateint.business.register_holidays`). Defaults to `None`, Monday
+            to Friday without holidays.
+
+    Raises:
+        ValueError: if the unit is not valid.
+
+    Examples:
+        ```py
+        import dateint as di
+        import pandas as pd
+
+        di.diff(20220510, 20220425)
+        # 15
+
+        dates = pd.Series([202203, 202112, 202205])
+        di.diff(dates, 202201, unit="months")
+        '''
+        0    2
+        1   -1
+        2    4
+        dtype: int64
+        '''
+        ```
+
+    Returns:
+        (Union[pd.Series, np.ndarray, list, tuple, int]): number of whole units, as a
+            series if `date` or `other` is a series (with its index), an array, list
+            or tuple if any of them is one, or as a single integer. Missing values of
+            series result in `NaN`.
+    """
+    if unit not in DIFF_UNITS:
+        raise ValueError(f'Unit "{unit}" is not one of {list(DIFF_UNITS)}.')
+    if isinstance(date, (list, tuple)) or isinstance(other, (list, tuple)):
+        container = type(date) if isinstance(date, (list, tuple)) else type(other)
+        result = diff(
+            np.asarray(date) if isinstance(date, (list, tuple)) else date,
+            np.asarray(other) if isinstance(other, (list, tuple)) else other,
+            unit=unit,
+            fmt=fmt,
+            other_fmt=other_fmt,
+            calendar=calendar,
+        )
+        return container(np.asarray(result).tolist())
+
+    _, parsed = _parse_value(date, fmt)
+    _, other_parsed = _parse_value(other, other_fmt or fmt)
+    ordinal, missing = _to_ordinal(parsed)
+    other_ordinal, other_missing = _to_ordinal(other_parsed)
+    if unit == "business_days":
+        holidays = business.get_holidays(calendar)
+        result = business.count_business_days(
+            ordinal.days, other_ordinal.days, holidays
+        )
+    else:
+        result = difference(ordinal, other_ordinal, unit)
+
+    missing_masks = [mask for mask in (missing, other_missing) if mask is not None]
+    missing_masks += [
+        mask for mask in (_missing(date), _missing(other)) if mask is not None
+    ]
+    if missing_masks:
+        result = np.where(np.logical_or.reduce(missing_masks), np.nan, result)
+    series = date if _is_series(date) else other
+    if _is_series(series):
+        import pandas as pd
+
+        return pd.Series(result, index=series.index, name=series.name)
+    if isinstance(result, np.ndarray) and result.ndim:
+        return result
+    return int(result)
+
+
+def _default_step(fmt: str) -> dict:
+    """Return one unit of the finest date field of `fmt`, as step arguments."""
+    if "%d" in fmt or "%j" in fmt:
+        return {"days": 1}
+    if "%m" in fmt or "%b" in fmt or "%B" in fmt:
+        return {"months": 1}
+    return {"years": 1}
+
+
+def range(
+    start: Union[int, str, float],
+    end: Union[int, str, float],
+    *,
+    step_years: int = 0,
+    step_months: int = 0,
+    step_days: int = 0,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    lazy: bool = False,
+) -> Union[np.ndarray, Iterator[Union[int, str, float]]]:
+    """Return the formatted dates/datetimes from `start` to `end` (inclusive).
+
+    The k-th value is `start` shifted by k steps, with the same semantics as
+    `dateint.add`, so that days clamped to the end of a month do not change the
+    following values (e.g. 2022-01-31, 2022-02-28, 2022-03-31 every month). Values
+    are computed with integer arithmetic on day ordinals, either all at once into an
+    array or one at a time, lazily, in constant memory.
+
+    Args:
+        start (Union[int, str, float]): first formatted date/datetime.
+        end (Union[int, str, float]): last formatted date/datetime, included if it is
+            reached by a whole number of steps.
+        step_years (int, optional): number of years of each step. Defaults to 0.
+        step_months (int, optional): number of months of each step. Defaults to 0.
+        step_days (int, optional): number of days of each step. Defaults to 0. If no
+            step is specified, the step is one unit of the finest date field of the
+            format (one day for `%Y%m%d`, one month for `%Y%m`, and so on). Negative
+            steps return values from a later `start` to an earlier `end`.
+        fmt (Optional[str], optional): format of `start` and `end`. Detected from
+            `start` if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `start` is numeric. Defaults to `fmt`.
+        lazy (bool, optional): whether to return a generator of single values instead
+            of an array. Defaults to False.
+
+    Raises:
+        ValueError: if the step is zero or its months and days have opposite signs, or
+            if `start` is numeric and `out_fmt` is not.
+
+    Examples:
+        ```py
+        import dateint as di
+
+        di.range(20220130, 20220202)
+        # array([20220130, 20220131, 20220201, 20220202])
+
+        di.range("20220131", "20220430", step_months=1, out_fmt="%Y-%m-%d")
+        # array(['2022-01-31', '2022-02-28', '2022-03-31', '2022-04-30'], dtype='<U10')
+
+        for month in di.range(202201, 202212, step_months=3, lazy=True):
+            print(month)
+        # 202201
+        # 202204
+        # 202207
+        # 202210
+        ```
+
+    Returns:
+        (Union[np.ndarray, Iterator[Union[int, str, float]]]): an array of the type of
+            `start` (e.g. `int64` for integers and unicode for strings), or a
+            generator of single values of the type of `start` if `lazy` is True.
+    """
+    fmt, parsed = _parse_value(start, fmt)
+    _, end_parsed = _parse_value(end, fmt)
+    start_ordinal, _ = _to_ordinal(parsed)
+    end_ordinal, _ = _to_ordinal(end_parsed)
+    step = {"years": step_years, "months": step_months, "days": step_days}
+    if not any(step.values()):
+        step = _default_step(fmt)
+    _check_out_fmt(start, out_fmt)
+    out_fmt = out_fmt or fmt
+
+    if lazy:
+        ordinals = iter_sequence(start_ordinal, end_ordinal, **step)
+        return (_format_result(ordinal, start, out_fmt) for ordinal in ordinals)
+    ordinal = sequence(start_ordinal, end_ordinal, **step)
+    return _format_result(ordinal, np.asarray([start]), out_fmt)
+
+
+def add_business_days(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    days: int,
+    *,
+    calendar: Optional[str] = None,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    unique: Optional[bool] = None,
+    n_jobs: Optional[int] = None,
+):
+    """Add business days to a formatted date/datetime.
+
+    Business days are looked up in the precomputed business days of a holiday
+    calendar (see `dateint.business`). Dates that are not business days are first
+    rolled forward to the next business day, as `numpy.busday_offset` with
+    `roll="forward"` does. The time of day of datetimes is kept.
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        days (int): number of business days to add (negative to subtract).
+        calendar (Optional[str], optional): name of the holiday calendar (see
+            `dateint.business.register_holidays`). Defaults to `None`, Monday to
+            Friday without holidays.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `date` is numeric. Defaults to the format of
+            `date`.
+        unique (Optional[bool], optional): whether to compute the operation only on
+            the unique values of a series, which is faster for series with many
+            duplicates. Defaults to `None`, which does so only if the ratio of unique
+            values is below `config.UNIQUE_RATIO_THRESHOLD`.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+
+    Examples:
+        ```py
+        import dateint as di
+        import pandas as pd
+
+        di.add_business_days(20220513, 3)
+        # 20220518
+
+        di.business.register_holidays("settlement", [20220516])
+        dates = pd.Series([20220512, 20220513, 20220514])
+        di.add_business_days(dates, 1, calendar="settlement")
+        '''
+        0    20220513
+        1    20220517
+        2    20220518
+        dtype: int64
+        '''
+        ```
+
+    Returns:
+        (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series, array,
+            list or tuple of formatted dates/datetimes, or a single formatted
+            date/datetime, of the same type as `date`.
+    """
+    return conversion(_add_business_days)(
+        date,
+        business_days=days,
+        # the calendar itself, instead of its name, is passed to worker processes
+        holidays=business.get_holidays(calendar),
+        fmt=fmt,
+        out_fmt=out_fmt,
+        unique=unique,
+        n_jobs=n_jobs,
+    )
+
+
+def _add_business_days(
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal],
+    *,
+    business_days: int,
+    holidays: business.Holidays,
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    def function(ordinal: Ordinal) -> Ordinal:
+        days = business.add_business_days(ordinal.days, business_days, holidays)
+        return Ordinal(days, ordinal.seconds)
+
+    return _map_ordinal(date, function)
+
+
+def _map_ordinal(
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal], function
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    """Apply a function of ordinals to the result of `_parse_value`, keeping its type.
+
+    Dates/datetimes are shifted by the difference between the result and their
+    ordinals, so that missing values (`NaT`) are kept.
+    """
+    if isinstance(date, Ordinal):
+        return function(date)
+    ordinal, _ = _to_ordinal(date)
+    result = function(ordinal)
+    seconds = (result.days - ordinal.days) * 86400 + (result.seconds - ordinal.seconds)
+    if _is_series(date):
+        return date + np.asarray(seconds).astype("timedelta64[s]")
+    return date + datetime.timedelta(seconds=int(seconds))
+
+
+def is_business_day(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    calendar: Optional[str] = None,
+    fmt: Optional[str] = None,
+) -> Union[pd.Series, np.ndarray, list, tuple, bool]:
+    """Return whether a formatted date/datetime is a business day.
+
+    Business days are looked up in the precomputed business days of a holiday
+    calendar (see `dateint.business`).
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        calendar (Optional[str], optional): name of the holiday calendar (see
+            `dateint.business.register_holidays`). Defaults to `None`, Monday to
+            Friday without holidays.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+
+    Examples:
+        ```py
+        import dateint as di
+
+        di.is_business_day([20220513, 20220514])
+        # [True, False]
+        ```
+
+    Returns:
+        (Union[pd.Series, np.ndarray, list, tuple, bool]): whether each value is a
+            business day, as booleans of the same container as `date`. Missing values
+            of series are not business days.
+    """
+    if isinstance(date, (list, tuple)):
+        result = is_business_day(np.asarray(date), calendar=calendar, fmt=fmt)
+        return type(date)(np.asarray(result).tolist())
+    holidays = business.get_holidays(calendar)
+
+    backend = get_backend(date)
+    if backend is not None:
+        array = backend.to_arrow(date)
+        _, ordinal = _parse_value(array, fmt)
+        result = business.is_business_day(ordinal.days, holidays)
+        return backend.from_arrow(values_to_array(result, array), date)
+
+    _, parsed = _parse_value(date, fmt)
+    ordinal, missing = _to_ordinal(parsed)
+    result = business.is_business_day(ordinal.days, holidays)
+    for mask in (missing, _missing(date)):
+        if mask is not None:
+            result = result & ~mask
+    if _is_series(date):
+        import pandas as pd
+
+        return pd.Series(result, index=date.index, name=date.name)
+    return result
+
+
+def start_of(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    unit: str = "month",
+    *,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    unique: Optional[bool] = None,
+    n_jobs: Optional[int] = None,
+):
+    """Truncate a formatted date/datetime to the start of its period.
+
+    The result is the first day of the ISO week (Monday), month, quarter or year of
+    each value, at midnight, computed on day ordinals with integer arithmetic.
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        unit (str, optional): one of `"week"`, `"month"`, `"quarter"` and `"year"`.
+            Defaults to `"month"`.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `date` is numeric. Defaults to the format of
+            `date`.
+        unique (Optional[bool], optional): whether to compute the operation only on
+            the unique values of a series, which is faster for series with many
+            duplicates. Defaults to `None`, which does so only if the ratio of unique
+            values is below `config.UNIQUE_RATIO_THRESHOLD`.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+
+    Examples:
+        ```py
+        import dateint as di
+        import pandas as pd
+
+        di.start_of(20220510)
+        # 20220501
+
+        dates = pd.Series([20220510, 20220815, 20221231])
+        di.start_of(dates, "quarter")
+        '''
+        0    20220401
+        1    20220701
+        2    20221001
+        dtype: int64
+        '''
+        ```
+
+    Returns:
+        (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series, array,
+            list or tuple of formatted dates/datetimes, or a single formatted
+            date/datetime, of the same type as `date`.
+    """
+    return conversion(_start_of)(
+        date, unit=unit, fmt=fmt, out_fmt=out_fmt, unique=unique, n_jobs=n_jobs
+    )
+
+
+def _start_of(
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal], *, unit: str
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    return _map_ordinal(date, partial(start_of_period, unit=unit))
+
+
+def end_of(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    unit: str = "month",
+    *,
+    fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    unique: Optional[bool] = None,
+    n_jobs: Optional[int] = None,
+):
+    """Round a formatted date/datetime up to the end of its period.
+
+    The result is the last day of the ISO week (Sunday), month, quarter or year of
+    each value, at its last second (23:59:59), computed on day ordinals with integer
+    arithmetic.
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        unit (str, optional): one of `"week"`, `"month"`, `"quarter"` and `"year"`.
+            Defaults to `"month"`.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+        out_fmt (Optional[str], optional): format of the result, which must be
+            numeric (e.g. `%Y%m%d`) if `date` is numeric. Defaults to the format of
+            `date`.
+        unique (Optional[bool], optional): whether to compute the operation only on
+            the unique values of a series, which is faster for series with many
+            duplicates. Defaults to `None`, which does so only if the ratio of unique
+            values is below `config.UNIQUE_RATIO_THRESHOLD`.
+        n_jobs (Optional[int], optional): number of processes that compute the
+            operation on contiguous blocks of a series of integers or fixed-width
+            strings (negative values count back from the number of CPUs, -1 meaning
+            all of them). Defaults to `None`, which computes it in the current process.
+
+    Examples:
+        ```py
+        import dateint as di
+        import pandas as pd
+
+        di.end_of(20220210)
+        # 20220228
+
+        dates = pd.Series([20220510101010, 20221231000000])
+        di.end_of(dates, "week")
+        '''
+        0    20220515235959
+        1    20230101235959
+        dtype: int64
+        '''
+        ```
+
+    Returns:
+        (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series, array,
+            list or tuple of formatted dates/datetimes, or a single formatted
+            date/datetime, of the same type as `date`.
+    """
+    return conversion(_end_of)(
+        date, unit=unit, fmt=fmt, out_fmt=out_fmt, unique=unique, n_jobs=n_jobs
+    )
+
+
+def _end_of(
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal], *, unit: str
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    return _map_ordinal(date, partial(end_of_period, unit=unit))
@@ -0,0 +1,230 @@
+"""Module for lazy chains of date/datetime operations.
+
+An expression records operations without computing them. When it is computed, the
+value is parsed once, every operation is applied to its day ordinals (or datetimes)
+one after another, and the result is formatted once, instead of parsing and
+formatting the value again for every operation.
+
+Examples:
+    ```py
+    import dateint as di
+    import pandas as pd
+
+    dates = pd.Series([20220115, 20220210])
+    di.expr(dates).add(months=1).start_of("month").sub(days=1).compute()
+    '''
+    0    20220131
+    1    20220228
+    dtype: int64
+    '''
+    ```
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from . import business
+from .convert import conversion
+from .core import _map_ordinal
+from .numeric import Ordinal, end_of_period, shift, start_of_period
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Operations are tuples of a name and its arguments, so that they can be pickled into
+# worker processes (see `dateint.parallel`).
+Operation = Tuple
+
+
+def _fuse(operations: Tuple[Operation, ...]) -> Tuple[Operation, ...]:
+    """Merge consecutive shifts whose merge has the same result.
+
+    Days and seconds are added after years and months, so a shift followed by a shift
+    of days and seconds only is a single shift. Shifts of months are never merged with
+    each other, since the day clamped to the end of a month depends on the
+    intermediate month (e.g. 2022-01-31 plus one month twice is 2022-03-28, but plus
+    two months is 2022-03-31).
+    """
+    fused: list = []
+    for operation in operations:
+        if (
+            fused
+            and operation[0] == fused[-1][0] == "shift"
+            and not operation[1]
+            and not operation[2]
+        ):
+            _, years, months, days, seconds = fused[-1]
+            fused[-1] = (
+                "shift",
+                years,
+                months,
+                days + operation[3],
+                seconds + operation[4],
+            )
+        else:
+            fused.append(operation)
+    return tuple(fused)
+
+
+def _apply_operation(ordinal: Ordinal, operation: Operation) -> Ordinal:
+    name, *args = operation
+    if name == "shift":
+        years, months, days, seconds = args
+        return shift(ordinal, years=years, months=months, days=days, seconds=seconds)
+    if name == "start_of":
+        return start_of_period(ordinal, *args)
+    if name == "end_of":
+        return end_of_period(ordinal, *args)
+    if name == "add_business_days":
+        business_days, holidays = args
+        days = business.add_business_days(ordinal.days, business_days, holidays)
+        return Ordinal(days, ordinal.seconds)
+    raise ValueError(f'Unknown operation "{name}".')
+
+
+def _apply(
+    date: Union[pd.Series, datetime.date, datetime.datetime, Ordinal],
+    *,
+    operations: Tuple[Operation, ...],
+) -> Union[pd.Series, datetime.date, datetime.datetime, Ordinal]:
+    def function(ordinal: Ordinal) -> Ordinal:
+        for operation in operations:
+            ordinal = _apply_operation(ordinal, operation)
+        return ordinal
+
+    return _map_ordinal(date, function)
+
+
+class Expr:
+    """Lazy chain of operations on formatted dates/datetimes.
+
+    Every method but `compute` returns a new expression with one more operation,
+    without computing anything. Create expressions with `dateint.expr`.
+    """
+
+    def __init__(
+        self,
+        value,
+        fmt: Optional[str] = None,
+        operations: Tuple[Operation, ...] = (),
+    ):
+        self.value = value
+        self.fmt = fmt
+        self.operations = operations
+
+    def __repr__(self) -> str:
+        return f"Expr(operations={list(self.operations)}, fmt={self.fmt!r})"
+
+    def _then(self, *operation) -> Expr:
+        return Expr(self.value, self.fmt, self.operations + (operation,))
+
+    def add(
+        self,
+        *,
+        years: int = 0,
+        months: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+    ) -> Expr:
+        """Add some time interval, as `dateint.add` does."""
+        seconds += hours * 3600 + minutes * 60
+        return self._then("shift", years, months, days, seconds)
+
+    def sub(
+        self,
+        *,
+        years: int = 0,
+        months: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+    ) -> Expr:
+        """Subtract some time interval, as `dateint.sub` does."""
+        seconds += hours * 3600 + minutes * 60
+        return self._then("shift", -years, -months, -days, -seconds)
+
+    def add_business_days(self, days: int, *, calendar: Optional[str] = None) -> Expr:
+        """Add business days, as `dateint.add_business_days` does."""
+        return self._then("add_business_days", days, business.get_holidays(calendar))
+
+    def start_of(self, unit: str = "month") -> Expr:
+        """Truncate to the start of the period, as `dateint.start_of` does."""
+        return self._then("start_of", unit)
+
+    def end_of(self, unit: str = "month") -> Expr:
+        """Round up to the end of the period, as `dateint.end_of` does."""
+        return self._then("end_of", unit)
+
+    def compute(
+        self,
+        *,
+        out_fmt: Optional[str] = None,
+        unique: Optional[bool] = None,
+        n_jobs: Optional[int] = None,
+    ) -> Union[pd.Series, np.ndarray, list, tuple, int, str, float]:
+        """Compute the operations, parsing and formatting the value only once.
+
+        Args:
+            out_fmt (Optional[str], optional): format of the result. Defaults to the
+                format of the value.
+            unique (Optional[bool], optional): whether to compute the operations only
+                on the unique values of a series (see `dateint.add`).
+            n_jobs (Optional[int], optional): number of processes that compute the
+                operations on blocks of a series (see `dateint.add`).
+
+        Returns:
+            (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series,
+                array, list or tuple of formatted dates/datetimes, or a single
+                formatted date/datetime, of the same type as the value.
+        """
+        return conversion(_apply)(
+            self.value,
+            operations=_fuse(self.operations),
+            fmt=self.fmt,
+            out_fmt=out_fmt,
+            unique=unique,
+            n_jobs=n_jobs,
+        )
+
+
+def expr(
+    date: Union[pd.Series, np.ndarray, list, tuple, int, str, float],
+    *,
+    fmt: Optional[str] = None,
+) -> Expr:
+    """Start a lazy chain of operations on formatted dates/datetimes.
+
+    The operations (`add`, `sub`, `add_business_days`, `start_of` and `end_of`) are
+    recorded and only computed by `compute`, which parses the value once, applies
+    every operation to its day ordinals and formats the result once. Consecutive
+    shifts are merged into a single one when the result is the same (e.g. a shift of
+    months followed by shifts of days).
+
+    Args:
+        date (Union[pd.Series, np.ndarray, list, tuple, int, str, float]): a series
+            (pandas/Polars), array (numpy/Arrow), list or tuple of formatted
+            dates/datetimes, or a single formatted date/datetime.
+        fmt (Optional[str], optional): format of `date`. Detected from the value (or
+            from the first element of the series/array) if not specified.
+
+    Examples:
+        ```py
+        import dateint as di
+
+        di.expr(20220510).add(months=1).sub(days=1).compute()
+        # 20220609
+
+        di.expr("20220510").end_of("quarter").add_business_days(1).compute()
+        # "20220701"
+        ```
+
+    Returns:
+        (Expr): expression without any operation.
+    """
+    return Expr(date, fmt)
@@ -0,0 +1,362 @@
+"""Module for the `dateint` pandas extension dtype.
+
+Series of dtype `dateint[<format>]` store dates as `int32` day ordinals (half the
+memory of `int64` formatted dates), with the format stored in the dtype, so that
+they are parsed only once, when they are created. Operations of `dateint` (e.g.
+`dateint.add`), comparisons, sorting and `value_counts` work on the ordinals
+directly, and values are only formatted when converted back into integers/strings.
+
+The dtype is registered in pandas when this module is imported. Formats must be
+fixed-width date formats (e.g. `%Y%m%d` or `%Y-%m-%d`, without time directives).
+
+Examples:
+    ```py
+    import dateint as di
+    import dateint.extension
+    import pandas as pd
+
+    dates = pd.Series([20220131, 20220228]).astype("dateint[%Y%m%d]")
+    di.add(dates, months=1)
+    '''
+    0    20220228
+    1    20220328
+    dtype: dateint[%Y%m%d]
+    '''
+    dates.astype("dateint[%Y-%m-%d]").astype(str).tolist()
+    # ['2022-01-31', '2022-02-28']
+    ```
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from typing import Any, Callable, Optional, Sequence, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+
+from .config import get_date_format
+from .convert import _array_to_ordinal
+from .exception import FormatError
+from .numeric import (
+    Ordinal,
+    fixed_width,
+    from_ordinal,
+    is_numeric_format,
+    ordinal_to_text,
+    scalar_from_ordinal,
+    scalar_ordinal_to_text,
+    start_of_period,
+)
+
+# Day ordinal of missing values.
+NA_ORDINAL = np.iinfo(np.int32).min
+
+_TIME_DIRECTIVES = ("%H", "%M", "%S")
+
+
+@register_extension_dtype
+class DateintDtype(ExtensionDtype):
+    """Dtype of dates stored as `int32` day ordinals, formatted with `fmt`.
+
+    Args:
+        fmt (Optional[str], optional): fixed-width date format. Defaults to
+            `config.DEFAULT_FORMAT`.
+    """
+
+    _metadata = ("fmt",)
+    _match = re.compile(r"^dateint(?:\[(?P<fmt>.+)\])?$")
+    na_value = pd.NA
+    kind = "O"
+
+    def __init__(self, fmt: Optional[str] = None):
+        fmt = fmt or get_date_format()
+        if fixed_width(fmt) is None or any(d in fmt for d in _TIME_DIRECTIVES):
+            raise ValueError(f'Format "{fmt}" is not a fixed-width date format.')
+        self.fmt = fmt
+
+    @property
+    def name(self) -> str:
+        return f"dateint[{self.fmt}]"
+
+    @property
+    def type(self) -> type:
+        return int if is_numeric_format(self.fmt) else str
+
+    @classmethod
+    def construct_array_type(cls) -> Type[DateintArray]:
+        return DateintArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> DateintDtype:
+        if not isinstance(string, str):
+            raise TypeError(
+                f"'construct_from_string' expects a string, got {type(string)}"
+            )
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError(f"Cannot construct a 'DateintDtype' from '{string}'")
+        return cls(match.group("fmt"))
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _truncate(ordinals: np.ndarray, fmt: str) -> np.ndarray:
+    """Truncate `int32` day ordinals to the precision of a format.
+
+    Dates of a format without the day (e.g. `%Y%m`) are stored as the first day of
+    their month, and without the month (e.g. `%Y`) as the first day of their year, so
+    that dates formatted alike have equal ordinals.
+    """
+    if "%d" in fmt:
+        return ordinals
+    missing = ordinals == NA_ORDINAL
+    days = np.where(missing, 0, ordinals).astype(np.int64)
+    unit = "month" if "%m" in fmt else "year"
+    days = start_of_period(Ordinal(days, 0), unit).days
+    return np.where(missing, NA_ORDINAL, days).astype(np.int32)
+
+
+def _to_ordinals(values, fmt: str) -> np.ndarray:
+    """Parse formatted dates (or datetimes, truncated) into `int32` day ordinals."""
+    if isinstance(values, DateintArray):
+        if values.dtype.fmt == fmt:
+            return values._ordinals
+        return _truncate(values._ordinals, fmt)
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        missing = np.isnat(values)
+        days = values.astype("datetime64[D]").astype(np.int64)
+        return _truncate(np.where(missing, NA_ORDINAL, days).astype(np.int32), fmt)
+
+    missing = np.asarray(pd.isna(values), dtype=bool).reshape(values.shape)
+    valid = values[~missing]
+    if valid.dtype.kind not in "iuUS":
+        valid = valid.astype(np.int64 if is_numeric_format(fmt) else str)
+    elif valid.dtype.kind in "US" and is_numeric_format(fmt):
+        valid = valid.astype(np.int64)
+    ordinal = _array_to_ordinal(valid, fmt)
+    if ordinal is None:
+        raise FormatError(f'Values can not be parsed with format "{fmt}".')
+    ordinals = np.full(len(values), NA_ORDINAL, dtype=np.int32)
+    ordinals[~missing] = ordinal.days
+    return ordinals
+
+
+class DateintArray(ExtensionArray):
+    """Extension array of dates stored as `int32` day ordinals (see `DateintDtype`).
+
+    Args:
+        ordinals (np.ndarray): day ordinals, with `NA_ORDINAL` for missing values.
+        dtype (DateintDtype): dtype, with the format of the dates.
+    """
+
+    def __init__(self, ordinals: np.ndarray, dtype: DateintDtype):
+        self._ordinals = np.asarray(ordinals, dtype=np.int32)
+        self._dtype = dtype
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy: bool = False):
+        if not isinstance(dtype, DateintDtype):
+            dtype = pd.api.types.pandas_dtype(dtype or "dateint")
+        ordinals = _to_ordinals(scalars, dtype.fmt)
+        return cls(ordinals.copy() if copy else ordinals, dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy: bool = False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values: np.ndarray, original: DateintArray):
+        return cls(values, original.dtype)
+
+    @classmethod
+    def from_ordinal(
+        cls, ordinal: Ordinal, dtype: DateintDtype, missing: Optional[np.ndarray] = None
+    ) -> DateintArray:
+        """Create an array from ordinals, truncated to the precision of the format.
+
+        The seconds of day are dropped, and so are the days of month (or months) of
+        formats without them (see `_truncate`).
+
+        Args:
+            ordinal (Ordinal): day ordinals and seconds of day.
+            dtype (DateintDtype): dtype of the array.
+            missing (Optional[np.ndarray], optional): boolean array of missing values.
+
+        Returns:
+            (DateintArray): array of dates.
+        """
+        ordinals = np.asarray(ordinal.days, dtype=np.int32)
+        if missing is not None:
+            ordinals = np.where(missing, NA_ORDINAL, ordinals)
+        return cls(_truncate(ordinals, dtype.fmt), dtype)
+
+    def to_ordinal(self) -> Ordinal:
+        """Return the dates as ordinals, with day ordinal 0 for missing values."""
+        missing = self.isna()
+        days = self._ordinals.astype(np.int64)
+        if missing.any():
+            days[missing] = 0
+        return Ordinal(days, 0)
+
+    @property
+    def dtype(self) -> DateintDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._ordinals.nbytes
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def _format_scalar(self, ordinal: int):
+        if ordinal == NA_ORDINAL:
+            return pd.NA
+        if is_numeric_format(self._dtype.fmt):
+            return scalar_from_ordinal(Ordinal(int(ordinal), 0), self._dtype.fmt)
+        return scalar_ordinal_to_text(Ordinal(int(ordinal), 0), self._dtype.fmt)
+
+    def _format(self) -> np.ndarray:
+        """Format every date, as integers or strings (missing values are undefined)."""
+        ordinal = self.to_ordinal()
+        if is_numeric_format(self._dtype.fmt):
+            return from_ordinal(ordinal, self._dtype.fmt)
+        return ordinal_to_text(ordinal, self._dtype.fmt)
+
+    def __getitem__(self, item):
+        if pd.api.types.is_integer(item):
+            return self._format_scalar(self._ordinals[item])
+        if isinstance(item, slice):
+            result = type(self)(self._ordinals[item], self._dtype)
+            # a slice is a view of the same ordinals
+            result._readonly = self._readonly
+            return result
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._ordinals[item], self._dtype)
+
+    def __setitem__(self, key, value):
+        if self._readonly:
+            raise ValueError("Cannot modify read-only array")
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if pd.api.types.is_scalar(value):
+            self._ordinals[key] = _to_ordinals([value], self._dtype.fmt)[0]
+        else:
+            self._ordinals[key] = _to_ordinals(value, self._dtype.fmt)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy is False:
+            raise ValueError("Dates can not be converted without formatting a copy.")
+        values = self._format().astype(object)
+        values[self.isna()] = pd.NA
+        return values if dtype is None else values.astype(dtype)
+
+    def isna(self) -> np.ndarray:
+        return self._ordinals == NA_ORDINAL
+
+    def take(self, indices: Sequence[int], *, allow_fill=False, fill_value=None):
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = _to_ordinals([fill_value], self._dtype.fmt)[0]
+        else:
+            fill_value = NA_ORDINAL
+        result = take(
+            self._ordinals, indices, allow_fill=allow_fill, fill_value=fill_value
+        )
+        return type(self)(result, self._dtype)
+
+    def copy(self) -> DateintArray:
+        return type(self)(self._ordinals.copy(), self._dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[DateintArray]) -> DateintArray:
+        ordinals = np.concatenate([array._ordinals for array in to_concat])
+        return cls(ordinals, to_concat[0].dtype)
+
+    def _values_for_factorize(self):
+        return self._ordinals, NA_ORDINAL
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._ordinals
+
+    def astype(self, dtype, copy: bool = True):
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if dtype == self._dtype and not copy:
+            return self
+        if isinstance(dtype, DateintDtype):
+            ordinals = _to_ordinals(self, dtype.fmt)
+            if ordinals is self._ordinals and copy:
+                ordinals = ordinals.copy()
+            return type(self)(ordinals, dtype)
+        if isinstance(dtype, np.dtype) and dtype.kind == "M":
+            days = self._ordinals.astype(np.int64)
+            return (
+                np.where(self.isna(), np.iinfo(np.int64).min, days)
+                .view("datetime64[D]")
+                .astype(dtype)
+            )
+        if (
+            isinstance(dtype, np.dtype)
+            and dtype.kind in "iuUS"
+            and not self.isna().any()
+        ):
+            return self._format().astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _compare(self, other, op: Callable) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if pd.api.types.is_scalar(other):
+            if pd.isna(other):
+                return np.full(len(self), op is operator.ne)
+            other = [other]
+        other_ordinals = _to_ordinals(other, self._dtype.fmt)
+        result = op(self._ordinals, other_ordinals)
+        missing = self.isna() | (other_ordinals == NA_ORDINAL)
+        result[missing] = op is operator.ne
+        return result
+
+    def __eq__(self, other: Any):  # type: ignore[override]
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: Any):  # type: ignore[override]
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: Any):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any):
+        return self._compare(other, operator.ge)
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs
+    ):
+        if name not in ("min", "max"):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        missing = self.isna()
+        if missing.all() or (missing.any() and not skipna):
+            result = pd.NA
+        else:
+            ordinals = self._ordinals[~missing]
+            result = self._format_scalar(
+                ordinals.min() if name == "min" else ordinals.max()
+            )
+        return (
+            type(self)._from_sequence([result], dtype=self._dtype)
+            if keepdims
+            else result
+        )
@@ -0,0 +1,121 @@
+"""Module for operations on several columns of a pandas data frame at once.
+
+The format of each column is detected only once, from its first value. Integer
+columns with the same format, dtype and operation arguments are stacked into a single
+block, which is converted into ordinals, operated and formatted in one pass, instead
+of one pass per column. Any other column is operated as a series, with its detected
+format.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .convert import _first_matching_format, _first_parsable_format
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from typing_extensions import TypeGuard
+
+
+def is_frame(value) -> TypeGuard[pd.DataFrame]:
+    """Return whether `value` is a pandas data frame."""
+    # pandas is imported lazily: if it has not been imported yet, no data frame exists
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.DataFrame)
+
+
+def _column_kwargs(kwargs: Mapping[str, Any], column) -> Dict[str, Any]:
+    """Select the arguments of a column, where mappings hold per-column arguments."""
+    return {
+        name: value.get(column, 0) if isinstance(value, Mapping) else value
+        for name, value in kwargs.items()
+    }
+
+
+def apply(
+    operation: Callable,
+    frame: pd.DataFrame,
+    columns: Optional[List] = None,
+    *,
+    fmt: Optional[str] = None,
+    inplace: bool = False,
+    out=None,
+    **kwargs,
+) -> Optional[pd.DataFrame]:
+    """Apply an operation to columns of a data frame.
+
+    Args:
+        operation (Callable): operation applied to series (e.g. `dateint.add`), with
+            `fmt` and `kwargs` as keyword arguments.
+        frame (pd.DataFrame): data frame.
+        columns (Optional[List], optional): names of the columns to operate. Defaults
+            to every column.
+        fmt (Optional[str], optional): format of every column. Detected from the
+            first value of each column if not specified.
+        inplace (bool, optional): whether to replace the columns of `frame` instead of
+            returning a new data frame. Defaults to False.
+        out (optional): not supported for data frames (use `inplace`), only accepted
+            to raise an error instead of ignoring it. Defaults to `None`.
+        **kwargs: arguments of the operation. Mappings (e.g. `months={"a": 1}`) hold
+            the argument of each column, 0 for columns not in the mapping.
+
+    Raises:
+        TypeError: if `out` is specified.
+        ValueError: if any operated column label is duplicated in `frame` or in
+            `columns`.
+
+    Returns:
+        (Optional[pd.DataFrame]): data frame with the results in the operated
+            columns, which shares the other columns with `frame` (`None` if
+            `inplace`).
+    """
+    import pandas as pd
+
+    if out is not None:
+        raise TypeError(
+            "Results of data frames can not be written into out, use inplace=True "
+            "to replace the columns of the data frame."
+        )
+    if columns is None:
+        columns = list(frame.columns)
+    labels, selected = Counter(frame.columns), Counter(columns)
+    duplicated = [c for c in selected if labels[c] > 1 or selected[c] > 1]
+    if duplicated:
+        raise ValueError(f"Duplicated column labels can not be operated: {duplicated}.")
+
+    blocks: Dict[Tuple, List] = {}
+    results = {}
+    for column in columns:
+        values = frame[column]
+        if kwargs.get("errors", "raise") == "raise":
+            column_fmt = fmt or _first_matching_format(values)
+        else:
+            # invalid values are skipped (see `dateint.validate`)
+            column_fmt = fmt or _first_parsable_format(values)
+        column_kwargs = _column_kwargs(kwargs, column)
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iu":
+            key = (column_fmt, values.dtype, tuple(sorted(column_kwargs.items())))
+            blocks.setdefault(key, []).append(column)
+        else:
+            results[column] = operation(values, fmt=column_fmt, **column_kwargs)
+
+    for (column_fmt, _, column_kwargs), block_columns in blocks.items():
+        # the columns are stacked one after another, so that each one is contiguous
+        values = frame[block_columns].to_numpy().ravel(order="F")
+        result = operation(pd.Series(values), fmt=column_fmt, **dict(column_kwargs))
+        result_values = result.to_numpy().reshape(len(block_columns), len(frame))
+        for column, column_values in zip(block_columns, result_values):
+            results[column] = pd.Series(
+                column_values, index=frame.index, name=column, dtype=result.dtype
+            )
+
+    if not inplace:
+        frame = frame.copy(deep=False)
+    for column in columns:
+        frame[column] = results[column]
+    return None if inplace else frame
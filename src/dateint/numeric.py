@@ -0,0 +1,829 @@
+"""Module for pure-integer arithmetic on fixed-width formatted dates/datetimes."""
+
+import re
+from functools import lru_cache
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .calendar import INVALID, add_months, lookup_days, lookup_fields, lookup_weekday
+from .exception import FormatError
+
+# Width (in digits) of each directive accepted in a numeric format.
+_DIRECTIVE_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_IN_MONTH_ARRAY = np.array(_DAYS_IN_MONTH)
+
+_MIN_YEAR = 1
+_MAX_YEAR = 9999
+
+
+class Ordinal(NamedTuple):
+    """Dates/datetimes as day ordinals and seconds of day.
+
+    Day ordinals are counted from 1970-01-01, the epoch used by `numpy.datetime64`.
+    """
+
+    days: Any
+    seconds: Any
+
+
+# Position of each directive in the calendar fields returned by `_split`.
+_FIELD_INDEX = {"Y": 0, "m": 1, "d": 2, "H": 3, "M": 4, "S": 5}
+
+# Value of each calendar field when its directive is not part of the format.
+_DEFAULT_FIELDS = (None, 1, 1, 0, 0, 0)
+
+Layout = Tuple[Tuple[int, int, int], ...]
+
+
+@lru_cache(maxsize=None)
+def _numeric_layout(fmt: str) -> Optional[Layout]:
+    """Return how to extract each calendar field from a purely numeric format.
+
+    A format is numeric when it is a sequence of the directives in
+    `_DIRECTIVE_WIDTHS`, without literal characters, so that a formatted value can be
+    handled as an integer. The result has one `(field index, divisor, modulus)` triple
+    per directive, where the field is `value // divisor % modulus` (a modulus of 0
+    meaning no modulus). Non-numeric formats result in `None`.
+    """
+    directives = re.findall(r"%(.)", fmt)
+    if not directives or "".join(f"%{d}" for d in directives) != fmt:
+        return None
+    if any(d not in _DIRECTIVE_WIDTHS for d in directives):
+        return None
+    if len(set(directives)) != len(directives) or "Y" not in directives:
+        return None
+
+    layout = []
+    power = sum(_DIRECTIVE_WIDTHS[d] for d in directives)
+    for i, directive in enumerate(directives):
+        power -= _DIRECTIVE_WIDTHS[directive]
+        modulus = 10 ** _DIRECTIVE_WIDTHS[directive] if i > 0 else 0
+        layout.append((_FIELD_INDEX[directive], 10**power, modulus))
+    return tuple(layout)
+
+
+def is_numeric_format(fmt: str) -> bool:
+    """Return whether values formatted with `fmt` can be handled as integers."""
+    return _numeric_layout(fmt) is not None
+
+
+def numeric_width(fmt: str) -> int:
+    """Return the number of digits of a value formatted with numeric format `fmt`."""
+    return sum(_DIRECTIVE_WIDTHS[directive] for directive in re.findall(r"%(.)", fmt))
+
+
+class FixedWidth(NamedTuple):
+    """Fixed-width format, as a numeric format for its digits plus literals.
+
+    For instance, `%Y%m%d %H%M%S` has the numeric format `%Y%m%d%H%M%S`, the literal
+    `(8, " ")` and a width of 15 characters.
+    """
+
+    numeric_fmt: str
+    literals: Tuple[Tuple[int, str], ...]
+    digit_slices: Tuple[Tuple[int, int], ...]
+    pieces: Tuple[Union[int, str], ...]
+    width: int
+
+
+@lru_cache(maxsize=None)
+def fixed_width(fmt: str) -> Optional[FixedWidth]:
+    """Compile a format made of numeric directives and literal characters.
+
+    Args:
+        fmt (str): date/datetime format.
+
+    Returns:
+        (Optional[FixedWidth]): compiled format, or `None` if the format has
+            directives without a fixed width (e.g. `%b`).
+    """
+    numeric_fmt = ""
+    literals: List[Tuple[int, str]] = []
+    digit_slices: List[Tuple[int, int]] = []
+    pieces: List[Union[int, str]] = []
+    position = 0
+    for part in re.split(r"(%.)", fmt):
+        if not part:
+            continue
+        if part.startswith("%") and len(part) == 2:
+            width = _DIRECTIVE_WIDTHS.get(part[1])
+            if width is None:
+                return None
+            numeric_fmt += part
+            digit_slices.append((position, position + width))
+            pieces.append(width)
+        elif "%" in part:
+            return None
+        else:
+            literals.extend((position + i, char) for i, char in enumerate(part))
+            pieces.append(part)
+            width = len(part)
+        position += width
+
+    if not is_numeric_format(numeric_fmt):
+        return None
+    return FixedWidth(
+        numeric_fmt, tuple(literals), tuple(digit_slices), tuple(pieces), position
+    )
+
+
+def _is_leap(year):
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _days_in_month(year, month):
+    if isinstance(month, int):
+        return _DAYS_IN_MONTH[month - 1] + (month == 2 and _is_leap(year))
+    return _DAYS_IN_MONTH_ARRAY[month - 1] + ((month == 2) & _is_leap(year))
+
+
+def _days_from_civil(year, month, day):
+    # Howard Hinnant's days_from_civil algorithm, valid for the proleptic Gregorian
+    # calendar.
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(days):
+    # Inverse of `_days_from_civil`.
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 - 12 * (shifted_month >= 10)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _layout(fmt: str) -> Layout:
+    layout = _numeric_layout(fmt)
+    if layout is None:
+        raise ValueError(f'Format "{fmt}" is not numeric.')
+    return layout
+
+
+def _split(values, fmt: str) -> list:
+    """Decompose numeric formatted values into calendar fields."""
+    fields = list(_DEFAULT_FIELDS)
+    for index, divisor, modulus in _layout(fmt):
+        field = values // divisor
+        if modulus:
+            field = field % modulus
+        fields[index] = field
+    return fields
+
+
+def _compose(fields, fmt: str):
+    """Compose calendar fields into numeric formatted values."""
+    return sum(fields[index] * divisor for index, divisor, _ in _layout(fmt))
+
+
+def _validate(values: np.ndarray, fmt: str):
+    """Decompose numeric formatted values and check that they are valid.
+
+    Returns:
+        (Tuple[np.ndarray, list, Optional[np.ndarray]]): whether each value is a valid
+            date/datetime, its calendar fields and, if the calendar table covers every
+            year, its day ordinal.
+    """
+    fields = _split(values, fmt)
+    year, month, day, hour, minute, second = fields
+
+    days = lookup_days(year, month, day)
+    if days is None:
+        valid = (year >= _MIN_YEAR) & (year <= _MAX_YEAR)
+        valid &= (month >= 1) & (month <= 12)
+        month_index = np.where(valid, month, 1)
+        valid &= (day >= 1) & (day <= _days_in_month(year, month_index))
+    else:
+        valid = days != INVALID
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+    return np.broadcast_to(valid, values.shape), fields, days
+
+
+def is_valid(values: np.ndarray, fmt: str) -> np.ndarray:
+    """Return whether numeric formatted values are valid dates/datetimes.
+
+    Args:
+        values (np.ndarray): integer array of formatted dates/datetimes.
+        fmt (str): numeric format of the values.
+
+    Returns:
+        (np.ndarray): boolean array, `True` for valid dates/datetimes.
+    """
+    valid, _, _ = _validate(np.asarray(values, dtype=np.int64), fmt)
+    return valid
+
+
+def to_ordinal(values: np.ndarray, fmt: str) -> Ordinal:
+    """Convert an array of numeric formatted dates/datetimes into ordinals.
+
+    Args:
+        values (np.ndarray): integer array of formatted dates/datetimes.
+        fmt (str): numeric format of the values.
+
+    Raises:
+        FormatError: if any value does not represent a valid date/datetime.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    valid, (year, month, day, hour, minute, second), days = _validate(values, fmt)
+    if not valid.all():
+        invalid_value = values[~valid][0]
+        raise FormatError(f'Value "{invalid_value}" does not match format "{fmt}".')
+
+    if days is None:
+        days = _days_from_civil(year, month, day)
+    seconds = hour * 3600 + minute * 60 + second
+    return Ordinal(days, seconds)
+
+
+def from_ordinal(ordinal: Ordinal, fmt: str) -> np.ndarray:
+    """Convert ordinals back into an int64 array of numeric formatted values.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        fmt (str): numeric format of the result.
+
+    Raises:
+        OverflowError: if any resulting year is out of the supported range.
+
+    Returns:
+        (np.ndarray): int64 array of formatted dates/datetimes.
+    """
+    days = np.asarray(ordinal.days, dtype=np.int64)
+    fields = lookup_fields(days)
+    year, month, day = _civil_from_days(days) if fields is None else fields
+    if np.any((year < _MIN_YEAR) | (year > _MAX_YEAR)):
+        raise OverflowError("date value out of range")
+
+    hour, rest = np.divmod(ordinal.seconds, 3600)
+    minute, second = np.divmod(rest, 60)
+    result = _compose((year, month, day, hour, minute, second), fmt)
+    return np.broadcast_to(result, np.shape(year)).astype(np.int64)
+
+
+def scalar_to_ordinal(value: int, fmt: str) -> Optional[Ordinal]:
+    """Convert a single numeric formatted date/datetime into an ordinal.
+
+    Only integer arithmetic is used, so this is much cheaper than `strptime`.
+
+    Args:
+        value (int): formatted date/datetime.
+        fmt (str): numeric format of the value.
+
+    Returns:
+        (Optional[Ordinal]): day ordinal and seconds of day, or `None` if the value
+            does not represent a valid date/datetime.
+    """
+    year, month, day, hour, minute, second = _split(value, fmt)
+    if not (_MIN_YEAR <= year <= _MAX_YEAR and 1 <= month <= 12):
+        return None
+    if not 1 <= day <= _days_in_month(year, month):
+        return None
+    if hour >= 24 or minute >= 60 or second >= 60:
+        return None
+    return Ordinal(
+        _days_from_civil(year, month, day), hour * 3600 + minute * 60 + second
+    )
+
+
+def scalar_from_ordinal(ordinal: Ordinal, fmt: str) -> int:
+    """Convert a single ordinal back into a numeric formatted date/datetime.
+
+    Args:
+        ordinal (Ordinal): day ordinal and seconds of day.
+        fmt (str): numeric format of the result.
+
+    Raises:
+        OverflowError: if the resulting year is out of the supported range.
+
+    Returns:
+        (int): formatted date/datetime.
+    """
+    year, month, day = _civil_from_days(ordinal.days)
+    if not _MIN_YEAR <= year <= _MAX_YEAR:
+        raise OverflowError("date value out of range")
+
+    hour, rest = divmod(ordinal.seconds, 3600)
+    minute, second = divmod(rest, 60)
+    return _compose((year, month, day, hour, minute, second), fmt)
+
+
+def scalar_text_to_ordinal(text: str, fmt: str) -> Optional[Ordinal]:
+    """Convert a single fixed-width formatted date/datetime string into an ordinal.
+
+    Args:
+        text (str): formatted date/datetime.
+        fmt (str): fixed-width format of the value.
+
+    Returns:
+        (Optional[Ordinal]): day ordinal and seconds of day, or `None` if the value
+            does not represent a valid date/datetime.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        raise ValueError(f'Format "{fmt}" is not fixed-width.')
+    if len(text) != fixed.width:
+        return None
+
+    digits = text
+    if fixed.literals:
+        if any(text[position] != char for position, char in fixed.literals):
+            return None
+        digits = "".join(text[start:stop] for start, stop in fixed.digit_slices)
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    return scalar_to_ordinal(int(digits), fixed.numeric_fmt)
+
+
+def _codes_to_number(chars: np.ndarray, fixed: FixedWidth):
+    """Read the digits of a matrix of character codes as numeric formatted values.
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray]): whether each row has the literals and digits
+            of the format, and the digits of each row as an integer.
+    """
+    valid = np.full(len(chars), chars.shape[1] >= fixed.width)
+    number = np.zeros(len(chars), dtype=np.int64)
+    if valid.any():
+        valid &= (chars[:, fixed.width :] == 0).all(axis=1)
+        for position, char in fixed.literals:
+            valid &= chars[:, position] == ord(char)
+        zero = chars.dtype.type(ord("0"))
+        for start, stop in fixed.digit_slices:
+            for position in range(start, stop):
+                # characters before "0" wrap around to large unsigned integers
+                digit = chars[:, position] - zero
+                valid &= digit <= 9
+                number = number * 10 + digit
+    return valid, number
+
+
+def codes_to_ordinal(chars: np.ndarray, fmt: str) -> Ordinal:
+    """Convert a matrix of character codes of formatted dates/datetimes into ordinals.
+
+    Args:
+        chars (np.ndarray): unsigned integer matrix with one row of character codes
+            (e.g. bytes or unicode code points) per formatted date/datetime, padded
+            with zeros at the end of the rows.
+        fmt (str): fixed-width format of the values.
+
+    Raises:
+        FormatError: if any value does not represent a valid date/datetime.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        raise ValueError(f'Format "{fmt}" is not fixed-width.')
+
+    valid, number = _codes_to_number(chars, fixed)
+    if not valid.all():
+        invalid_value = "".join(map(chr, chars[~valid][0])).rstrip("\0")
+        raise FormatError(f'Value "{invalid_value}" does not match format "{fmt}".')
+    return to_ordinal(number, fixed.numeric_fmt)
+
+
+def is_valid_codes(chars: np.ndarray, fmt: str) -> np.ndarray:
+    """Return whether rows of character codes are valid formatted dates/datetimes.
+
+    Args:
+        chars (np.ndarray): unsigned integer matrix with one row of character codes
+            per formatted date/datetime (see `codes_to_ordinal`).
+        fmt (str): fixed-width format of the values.
+
+    Returns:
+        (np.ndarray): boolean array, `True` for valid dates/datetimes.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        raise ValueError(f'Format "{fmt}" is not fixed-width.')
+
+    valid, number = _codes_to_number(chars, fixed)
+    # rows that are not digits are checked as a valid placeholder number
+    placeholder = scalar_from_ordinal(Ordinal(0, 0), fixed.numeric_fmt)
+    return valid & is_valid(np.where(valid, number, placeholder), fixed.numeric_fmt)
+
+
+def ordinal_to_codes(ordinal: Ordinal, fmt: str, dtype=np.uint8) -> np.ndarray:
+    """Convert ordinals into a matrix of character codes of formatted dates/datetimes.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        fmt (str): fixed-width format of the result.
+        dtype (optional): unsigned integer type of the character codes. Defaults to
+            `numpy.uint8`.
+
+    Raises:
+        OverflowError: if any resulting year is out of the supported range.
+
+    Returns:
+        (np.ndarray): C-contiguous matrix with one row of character codes per
+            formatted date/datetime.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        raise ValueError(f'Format "{fmt}" is not fixed-width.')
+
+    number = from_ordinal(ordinal, fixed.numeric_fmt)
+    chars = np.empty((len(number), fixed.width), dtype=dtype)
+    for position, char in fixed.literals:
+        chars[:, position] = ord(char)
+    for start, stop in reversed(fixed.digit_slices):
+        for position in range(stop - 1, start - 1, -1):
+            number, digit = np.divmod(number, 10)
+            chars[:, position] = digit + ord("0")
+    return chars
+
+
+def _text_to_codes(values: np.ndarray) -> np.ndarray:
+    """View an array of strings as a matrix of character codes, without any copy."""
+    values = np.asarray(values)
+    if values.dtype.kind == "U":
+        codes = values.view(np.uint32)
+    elif values.dtype.kind == "S":
+        codes = values.view(np.uint8)
+    else:
+        raise TypeError(f"Array of type {values.dtype} is not an array of strings.")
+    # strings shorter than the array itemsize are padded with null characters
+    return codes.reshape(len(values), values.dtype.itemsize // codes.itemsize)
+
+
+def text_to_ordinal(values: np.ndarray, fmt: str) -> Ordinal:
+    """Convert an array of fixed-width formatted date/datetime strings into ordinals.
+
+    The characters of the strings are viewed as a matrix of integer codes, without
+    any copy, so that no string is parsed individually.
+
+    Args:
+        values (np.ndarray): unicode (`U`) or bytes (`S`) array of formatted
+            dates/datetimes.
+        fmt (str): fixed-width format of the values.
+
+    Raises:
+        FormatError: if any value does not represent a valid date/datetime.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    return codes_to_ordinal(_text_to_codes(values), fmt)
+
+
+def is_valid_text(values: np.ndarray, fmt: str) -> np.ndarray:
+    """Return whether fixed-width formatted strings are valid dates/datetimes.
+
+    Args:
+        values (np.ndarray): unicode (`U`) or bytes (`S`) array of formatted
+            dates/datetimes.
+        fmt (str): fixed-width format of the values.
+
+    Returns:
+        (np.ndarray): boolean array, `True` for valid dates/datetimes.
+    """
+    return is_valid_codes(_text_to_codes(values), fmt)
+
+
+def ordinal_to_text(ordinal: Ordinal, fmt: str, kind: str = "U") -> np.ndarray:
+    """Convert ordinals back into an array of fixed-width formatted strings.
+
+    The characters of the strings are computed as a matrix of integer codes, so that
+    no string is formatted individually.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        fmt (str): fixed-width format of the result.
+        kind (str, optional): kind of the resulting array, either `"U"` (unicode) or
+            `"S"` (bytes). Defaults to `"U"`.
+
+    Raises:
+        OverflowError: if any resulting year is out of the supported range.
+
+    Returns:
+        (np.ndarray): array of formatted dates/datetimes.
+    """
+    chars = ordinal_to_codes(ordinal, fmt, {"U": np.uint32, "S": np.uint8}[kind])
+    return chars.view(f"{kind}{chars.shape[1]}").reshape(-1)
+
+
+def scalar_ordinal_to_text(ordinal: Ordinal, fmt: str) -> str:
+    """Convert a single ordinal back into a fixed-width formatted string.
+
+    Args:
+        ordinal (Ordinal): day ordinal and seconds of day.
+        fmt (str): fixed-width format of the result.
+
+    Raises:
+        OverflowError: if the resulting year is out of the supported range.
+
+    Returns:
+        (str): formatted date/datetime.
+    """
+    fixed = fixed_width(fmt)
+    if fixed is None:
+        raise ValueError(f'Format "{fmt}" is not fixed-width.')
+
+    value = scalar_from_ordinal(ordinal, fixed.numeric_fmt)
+    digits = str(value).zfill(numeric_width(fixed.numeric_fmt))
+    if not fixed.literals:
+        return digits
+
+    text = []
+    position = 0
+    for piece in fixed.pieces:
+        if isinstance(piece, int):
+            text.append(digits[position : position + piece])
+            position += piece
+        else:
+            text.append(piece)
+    return "".join(text)
+
+
+def day_of_week(days):
+    """Return the day of week of day ordinals, where Monday is 0 and Sunday is 6."""
+    if isinstance(days, np.ndarray):
+        weekday = lookup_weekday(days)
+        if weekday is not None:
+            return weekday
+    # 1970-01-01 was a Thursday.
+    return (days + 3) % 7
+
+
+def _fields(days):
+    """Return the year, month and day of day ordinals."""
+    if isinstance(days, np.ndarray):
+        fields = lookup_fields(days)
+        if fields is not None:
+            return fields
+    return _civil_from_days(days)
+
+
+def _truncated_div(dividend, divisor: int):
+    """Divide integers rounding toward zero, unlike `//`, which rounds toward -inf."""
+    return np.abs(dividend) // divisor * np.sign(dividend)
+
+
+# Units of `difference`.
+DIFFERENCE_UNITS = ("days", "months", "years")
+
+
+def difference(ordinal: Ordinal, other: Ordinal, unit: str = "days"):
+    """Return the number of whole units from `other` to `ordinal`.
+
+    Months and years have the same semantics as `dateutil.relativedelta`: the result
+    is the largest number of units that can be added to `other` (see `shift`) without
+    going past `ordinal`, rounded toward zero. Because of the clamping of the day to
+    the end of the month, the difference of `other` and `ordinal` is not always the
+    opposite of the difference of `ordinal` and `other` (e.g. there is 1 month from
+    2022-01-31 to 2022-02-28, and 0 months from 2022-02-28 to 2022-01-31).
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        other (Ordinal): day ordinals and seconds of day, broadcastable to `ordinal`.
+        unit (str, optional): one of `"days"`, `"months"` and `"years"`. Defaults to
+            `"days"`.
+
+    Returns:
+        (Union[np.ndarray, np.integer]): number of whole units.
+    """
+    if unit not in DIFFERENCE_UNITS:
+        raise ValueError(f'Unit "{unit}" is not one of {list(DIFFERENCE_UNITS)}.')
+    if unit == "days":
+        seconds = (ordinal.days - other.days) * 86400 + (
+            ordinal.seconds - other.seconds
+        )
+        return _truncated_div(seconds, 86400)
+
+    year, month, _ = _fields(ordinal.days)
+    other_year, other_month, _ = _fields(other.days)
+    months = (year - other_year) * 12 + (month - other_month)
+    other_days = other.days
+    if isinstance(months, np.ndarray):
+        other_days = np.broadcast_to(other_days, months.shape)
+    # `other` shifted by `months` is in the month of `ordinal`, with the day clamped
+    # to the end of the month, so it overshoots `ordinal` by at most one month
+    overshoot = (_add_months(other_days, months) - ordinal.days) * 86400 + (
+        other.seconds - ordinal.seconds
+    )
+    forward = (ordinal.days - other.days) * 86400 + (ordinal.seconds - other.seconds)
+    months = (
+        months - ((forward >= 0) & (overshoot > 0)) + ((forward < 0) & (overshoot < 0))
+    )
+    if unit == "years":
+        return _truncated_div(months, 12)
+    return months
+
+
+def _add_months(days, months: Union[int, np.ndarray]):
+    if isinstance(days, np.ndarray):
+        result = add_months(days, months)
+        if result is not None:
+            return result
+    year, month, day = _civil_from_days(days)
+    year, month = divmod(year * 12 + (month - 1) + months, 12)
+    month = month + 1
+    days_in_month = _days_in_month(year, month)
+    if isinstance(day, int):
+        day = min(day, days_in_month)
+    else:
+        day = np.minimum(day, days_in_month)
+    return _days_from_civil(year, month, day)
+
+
+def shift(
+    ordinal: Ordinal,
+    *,
+    years: int = 0,
+    months: int = 0,
+    days: int = 0,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: int = 0,
+):
+    """Shift ordinals with the same semantics as `dateutil.relativedelta`.
+
+    Years and months are added first, clamping the day to the end of the resulting
+    month, and then days and the time offset are added, carrying whole days of the
+    seconds of day into the day ordinals.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        years (int, optional): number of years to add. Defaults to 0.
+        months (int, optional): number of months to add. Defaults to 0.
+        days (int, optional): number of days to add. Defaults to 0.
+        hours (int, optional): number of hours to add. Defaults to 0.
+        minutes (int, optional): number of minutes to add. Defaults to 0.
+        seconds (int, optional): number of seconds to add. Defaults to 0.
+
+    Returns:
+        (Ordinal): shifted day ordinals and seconds of day.
+    """
+    result_days = ordinal.days
+    total_months = years * 12 + months
+    if total_months:
+        result_days = _add_months(result_days, total_months)
+    result_days = result_days + days
+    result_seconds = ordinal.seconds
+    total_seconds = hours * 3600 + minutes * 60 + seconds
+    if total_seconds:
+        carry, result_seconds = divmod(result_seconds + total_seconds, 86400)
+        result_days = result_days + carry
+    return Ordinal(result_days, result_seconds)
+
+
+# Units of `start_of_period` and `end_of_period`, and their length in months.
+PERIOD_UNITS = {"week": 0, "month": 1, "quarter": 3, "year": 12}
+
+
+def _period_start(days, unit: str):
+    if unit not in PERIOD_UNITS:
+        raise ValueError(f'Unit "{unit}" is not one of {list(PERIOD_UNITS)}.')
+    if unit == "week":
+        return days - day_of_week(days)
+    year, month, day = _fields(days)
+    if unit == "month":
+        return days - (day - 1)
+    if unit == "quarter":
+        return _days_from_civil(year, month - (month - 1) % 3, 1)
+    return _days_from_civil(year, 1, 1)
+
+
+def start_of_period(ordinal: Ordinal, unit: str = "month") -> Ordinal:
+    """Return the first day of the period of ordinals, at midnight.
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        unit (str, optional): one of `"week"` (ISO week, from Monday), `"month"`,
+            `"quarter"` and `"year"`. Defaults to `"month"`.
+
+    Raises:
+        ValueError: if the unit is not valid.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    return Ordinal(_period_start(ordinal.days, unit), 0)
+
+
+def end_of_period(ordinal: Ordinal, unit: str = "month") -> Ordinal:
+    """Return the last day of the period of ordinals, at its last second (23:59:59).
+
+    Args:
+        ordinal (Ordinal): day ordinals and seconds of day.
+        unit (str, optional): one of `"week"` (ISO week, to Sunday), `"month"`,
+            `"quarter"` and `"year"`. Defaults to `"month"`.
+
+    Raises:
+        ValueError: if the unit is not valid.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    start = _period_start(ordinal.days, unit)
+    months = PERIOD_UNITS[unit]
+    # the period start is the first day of a month, which is never clamped
+    end = _add_months(start, months) - 1 if months else start + 6
+    return Ordinal(end, 86399)
+
+
+def _step_sign(months: int, days: int) -> int:
+    """Return the direction of a step of `months` and `days` (1 or -1)."""
+    if not months and not days:
+        raise ValueError("The step must not be zero.")
+    if months * days < 0:
+        raise ValueError("Months and days of the step must not have opposite signs.")
+    return 1 if months > 0 or days > 0 else -1
+
+
+def _seconds(ordinal: Ordinal):
+    return ordinal.days * 86400 + ordinal.seconds
+
+
+def sequence(
+    start: Ordinal, end: Ordinal, *, years: int = 0, months: int = 0, days: int = 0
+) -> Ordinal:
+    """Return the ordinals from `start` to `end` (inclusive) every step.
+
+    The k-th ordinal is `start` shifted by k steps (see `shift`), instead of the
+    previous ordinal shifted by one step, so that days clamped to the end of a month
+    (e.g. from January 31st to February 28th) do not change the following ordinals.
+
+    Args:
+        start (Ordinal): single day ordinal and seconds of day of the first value.
+        end (Ordinal): single day ordinal and seconds of day of the last value.
+        years (int, optional): number of years of each step. Defaults to 0.
+        months (int, optional): number of months of each step. Defaults to 0.
+        days (int, optional): number of days of each step. Defaults to 0.
+
+    Raises:
+        ValueError: if the step is zero or its months and days have opposite signs.
+
+    Returns:
+        (Ordinal): day ordinals and seconds of day.
+    """
+    total_months = years * 12 + months
+    sign = _step_sign(total_months, days)
+    # every month has at least 28 days, so this is an upper bound of the count
+    min_step_days = abs(total_months) * 28 + abs(days)
+    count = max(sign * (end.days - start.days), -1) // min_step_days + 2
+
+    steps = np.arange(count, dtype=np.int64)
+    result = np.full(count, start.days, dtype=np.int64)
+    if total_months:
+        result = _add_months(result, steps * total_months)
+    result = result + steps * days
+    past_end = sign * (result * 86400 + start.seconds) > sign * _seconds(end)
+    return Ordinal(result[: np.argmax(past_end)], start.seconds)
+
+
+def iter_sequence(
+    start: Ordinal, end: Ordinal, *, years: int = 0, months: int = 0, days: int = 0
+) -> Iterator[Ordinal]:
+    """Iterate over the ordinals from `start` to `end` (inclusive) every step, lazily.
+
+    The ordinals are the same as those of `sequence`, computed one at a time.
+
+    Args:
+        start (Ordinal): single day ordinal and seconds of day of the first value.
+        end (Ordinal): single day ordinal and seconds of day of the last value.
+        years (int, optional): number of years of each step. Defaults to 0.
+        months (int, optional): number of months of each step. Defaults to 0.
+        days (int, optional): number of days of each step. Defaults to 0.
+
+    Raises:
+        ValueError: if the step is zero or its months and days have opposite signs.
+
+    Returns:
+        (Iterator[Ordinal]): day ordinals and seconds of day.
+    """
+    sign = _step_sign(years * 12 + months, days)
+
+    def _iterate():
+        step = 0
+        while True:
+            ordinal = shift(
+                start, years=step * years, months=step * months, days=step * days
+            )
+            if sign * _seconds(ordinal) > sign * _seconds(end):
+                return
+            yield ordinal
+            step += 1
+
+    return _iterate()
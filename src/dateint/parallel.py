@@ -0,0 +1,132 @@
+"""Module for parallel execution of operations on large arrays, in a process pool.
+
+Arrays are split into contiguous blocks, one per worker. The input and the result are
+stored in shared memory, so that workers read their blocks and write their results
+directly, instead of pickling the arrays to and from the workers.
+"""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def get_workers(n_jobs: int) -> int:
+    """Return the number of workers of `n_jobs`.
+
+    Negative values count back from the number of CPUs: -1 means all of them, -2 all
+    but one, and so on.
+    """
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return a process pool with `workers` workers.
+
+    The last pool is reused if it has the same number of workers.
+    """
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        shutdown()
+        # forking a multi-threaded process (e.g. with Arrow threads) may deadlock
+        methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in methods else "spawn"
+        _executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method)
+        )
+        _executor_workers = workers
+    return _executor
+
+
+@atexit.register
+def shutdown():
+    """Shut down the process pool, if it has been started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+class _SharedArray(NamedTuple):
+    """Reference to an array in shared memory, which is pickled instead of the array."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _attach(shared: _SharedArray) -> Tuple[SharedMemory, np.ndarray]:
+    memory = SharedMemory(name=shared.name)
+    array = np.ndarray(shared.shape, dtype=shared.dtype, buffer=memory.buf)
+    return memory, array
+
+
+def _run_block(
+    function: Callable,
+    source: _SharedArray,
+    target: _SharedArray,
+    start: int,
+    stop: int,
+):
+    source_memory, values = _attach(source)
+    target_memory, result = _attach(target)
+    try:
+        result[start:stop] = function(values[start:stop])
+    finally:
+        # the arrays must be released before the shared memory is closed
+        del values, result
+        source_memory.close()
+        target_memory.close()
+
+
+def map_blocks(function: Callable, values: np.ndarray, n_jobs: int) -> np.ndarray:
+    """Apply a function to contiguous blocks of an array in a process pool.
+
+    Args:
+        function (Callable): picklable function that receives a block of `values` and
+            returns an array of the same length, whose dtype does not depend on the
+            values (e.g. fixed-width strings).
+        values (np.ndarray): one-dimensional array.
+        n_jobs (int): number of workers (see `get_workers`).
+
+    Returns:
+        (np.ndarray): concatenation of the results of every block.
+    """
+    workers = min(get_workers(n_jobs), len(values))
+    if workers <= 1:
+        return function(values)
+    # the dtype of the result is that of the result of any block
+    dtype = np.asarray(function(values[:1])).dtype
+
+    source_memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+    target_memory = SharedMemory(create=True, size=max(len(values) * dtype.itemsize, 1))
+    try:
+        source = _SharedArray(source_memory.name, values.shape, values.dtype.str)
+        target = _SharedArray(target_memory.name, values.shape, dtype.str)
+        np.ndarray(values.shape, values.dtype, buffer=source_memory.buf)[:] = values
+
+        bounds = np.linspace(0, len(values), workers + 1).astype(int)
+        executor = _get_executor(workers)
+        futures = [
+            executor.submit(_run_block, function, source, target, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        return np.ndarray(values.shape, dtype, buffer=target_memory.buf).copy()
+    finally:
+        source_memory.close()
+        source_memory.unlink()
+        target_memory.close()
+        target_memory.unlink()
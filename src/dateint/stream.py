@@ -0,0 +1,281 @@
+"""Module for chunked transformation of files larger than memory.
+
+Files are read in chunks of a bounded number of rows, each chunk is transformed and
+written out before the next one is read, so that memory usage does not depend on the
+size of the file. CSV files are read into pandas data frames and Parquet files into
+Arrow record batches (which requires `pyarrow`), whose columns are transformed without
+any conversion through pandas.
+
+Examples:
+    ```py
+    from dateint import stream
+
+    stream.transform_file(
+        "input.parquet", "output.parquet", ["date"], "add", months=1
+    )
+    ```
+
+    The same transformation from the command line:
+
+    ```sh
+    python -m dateint add input.parquet output.parquet --column date --months 1
+    ```
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .config import get_stream_chunk_size
+from .convert import _first_matching_format
+from .core import add, isoweekday, sub, weekday
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    Chunk = Union[pd.DataFrame, pa.RecordBatch]
+
+OPERATIONS: Dict[str, Callable] = {
+    "add": add,
+    "sub": sub,
+    "weekday": weekday,
+    "isoweekday": isoweekday,
+}
+
+# Operations that return days of week, whose pandas results are cast into a nullable
+# dtype, so that chunks with and without missing values have the same dtype.
+_DAY_OF_WEEK_OPERATIONS = (weekday, isoweekday)
+
+
+def _is_parquet(path: Union[str, Path]) -> bool:
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def read_csv(
+    path: Union[str, Path], columns: Sequence[str], chunksize: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV file in chunks.
+
+    The date/datetime columns are read as strings, so that their values are written
+    back exactly as formatted (e.g. without turning integers into floats in chunks
+    with missing values).
+
+    Args:
+        path (Union[str, Path]): path of the CSV file.
+        columns (Sequence[str]): names of the date/datetime columns.
+        chunksize (Optional[int], optional): number of rows of each chunk. Defaults to
+            `config.STREAM_CHUNK_SIZE`.
+
+    Returns:
+        (Iterator[pd.DataFrame]): chunks of the file.
+    """
+    import pandas as pd
+
+    with pd.read_csv(
+        path,
+        chunksize=chunksize or get_stream_chunk_size(),
+        dtype={column: str for column in columns},
+    ) as reader:
+        yield from reader
+
+
+def read_parquet(
+    path: Union[str, Path], chunksize: Optional[int] = None
+) -> Iterator[pa.RecordBatch]:
+    """Read a Parquet file in chunks.
+
+    Args:
+        path (Union[str, Path]): path of the Parquet file.
+        chunksize (Optional[int], optional): number of rows of each chunk. Defaults to
+            `config.STREAM_CHUNK_SIZE`.
+
+    Returns:
+        (Iterator[pa.RecordBatch]): chunks of the file.
+    """
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as file:
+        yield from file.iter_batches(batch_size=chunksize or get_stream_chunk_size())
+
+
+def _get_column(chunk: Chunk, column: str):
+    if hasattr(chunk, "schema"):
+        return chunk.column(column)
+    return chunk[column]
+
+
+def _set_column(chunk: Chunk, column: str, values) -> Chunk:
+    if hasattr(chunk, "schema"):
+        return chunk.set_column(chunk.schema.get_field_index(column), column, values)
+    chunk[column] = values
+    return chunk
+
+
+def _has_values(values) -> bool:
+    """Return whether a column of a chunk has any non-missing value."""
+    if hasattr(values, "null_count"):
+        return values.null_count < len(values)
+    return bool(values.notna().any())
+
+
+def _operate(function: Callable, values, **kwargs):
+    result = function(values, **kwargs)
+    if function in _DAY_OF_WEEK_OPERATIONS and not hasattr(result, "type"):
+        # missing values would otherwise turn the days of week into floats
+        return result.astype("Int8")
+    return result
+
+
+def transform(
+    chunks: Iterable[Chunk],
+    columns: Sequence[str],
+    operation: Union[str, Callable] = "add",
+    *,
+    fmt: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Chunk]:
+    """Apply an operation to columns of a sequence of chunks, lazily.
+
+    The format of each column is detected only once, from the first chunk with any
+    non-missing value in the column (with the same rules of every operation), and
+    used for every later chunk. Days of week of pandas chunks are `Int8` series,
+    whether the chunk has missing values or not.
+
+    Args:
+        chunks (Iterable[Chunk]): pandas data frames or Arrow record batches.
+        columns (Sequence[str]): names of the columns to transform.
+        operation (Union[str, Callable], optional): one of `"add"`, `"sub"`,
+            `"weekday"` and `"isoweekday"`, or a function with the same signature.
+            Defaults to `"add"`.
+        fmt (Optional[str], optional): format of the columns. Detected from the first
+            chunk with values if not specified.
+        **kwargs: extra arguments of the operation (e.g. `months=1`).
+
+    Returns:
+        (Iterator[Chunk]): transformed chunks.
+    """
+    function = OPERATIONS[operation] if isinstance(operation, str) else operation
+    formats: Dict[str, str] = {}
+    for chunk in chunks:
+        if len(formats) < len(columns) and not len(chunk):
+            # the format can not be detected from an empty chunk, which is kept as is
+            # (e.g. for the header of an empty CSV file)
+            yield chunk
+            continue
+        for column in columns:
+            values = _get_column(chunk, column)
+            if column not in formats:
+                if fmt is None and not _has_values(values):
+                    # missing values do not tell the format of the next chunks
+                    result = _operate(function, values, **kwargs)
+                    chunk = _set_column(chunk, column, result)
+                    continue
+                formats[column] = fmt or _first_matching_format(values)
+            result = _operate(function, values, fmt=formats[column], **kwargs)
+            chunk = _set_column(chunk, column, result)
+        yield chunk
+
+
+def write_csv(chunks: Iterable[Chunk], path: Union[str, Path]):
+    """Write a sequence of chunks into a CSV file, one chunk at a time.
+
+    Args:
+        chunks (Iterable[Chunk]): pandas data frames or Arrow record batches (all of
+            the same type).
+        path (Union[str, Path]): path of the CSV file.
+    """
+    writer = None
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            if hasattr(chunk, "schema"):
+                import pyarrow.csv
+
+                if writer is None:
+                    options = pyarrow.csv.WriteOptions(quoting_style="needed")
+                    writer = pyarrow.csv.CSVWriter(
+                        file, chunk.schema, write_options=options
+                    )
+                writer.write_batch(chunk)
+            else:
+                chunk.to_csv(file, header=file.tell() == 0, index=False)
+        if writer is not None:
+            writer.close()
+
+
+def write_parquet(chunks: Iterable[Chunk], path: Union[str, Path]):
+    """Write a sequence of chunks into a Parquet file, one chunk at a time.
+
+    The schema of the file is the schema of the first chunk, into which the other
+    chunks are cast. No file is written if there are no chunks.
+
+    Args:
+        chunks (Iterable[Chunk]): pandas data frames or Arrow record batches.
+        path (Union[str, Path]): path of the Parquet file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            if not hasattr(chunk, "schema"):
+                chunk = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, chunk.schema)
+            elif chunk.schema != writer.schema:
+                chunk = chunk.cast(writer.schema)
+            writer.write_batch(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def transform_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    columns: Sequence[str],
+    operation: Union[str, Callable] = "add",
+    *,
+    chunksize: Optional[int] = None,
+    fmt: Optional[str] = None,
+    **kwargs,
+):
+    """Apply an operation to columns of a CSV/Parquet file, chunk by chunk.
+
+    Files with a `.parquet`/`.pq` suffix are handled as Parquet files and any other
+    file as a CSV file.
+
+    Args:
+        input_path (Union[str, Path]): path of the input file.
+        output_path (Union[str, Path]): path of the output file.
+        columns (Sequence[str]): names of the columns to transform.
+        operation (Union[str, Callable], optional): one of `"add"`, `"sub"`,
+            `"weekday"` and `"isoweekday"`, or a function with the same signature.
+            Defaults to `"add"`.
+        chunksize (Optional[int], optional): number of rows of each chunk. Defaults to
+            `config.STREAM_CHUNK_SIZE`.
+        fmt (Optional[str], optional): format of the columns. Detected from the first
+            chunk with values if not specified.
+        **kwargs: extra arguments of the operation (e.g. `months=1`).
+    """
+    chunks: Iterable[Chunk]
+    if _is_parquet(input_path):
+        chunks = read_parquet(input_path, chunksize)
+    else:
+        chunks = read_csv(input_path, columns, chunksize)
+    transformed = transform(chunks, columns, operation, fmt=fmt, **kwargs)
+    if _is_parquet(output_path):
+        write_parquet(transformed, output_path)
+    else:
+        write_csv(transformed, output_path)
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dateint import add, weekday
+from dateint.arrow import (
+    array_to_ordinal,
+    from_ordinal,
+    ordinal_to_array,
+    to_ordinal,
+)
+from dateint.exception import FloatFormatError, FormatError
+from dateint.numeric import Ordinal
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    ["array", "fmt", "exp_days", "exp_seconds"],
+    [
+        (pa.array(["20220110", "19700101"]), "%Y%m%d", [19002, 0], [0, 0]),
+        (pa.array([b"20220110"], pa.large_binary()), "%Y%m%d", [19002], [0]),
+        (pa.array(["20220110 010203"]), "%Y%m%d %H%M%S", [19002], [3723]),
+        (
+            pa.array(["x", "2022-01-10", "1970-01-01"])[1:],
+            "%Y-%m-%d",
+            [19002, 0],
+            [0, 0],
+        ),
+        (pa.chunked_array([["202201"], ["197002"]]), "%Y%m", [18993, 31], [0, 0]),
+        (pa.chunked_array([], pa.string()), "%Y%m", [], []),
+    ],
+)
+def test_to_ordinal(array, fmt, exp_days, exp_seconds):
+    ordinal = to_ordinal(array, fmt)
+    assert list(ordinal.days) == exp_days
+    assert list(np.broadcast_to(ordinal.seconds, len(array))) == exp_seconds
+
+
+@pytest.mark.parametrize(
+    ["array", "fmt"],
+    [
+        (pa.array(["20220110", None]), "%Y%m%d"),
+        (pa.array([20220110]), "%Y%m%d"),
+        (pa.array(["Jan 2022"]), "%b %Y"),
+        (pa.array(["2022年01月"]), "%Y年%m月"),
+    ],
+)
+def test_to_ordinal_not_supported(array, fmt):
+    assert to_ordinal(array, fmt) is None
+
+
+@pytest.mark.parametrize(
+    ["array", "fmt"],
+    [
+        (pa.array(["20220110", "2022011"]), "%Y%m%d"),
+        (pa.array(["20220110", "2022011a"]), "%Y%m%d"),
+        (pa.array(["20220110", "20220230"]), "%Y%m%d"),
+        (pa.chunked_array([["20220110"], ["202201100"]]), "%Y%m%d"),
+    ],
+)
+def test_to_ordinal_with_invalid_values(array, fmt):
+    with pytest.raises(FormatError, match=array[-1].as_py()):
+        to_ordinal(array, fmt)
+
+
+@pytest.mark.parametrize(
+    ["days", "seconds", "fmt", "type", "exp_result"],
+    [
+        ([19002, 0], 0, "%Y%m%d", pa.string(), ["20220110", "19700101"]),
+        (
+            [19002],
+            [3723],
+            "%Y-%m-%d %H:%M:%S",
+            pa.large_string(),
+            ["2022-01-10 01:02:03"],
+        ),
+        ([19002], 0, "%Y%m", pa.binary(), [b"202201"]),
+        ([], 0, "%Y%m%d", pa.string(), []),
+    ],
+)
+def test_from_ordinal(days, seconds, fmt, type, exp_result):
+    result = from_ordinal(Ordinal(np.array(days), np.array(seconds)), fmt, type)
+    result.validate(full=True)
+    assert result.type == type
+    assert result.to_pylist() == exp_result
+
+
+@pytest.mark.parametrize(
+    ["dtype"],
+    [
+        (pd.StringDtype("pyarrow"),),
+        (pd.ArrowDtype(pa.string()),),
+        (pd.ArrowDtype(pa.large_string()),),
+    ],
+)
+def test_add_with_arrow_series(dtype):
+    dates = pd.Series(["20220131", "20220228"], dtype=dtype, name="date")
+    result = add(dates, months=1)
+    exp_result = pd.Series(["20220228", "20220328"], dtype=dtype, name="date")
+    pd.testing.assert_series_equal(result, exp_result)
+    assert weekday(dates).tolist() == [0, 0]
+
+
+def test_add_with_arrow_binary_series():
+    dates = pd.Series([b"20220131 235959"], dtype=pd.ArrowDtype(pa.binary()))
+    result = add(dates, days=1, out_fmt="%Y-%m-%d")
+    exp_result = pd.Series([b"2022-02-01"], dtype=pd.ArrowDtype(pa.binary()))
+    pd.testing.assert_series_equal(result, exp_result)
+
+
+@pytest.mark.parametrize(
+    ["array", "fmt", "exp_days", "exp_seconds"],
+    [
+        (pa.array([20220110, None]), "%Y%m%d", [19002, 0], [0, 0]),
+        (pa.array([202201.0, None]), "%Y%m", [18993, 0], [0, 0]),
+        (pa.array(["20220110", None]), "%Y%m%d", [19002, 0], [0, 0]),
+        (pa.array([None, b"2022-01-10"])[1:], "%Y-%m-%d", [19002], [0]),
+        (
+            pa.array(["Jan 10 2022 01:02", None]),
+            "%b %d %Y %H:%M",
+            [19002, 0],
+            [3720, 0],
+        ),
+        (
+            pa.chunked_array([[None], [20220110]], pa.int64()),
+            "%Y%m%d",
+            [0, 19002],
+            [0, 0],
+        ),
+    ],
+)
+def test_array_to_ordinal(array, fmt, exp_days, exp_seconds):
+    ordinal = array_to_ordinal(array, fmt)
+    assert list(ordinal.days) == exp_days
+    assert list(np.broadcast_to(ordinal.seconds, len(array))) == exp_seconds
+
+
+@pytest.mark.parametrize(
+    ["array", "fmt", "error"],
+    [
+        (pa.array([20220110, 20220230]), "%Y%m%d", FormatError),
+        (pa.array(["20220110", "2022011"]), "%Y%m%d", FormatError),
+        (pa.array(["Jan 10 2022", "Foo 10 2022"]), "%b %d %Y", FormatError),
+        (pa.array([20220110.5]), "%Y%m%d", FloatFormatError),
+    ],
+)
+def test_array_to_ordinal_with_invalid_values(array, fmt, error):
+    with pytest.raises(error):
+        array_to_ordinal(array, fmt)
+
+
+@pytest.mark.parametrize(
+    ["like", "fmt", "exp_result"],
+    [
+        (pa.array([1, None], pa.int32()), "%Y%m%d", [20220110, None]),
+        (pa.array([1.0, None]), "%Y%m", [202201.0, None]),
+        (pa.array(["x", None], pa.large_string()), "%Y-%m-%d", ["2022-01-10", None]),
+        (pa.array([b"x", None]), "%Y%m%d", [b"20220110", None]),
+        (pa.array(["x", None]), "%b %d %Y %H:%M", ["Jan 10 2022 01:02", None]),
+    ],
+)
+def test_ordinal_to_array(like, fmt, exp_result):
+    ordinal = Ordinal(np.array([19002, 0]), np.array([3720, 0]))
+    result = ordinal_to_array(ordinal, fmt, like)
+    result.validate(full=True)
+    assert result.type == like.type
+    assert result.to_pylist() == exp_result
@@ -0,0 +1,145 @@
+import sys
+
+import pytest
+
+from dateint import add, isoweekday, sub, weekday
+from dateint.backend import Backend, _backends, get_backend, register_backend
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    ["date", "kwargs", "exp_result"],
+    [
+        (
+            pa.array([20220131, None, 20200229]),
+            {"months": 1},
+            [20220228, None, 20200329],
+        ),
+        (pa.array([202201.0]), {"years": 1}, [202301.0]),
+        (pa.array(["20220131 235959", None]), {"days": 1}, ["20220201 235959", None]),
+        (pa.array([b"20220131"], pa.large_binary()), {"days": 1}, [b"20220201"]),
+        (
+            pa.array(["Jan 31 2022", None]),
+            {"months": 1, "fmt": "%b %d %Y"},
+            ["Feb 28 2022", None],
+        ),
+        (
+            pa.array(["20220131"]),
+            {"months": 1, "out_fmt": "%Y-%m-%d"},
+            ["2022-02-28"],
+        ),
+    ],
+)
+def test_add_with_arrow_array(date, kwargs, exp_result):
+    result = add(date, **kwargs)
+    assert isinstance(result, pa.Array)
+    assert result.type == date.type
+    assert result.to_pylist() == exp_result
+
+
+def test_sub_with_arrow_chunked_array():
+    date = pa.chunked_array([[20220331], [None, 20200229]])
+    result = sub(date, months=1)
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == [20220228, None, 20200129]
+
+
+@pytest.mark.parametrize(
+    "date", [pa.array([20220131]), pa.chunked_array([[20220131.0], [None]])]
+)
+def test_add_with_non_numeric_out_fmt_of_numeric_arrow_array(date):
+    with pytest.raises(ValueError, match='out_fmt "%Y-%m-%d"'):
+        add(date, days=1, out_fmt="%Y-%m-%d")
+
+
+def test_weekday_with_arrow_array():
+    date = pa.array([20220131, None, 20220206])
+    assert weekday(date).to_pylist() == [0, None, 6]
+    assert isoweekday(date).to_pylist() == [1, None, 7]
+    assert weekday(date).type == pa.int8()
+
+
+@pytest.mark.parametrize(
+    ["date", "exp_result"],
+    [
+        (pa.array([None, 20220131]), [None, 20220201]),
+        (pa.array([None, None, "20220131 235959"]), [None, None, "20220201 235959"]),
+        (pa.chunked_array([pa.nulls(1, pa.int64()), [20220131]]), [None, 20220201]),
+        (pa.array([], pa.int64()), []),
+        (pa.array([], pa.string()), []),
+        (pa.nulls(2, pa.int64()), [None, None]),
+    ],
+)
+def test_add_with_leading_nulls_or_empty_arrow_array(date, exp_result):
+    result = add(date, days=1)
+    assert type(result) is type(date)
+    assert result.type == date.type
+    assert result.to_pylist() == exp_result
+    assert weekday(date).to_pylist() == [None if d is None else 0 for d in exp_result]
+
+
+def test_polars_series_with_leading_nulls_or_empty():
+    pl = pytest.importorskip("polars")
+    result = add(pl.Series([None, 20220131]), days=1)
+    assert result.to_list() == [None, 20220201]
+    for dtype in (pl.Int64, pl.Utf8):
+        result = add(pl.Series("date", [], dtype=dtype), days=1)
+        assert isinstance(result, pl.Series)
+        assert result.dtype == dtype
+        assert result.len() == 0
+
+
+def test_polars_series():
+    pl = pytest.importorskip("polars")
+    date = pl.Series("date", [20220131, None], dtype=pl.Int32)
+    result = add(date, months=1)
+    assert isinstance(result, pl.Series)
+    assert result.name == "date"
+    assert result.dtype == pl.Int32
+    assert result.to_list() == [20220228, None]
+    assert sub(pl.Series(["20220131"]), days=31).to_list() == ["20211231"]
+    assert isoweekday(date).to_list() == [1, None]
+
+
+def test_register_backend():
+    class Wrapper:
+        def __init__(self, array):
+            self.array = array
+
+    register_backend(
+        Backend(
+            module=__name__,
+            is_instance=lambda value: isinstance(value, Wrapper),
+            to_arrow=lambda value: value.array,
+            from_arrow=lambda result, value: Wrapper(result),
+        )
+    )
+    try:
+        assert get_backend(Wrapper(None)) is _backends[0]
+        result = add(Wrapper(pa.array([20220131])), days=1)
+        assert isinstance(result, Wrapper)
+        assert result.array.to_pylist() == [20220201]
+    finally:
+        _backends.pop(0)
+
+
+def test_get_backend_without_module(monkeypatch):
+    monkeypatch.delitem(sys.modules, "pyarrow")
+    assert get_backend(pa.array([20220131])) is None
+
+
+def test_add_with_errors_and_out_of_range_results():
+    date = pa.array([99991231, None, 20220101, 20220231])
+    assert add(date, days=1, errors="coerce").to_pylist() == [
+        None,
+        None,
+        20220102,
+        None,
+    ]
+    assert add(date, days=1, errors="ignore").to_pylist() == [
+        99991231,
+        None,
+        20220102,
+        20220231,
+    ]
@@ -0,0 +1,153 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+import dateint as di
+from dateint import business
+
+
+@pytest.fixture(autouse=True)
+def holidays():
+    business.register_holidays("test", ["2022-05-16", "2022-05-17"], fmt="%Y-%m-%d")
+    yield
+    business._holidays.pop("test", None)
+
+
+def test_register_holidays():
+    holidays = business.get_holidays("test")
+    assert holidays.days == (19128, 19129)
+    assert holidays.weekmask == "1111100"
+    assert business.get_holidays() == business.Holidays(())
+
+
+def test_load_holidays(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("# holidays\n20221226\n\n20221225\n20221226\n")
+    business.load_holidays("file", path, weekmask="1111110")
+    holidays = business.get_holidays("file")
+    assert holidays.days == (19351, 19352)
+    assert holidays.weekmask == "1111110"
+    assert di.add_business_days(20221223, 1, calendar="file") == 20221224
+    assert di.add_business_days(20221224, 1, calendar="file") == 20221227
+
+
+def test_get_unregistered_holidays():
+    with pytest.raises(KeyError):
+        business.get_holidays("unregistered")
+
+
+def test_register_holidays_with_invalid_weekmask():
+    with pytest.raises(ValueError):
+        business.register_holidays("invalid", [], weekmask="11111")
+
+
+def test_business_calendar_is_cached():
+    holidays = business.get_holidays("test")
+    calendar = business.get_business_calendar(holidays)
+    assert business.get_business_calendar(holidays) is calendar
+
+
+@pytest.mark.parametrize(
+    ["date", "days", "calendar", "exp_result"],
+    [
+        (20220513, 3, None, 20220518),
+        (20220513, 1, "test", 20220518),
+        (20220514, 0, None, 20220516),
+        (20220514, 1, None, 20220517),
+        (20220514, -1, None, 20220513),
+        (20220518, -1, "test", 20220513),
+        ("20220513 101010", 1, "test", "20220518 101010"),
+        # out of the range of the calendar
+        (18991229, 2, None, 19000102),
+        (99991230, -1, None, 99991229),
+    ],
+)
+def test_add_business_days(date, days, calendar, exp_result):
+    assert di.add_business_days(date, days, calendar=calendar) == exp_result
+
+
+def test_add_business_days_with_pandas():
+    dates = pd.Series(["May 13 2022", None, "May 14 2022"], index=[2, 1, 0])
+    result = di.add_business_days(dates, 1, calendar="test", fmt="%b %d %Y")
+    assert result[[2, 0]].tolist() == ["May 18 2022", "May 19 2022"]
+    assert pd.isna(result[1])
+    assert result.index.tolist() == [2, 1, 0]
+
+    dates = pd.Series([20220512, 20220513] * 10_000)
+    result = di.add_business_days(dates, 1, calendar="test", n_jobs=2)
+    assert result.tolist() == [20220513, 20220518] * 10_000
+
+
+@pytest.mark.parametrize(
+    ["date", "fmt", "exp_result"],
+    [
+        (20220513, None, True),
+        (20220514, None, False),
+        (20220516, None, False),
+        ("2022-05-18", "%Y-%m-%d", True),
+        ([20220513, 20220516], None, [True, False]),
+        (np.array([20220513, 20220516]), None, np.array([True, False])),
+    ],
+)
+def test_is_business_day(date, fmt, exp_result):
+    result = di.is_business_day(date, calendar="test", fmt=fmt)
+    assert type(result) is type(exp_result)
+    assert np.array_equal(result, exp_result)
+
+
+def test_is_business_day_with_pandas():
+    dates = pd.Series(["20220513", None, "20220516"], name="date")
+    result = di.is_business_day(dates, calendar="test")
+    pd.testing.assert_series_equal(result, pd.Series([True, False, False], name="date"))
+
+
+def test_is_business_day_with_arrow():
+    pa = pytest.importorskip("pyarrow")
+    dates = pa.array(["20220513", None, "20220516"])
+    result = di.is_business_day(dates, calendar="test")
+    assert result.type == pa.bool_()
+    assert result.to_pylist() == [True, None, False]
+
+
+@pytest.mark.parametrize(
+    ["date", "other", "calendar", "exp_result"],
+    [
+        (20220520, 20220513, None, 5),
+        (20220520, 20220513, "test", 3),
+        (20220513, 20220520, "test", -3),
+        (20220515, 20220514, None, 0),
+        (19000105, 18991229, None, 5),
+    ],
+)
+def test_diff_in_business_days(date, other, calendar, exp_result):
+    result = di.diff(date, other, unit="business_days", calendar=calendar)
+    assert result == exp_result
+
+
+@given(
+    date=st.dates(datetime.date(1850, 1, 1), datetime.date(2250, 1, 1)),
+    other=st.dates(datetime.date(1850, 1, 1), datetime.date(2250, 1, 1)),
+    days=st.integers(-1000, 1000),
+)
+def test_business_days_match_numpy(date, other, days):
+    holidays = business.get_holidays("test")
+    calendar = np.busdaycalendar(holidays=np.array(holidays.days, "datetime64[D]"))
+    date_int, other_int = int(date.strftime("%Y%m%d")), int(other.strftime("%Y%m%d"))
+    date64, other64 = np.datetime64(date, "D"), np.datetime64(other, "D")
+
+    result = di.add_business_days(date_int, days, calendar="test")
+    exp_result = np.busday_offset(date64, days, roll="forward", busdaycal=calendar)
+    assert result == int(exp_result.astype(datetime.date).strftime("%Y%m%d"))
+    assert di.is_business_day(date_int, calendar="test") == np.is_busday(
+        date64, busdaycal=calendar
+    )
+    sign = 1 if other64 <= date64 else -1
+    exp_count = sign * np.busday_count(
+        min(date64, other64), max(date64, other64), busdaycal=calendar
+    )
+    result = di.diff(date_int, other_int, unit="business_days", calendar="test")
+    assert result == exp_count
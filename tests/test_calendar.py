@@ -0,0 +1,128 @@
+import datetime
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+from hypothesis import given
+from hypothesis import strategies as st
+
+from dateint.calendar import (
+    INVALID,
+    add_months,
+    get_calendar,
+    lookup_days,
+    lookup_fields,
+    lookup_iso_week,
+    lookup_month_end,
+    lookup_weekday,
+)
+from dateint.config import get_calendar_years, set_calendar_years
+from dateint.numeric import _add_months, day_of_week, to_ordinal
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+@pytest.fixture
+def calendar_years():
+    original_years = get_calendar_years()
+    yield
+    set_calendar_years(*original_years)
+
+
+def test_calendar_fields(calendar_years):
+    set_calendar_years(2019, 2021)
+    calendar = get_calendar()
+    for index in range(len(calendar.year)):
+        date = _EPOCH + datetime.timedelta(days=calendar.first_day + index)
+        iso_year, iso_week, _ = date.isocalendar()
+        next_date = date + datetime.timedelta(days=1)
+        assert calendar.year[index] == date.year
+        assert calendar.month[index] == date.month
+        assert calendar.day[index] == date.day
+        assert calendar.weekday[index] == date.weekday()
+        assert calendar.iso_year[index] == iso_year
+        assert calendar.iso_week[index] == iso_week
+        assert calendar.month_end[index] == (next_date.month != date.month)
+    assert calendar.first_day == (datetime.date(2019, 1, 1) - _EPOCH).days
+    assert calendar.last_day == (datetime.date(2021, 12, 31) - _EPOCH).days
+
+
+def test_lookup_days():
+    year = np.array([1970, 1969, 2000, 2022, 2022, 2022, 2022])
+    month = np.array([1, 12, 3, 2, 13, 0, 1])
+    day = np.array([1, 31, 1, 30, 1, 1, 32])
+    days = lookup_days(year, month, day)
+    assert list(days) == [0, -1, 11017] + [INVALID] * 4
+
+
+def test_lookup_days_out_of_range():
+    assert lookup_days(np.array([2022, 1800]), 1, 1) is None
+
+
+def test_lookup_fields():
+    year, month, day = lookup_fields(np.array([0, -1, 11017]))
+    assert list(year) == [1970, 1969, 2000]
+    assert list(month) == [1, 12, 3]
+    assert list(day) == [1, 31, 1]
+
+
+def test_lookup_fields_out_of_range():
+    assert lookup_fields(np.array([0, -100_000])) is None
+
+
+def test_lookup_week_fields():
+    # 2021-01-03 (Sunday), 2021-01-04 (Monday), 2022-02-28 (Monday)
+    days = np.array([18630, 18631, 19051])
+    assert list(lookup_weekday(days)) == [6, 0, 0]
+    iso_year, iso_week = lookup_iso_week(days)
+    assert list(iso_year) == [2020, 2021, 2022]
+    assert list(iso_week) == [53, 1, 9]
+    assert list(lookup_month_end(days)) == [False, False, True]
+
+
+def test_lookup_week_fields_out_of_range():
+    days = np.array([0, -100_000])
+    assert lookup_weekday(days) is None
+    assert lookup_iso_week(days) is None
+    assert lookup_month_end(days) is None
+
+
+def test_day_of_week_falls_back_out_of_calendar_range():
+    days = np.array([-100_000, 0, 100_000])
+    assert list(day_of_week(days)) == [
+        (_EPOCH + datetime.timedelta(days=int(day))).weekday() for day in days
+    ]
+
+
+@given(
+    st.lists(
+        st.dates(
+            min_value=datetime.date(1900, 1, 1), max_value=datetime.date(2200, 12, 31)
+        ),
+        min_size=1,
+        max_size=10,
+    ),
+    st.integers(-100, 100),
+)
+def test_add_months_matches_relativedelta(dates, months):
+    days = np.array([(date - _EPOCH).days for date in dates])
+    result = add_months(days, months)
+    exp_dates = [date + relativedelta(months=months) for date in dates]
+    if any(not 1900 <= date.year <= 2200 for date in exp_dates):
+        assert result is None
+    else:
+        assert list(result) == [(date - _EPOCH).days for date in exp_dates]
+
+
+def test_numeric_falls_back_out_of_calendar_range(calendar_years):
+    values = np.array([20220131, 20200229])
+    ordinal = to_ordinal(values, "%Y%m%d")
+    set_calendar_years(1, 1)
+    assert list(to_ordinal(values, "%Y%m%d").days) == list(ordinal.days)
+    assert list(_add_months(ordinal.days, 13)) == [19416, 18715]
+
+
+@pytest.mark.parametrize(["years"], [((2000, 1999),), ((0, 2000),), ((1, 10000),)])
+def test_set_calendar_years_with_invalid_years(years):
+    with pytest.raises(ValueError):
+        set_calendar_years(*years)
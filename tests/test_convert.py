@@ -2,8 +2,23 @@ import datetime
 
 import pandas as pd
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.pandas import range_indexes, series
 
-from dateint.convert import _first_matching_format, _from_date, _to_datetime
+from dateint import config
+from dateint.config import (
+    get_date_format,
+    get_format_candidates,
+    set_format_candidates,
+)
+from dateint.convert import (
+    _factorize,
+    _first_matching_format,
+    _from_date,
+    _shift_datetime,
+    _to_datetime,
+)
 from dateint.exception import FloatFormatError, FormatError
 
 
@@ -237,6 +252,11 @@ def test_first_matching_format(value, exp_result):
         (pd.Series([20221108235959, 20221108235959]), "%Y%m%d%H%M%S"),
         (pd.Series([20221108235950.0, 20221108235950.0]), "%Y%m%d%H%M%S"),
         (pd.Series(["20221108 235959", "20221108 235959"]), "%Y%m%d %H%M%S"),
+        (pd.Series([None, 202211.0]), "%Y%m"),
+        (pd.Series([None, None, 20221108], dtype="Int64"), "%Y%m%d"),
+        (pd.Series([None, "20221108 235959"], dtype="string"), "%Y%m%d %H%M%S"),
+        (pd.Series([None, "20221108"], dtype=object), "%Y%m%d"),
+        (pd.Series([None, None], dtype=float), get_date_format()),
     ],
 )
 def test_first_matching_format_with_pandas(value, exp_result):
@@ -276,3 +296,85 @@ def test_invalid_format_input(invalid_value):
 def test_invalid_format_input_with_pandas(invalid_value):
     with pytest.raises(FormatError, match=str(invalid_value.iloc[0])):
         _first_matching_format(invalid_value)
+
+
+@pytest.fixture
+def format_candidates():
+    original_candidates = get_format_candidates()
+    yield
+    set_format_candidates(original_candidates)
+
+
+@pytest.mark.parametrize(
+    ["candidates", "value", "exp_result"],
+    [
+        ([("%y%m%d", 6), ("%Y%m", 6)], 220110, "%y%m%d"),
+        ([("%Y%m", 6), ("%y%m%d", 6)], 220110, "%Y%m"),
+        ([("%Y%m", 6), ("%y%m%d", 6)], 220131, "%y%m%d"),
+        ([("%Y-%m-%d", 10), ("%d/%m/%Y", 10)], "10/01/2022", "%d/%m/%Y"),
+        ([("%d%m%Y", 8), ("%Y%m%d", 8)], "20220110", "%Y%m%d"),
+        ([("%d %b %Y", 11)], "10 Jan 2022", "%d %b %Y"),
+    ],
+)
+def test_first_matching_format_with_custom_candidates(
+    format_candidates, candidates, value, exp_result
+):
+    set_format_candidates(candidates)
+    assert _first_matching_format(value) == exp_result
+
+
+def test_first_matching_format_after_candidates_change(format_candidates):
+    assert _first_matching_format(20220110) == "%Y%m%d"
+    set_format_candidates([("%d%m%Y", 8)])
+    with pytest.raises(FormatError):
+        _first_matching_format(20220110)
+    assert _first_matching_format(10012022) == "%d%m%Y"
+
+
+@pytest.mark.parametrize(
+    ["value", "unique", "exp_factorized"],
+    [
+        (pd.Series([20220101] * 10 + [20220102]), None, True),
+        (pd.Series([20220101 + i for i in range(11)]), None, False),
+        (pd.Series([20220101 + i for i in range(11)]), True, True),
+        (pd.Series([20220101] * 11), False, False),
+        (pd.Series([None] * 11, dtype="float64"), True, False),
+    ],
+)
+def test_factorize(monkeypatch, value, unique, exp_factorized):
+    monkeypatch.setattr(config, "UNIQUE_MIN_SIZE", 10)
+    factorized = _factorize(value, unique)
+    assert (factorized is not None) is exp_factorized
+    if exp_factorized:
+        codes, uniques = factorized
+        assert uniques.dtype == value.dtype
+        assert list(uniques.to_numpy()[codes]) == list(value)
+
+
+def test_factorize_below_min_size():
+    assert _factorize(pd.Series([20220101] * 10), None) is None
+
+
+@given(
+    series(
+        elements=st.one_of(
+            st.none(),
+            st.datetimes(
+                min_value=datetime.datetime(1900, 1, 1),
+                max_value=datetime.datetime(2100, 1, 1),
+            ),
+        ),
+        dtype="datetime64[ns]",
+        index=range_indexes(1, 10),
+    ),
+    st.integers(-100, 100),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+)
+def test_shift_datetime_matches_date_offset(dates, years, months, days):
+    dates = dates.rename("dt")
+    result = _shift_datetime(dates, years=years, months=months, days=days)
+    exp_result = dates + pd.offsets.DateOffset(years=years, months=months, days=days)
+    assert list(result) == list(exp_result)
+    assert result.index.equals(dates.index)
+    assert result.name == "dt"
@@ -1,15 +1,21 @@
 import datetime
+import tracemalloc
+import warnings
+from functools import partial
 
+import numpy as np
 import pandas as pd
 import pytest
+from dateutil.relativedelta import relativedelta
 from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.pandas import range_indexes, series
 
 import dateint as di
+from dateint import config, convert
 from dateint.config import get_date_format
-
-# from dateint.exception import FormatError
+from dateint.exception import FormatError
+from dateint.numeric import Ordinal, from_ordinal
 
 
 def test_today():
@@ -179,3 +185,996 @@ def test_sub_is_inverse_add_with_pandas(dates, years, months, days):
     add_result = di.add(date_as_str, **kwargs)
     sub_result = di.sub(date_as_str, **negative_kwargs)
     assert add_result.equals(sub_result)
+
+
+@given(
+    series(
+        elements=st.dates(
+            min_value=datetime.date(1900, 1, 1), max_value=datetime.date(2100, 1, 1)
+        ),
+        index=range_indexes(1, 10),
+    ),
+    st.integers(-100, 100),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+)
+def test_add_with_integer_pandas_matches_scalar(dates, years, months, days):
+    fmt = "%Y%m%d"
+    date_as_int = pd.to_datetime(dates).dt.strftime(fmt).astype("int64")
+
+    kwargs = {"years": years, "months": months, "days": days}
+
+    result = di.add(date_as_int, **kwargs)
+    assert result.dtype == date_as_int.dtype
+    assert result.index.equals(date_as_int.index)
+    assert list(result) == [di.add(int(date), **kwargs) for date in date_as_int]
+
+
+def test_add_with_integer_pandas_keeps_dtype_and_name():
+    dates = pd.Series([20220131, 20220228], index=[10, 20], dtype="int32", name="dt")
+    result = di.add(dates, months=1)
+    exp_result = pd.Series([20220228, 20220328], index=[10, 20], dtype="int32")
+    assert result.equals(exp_result)
+    assert result.name == "dt"
+
+
+@pytest.mark.parametrize(
+    ["value", "kwargs", "exp_result"],
+    [
+        (20220510233000, {"hours": 1, "minutes": 15}, 20220511004500),
+        ("20220101 000000", {"seconds": -1}, "20211231 235959"),
+        ("20220131 120000", {"months": 1, "hours": 12}, "20220301 000000"),
+        (20220510, {"hours": 48}, 20220512),
+        (
+            pd.Series([20221231235959, 20220101000000]),
+            {"seconds": 1},
+            pd.Series([20230101000000, 20220101000001]),
+        ),
+    ],
+)
+def test_add_time(value, kwargs, exp_result):
+    result = di.add(value, **kwargs)
+    if isinstance(exp_result, pd.Series):
+        assert result.equals(exp_result)
+    else:
+        assert result == exp_result
+        assert type(result) is type(exp_result)
+
+
+def test_add_time_with_integer_pandas_does_not_format_text(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("dates were converted through text")
+
+    for name in ("_to_datetime", "_from_date", "text_to_ordinal", "ordinal_to_text"):
+        monkeypatch.setattr(convert, name, fail)
+    dates = pd.Series([20220510233000, 20220228120000])
+    result = di.sub(di.add(dates, days=1, hours=12), minutes=30)
+    assert result.tolist() == [20220512110000, 20220301233000]
+
+
+@given(
+    series(
+        elements=st.datetimes(
+            min_value=datetime.datetime(1900, 1, 1),
+            max_value=datetime.datetime(2100, 1, 1),
+        ),
+        index=range_indexes(1, 10),
+    ),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+    st.integers(-(10**5), 10**5),
+    st.integers(-(10**6), 10**6),
+)
+def test_add_time_with_integer_pandas_matches_relativedelta(
+    dates, months, hours, minutes, seconds
+):
+    fmt = "%Y%m%d%H%M%S"
+    dates = pd.to_datetime(dates).dt.floor("s")
+    date_as_int = dates.dt.strftime(fmt).astype("int64")
+    kwargs = {"months": months, "hours": hours, "minutes": minutes, "seconds": seconds}
+
+    result = di.add(date_as_int, **kwargs)
+    exp_result = [
+        int((date + relativedelta(**kwargs)).strftime(fmt))
+        for date in dates.dt.to_pydatetime()
+    ]
+    assert list(result) == exp_result
+    assert di.sub(date_as_int, **kwargs).tolist() == [
+        int((date - relativedelta(**kwargs)).strftime(fmt))
+        for date in dates.dt.to_pydatetime()
+    ]
+
+
+@pytest.mark.parametrize(
+    ["dates", "exp_result"],
+    [
+        (
+            pd.Series([None, 20220131.0, 20220228.0]),
+            pd.Series([None, 20220228.0, 20220328.0]),
+        ),
+        (
+            pd.Series([20220131, None, 20220228], dtype="Int64"),
+            pd.Series([20220228, None, 20220328], dtype="Int64"),
+        ),
+        (
+            pd.Series([None, "20220131", "20220228"], dtype="string[python]"),
+            pd.Series([None, "20220228", "20220328"], dtype="string[python]"),
+        ),
+        (
+            pd.Series(["20220131", "20220228", None], dtype="string[pyarrow]"),
+            pd.Series(["20220228", "20220328", None], dtype="string[pyarrow]"),
+        ),
+        (
+            pd.Series([None, "20220131 101010"], dtype=object),
+            pd.Series([None, "20220228 101010"], dtype=object),
+        ),
+    ],
+)
+def test_add_with_missing_values(monkeypatch, dates, exp_result):
+    def fail(*args, **kwargs):
+        raise AssertionError("dates were converted into datetimes")
+
+    monkeypatch.setattr(convert, "_to_datetime", fail)
+    result = di.add(dates, months=1)
+    assert result.dtype == dates.dtype
+    assert result.equals(exp_result)
+
+
+@given(
+    series(
+        elements=st.one_of(
+            st.none(),
+            st.dates(
+                min_value=datetime.date(1900, 1, 1),
+                max_value=datetime.date(2100, 1, 1),
+            ),
+        ),
+        index=range_indexes(1, 10),
+    ),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+)
+def test_add_with_missing_values_matches_dropna(dates, months, days):
+    date_as_float = pd.to_datetime(dates).dt.strftime("%Y%m%d").astype(float)
+    kwargs = {"months": months, "days": days}
+
+    result = di.add(date_as_float, fmt="%Y%m%d", **kwargs)
+    assert result.isna().equals(date_as_float.isna())
+    valid = date_as_float.dropna()
+    if len(valid):
+        assert result.dropna().equals(di.add(valid, **kwargs))
+
+
+def test_operations_with_missing_values():
+    dates = pd.Series([None, 20220510, 20220514], dtype="Int64")
+    assert di.weekday(dates).tolist()[1:] == [1, 5]
+    assert di.weekday(dates).isna().tolist() == [True, False, False]
+    assert di.is_business_day(dates).tolist() == [False, True, False]
+    assert di.diff(dates, 20220501).isna().tolist() == [True, False, False]
+    assert di.start_of(dates).tolist() == [pd.NA, 20220501, 20220501]
+
+
+@pytest.mark.parametrize(
+    ["value", "fmt", "exp_result"],
+    [
+        (20220229, None, False),
+        (20240229, None, True),
+        ("2022-01-31", None, False),
+        (20220131.5, "%Y%m%d", False),
+        ([20220131, 20220231, 2022013], None, [True, False, False]),
+        (("2022-01-31", "2022-1-31"), "%Y-%m-%d", (True, False)),
+        (np.array([b"20220131", b"20221331"]), None, np.array([True, False])),
+        (
+            pd.Series([None, 20220131.0, 20220131.5, 20221231.0], index=[3, 2, 1, 0]),
+            None,
+            pd.Series([False, True, False, True], index=[3, 2, 1, 0]),
+        ),
+        (
+            pd.Series(["Jan 31 2022", "Feb 30 2022", None]),
+            "%b %d %Y",
+            pd.Series([True, False, False]),
+        ),
+    ],
+)
+def test_validate(value, fmt, exp_result):
+    result = di.validate(value, fmt=fmt)
+    if isinstance(exp_result, pd.Series):
+        assert result.equals(exp_result)
+    elif isinstance(exp_result, np.ndarray):
+        assert np.array_equal(result, exp_result)
+    else:
+        assert result == exp_result
+
+
+@given(
+    series(elements=st.integers(0, 99999999), index=range_indexes(1, 20)),
+)
+def test_validate_matches_strptime(dates):
+    def is_valid(value):
+        try:
+            datetime.datetime.strptime(f"{value:08d}", "%Y%m%d")
+        except ValueError:
+            return False
+        return True
+
+    result = di.validate(dates, fmt="%Y%m%d")
+    assert result.tolist() == [is_valid(value) for value in dates]
+
+
+@pytest.mark.parametrize(
+    ["value", "errors", "exp_result"],
+    [
+        (
+            pd.Series([20220131, 20220231, 20220301], name="dt"),
+            "coerce",
+            pd.Series([20220228.0, None, 20220401.0], name="dt"),
+        ),
+        (
+            pd.Series([20220131, 20220231, 20220301], name="dt"),
+            "ignore",
+            pd.Series([20220228, 20220231, 20220401], name="dt"),
+        ),
+        (
+            pd.Series(["20220131", "2022013", None], dtype="string"),
+            "coerce",
+            pd.Series(["20220228", None, None], dtype="string"),
+        ),
+        (
+            np.array(["20220131", "20221331"]),
+            "coerce",
+            np.array(["20220228", None], dtype=object),
+        ),
+        (
+            np.array(["20220131", "20221331"]),
+            "ignore",
+            np.array(["20220228", "20221331"]),
+        ),
+        ([20220131, 2022], "coerce", [20220228, None]),
+        (20220231, "coerce", None),
+        ("20220231", "ignore", "20220231"),
+        (20220131, "coerce", 20220228),
+    ],
+)
+def test_add_with_errors(value, errors, exp_result):
+    result = di.add(value, months=1, errors=errors)
+    if isinstance(exp_result, pd.Series):
+        assert result.equals(exp_result)
+    elif isinstance(exp_result, np.ndarray):
+        assert result.tolist() == exp_result.tolist()
+    else:
+        assert result == exp_result
+
+
+@pytest.mark.parametrize(
+    ["value", "exp_valid", "exp_result"],
+    [
+        (pd.Series([20220231, 20220131]), [False, True], [None, 20220201]),
+        (
+            pd.Series(["bad", None, "20220131"]),
+            [False, False, True],
+            [None, None, "20220201"],
+        ),
+        (
+            np.array([20220231.0, np.inf, 20220131.0]),
+            [False, False, True],
+            [None, None, 20220201],
+        ),
+        (pd.Series(["bad", "worse"]), [False, False], [None, None]),
+    ],
+)
+def test_errors_with_invalid_first_value(value, exp_valid, exp_result):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert list(di.validate(value)) == exp_valid
+        result = di.add(value, days=1, errors="coerce")
+    assert [None if pd.isna(r) else r for r in result] == exp_result
+    ignored = di.add(value, days=1, errors="ignore")
+    assert [r for r, valid in zip(ignored, exp_valid) if valid] == [
+        r for r in exp_result if r is not None
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.array([99991231, 20220101, 20220231]),
+        pd.Series([99991231, 20220101, 20220231]),
+        pd.Series(["99991231", "20220101", "20220231"]),
+        [99991231, 20220101, 20220231],
+    ],
+)
+def test_errors_with_out_of_range_results(value):
+    result = di.add(value, days=1, errors="coerce")
+    assert [None if pd.isna(r) else int(r) for r in result] == [None, 20220102, None]
+    result = di.add(value, days=1, errors="ignore")
+    assert [int(r) for r in result] == [99991231, 20220102, 20220231]
+    with pytest.raises(OverflowError):
+        di.add(value[:2], days=1)
+    assert di.add(99991231, days=1, errors="coerce") is None
+
+
+def test_errors_with_out_of_range_results_in_blocks():
+    values = np.arange(20_000) % 28 + 20220101
+    values[[3, 10_000, 19_999]] = 99991231
+    result = di.add(values, days=1, errors="coerce")
+    assert np.flatnonzero(np.equal(result, None)).tolist() == [3, 10_000, 19_999]
+    assert result[0] == 20220102
+
+
+def test_add_with_errors_raise():
+    dates = pd.Series([20220131, 20220231])
+    with pytest.raises(FormatError):
+        di.add(dates, days=1)
+    with pytest.raises(ValueError, match="errors"):
+        di.sub(dates, days=1, errors="skip")
+
+
+def test_add_with_errors_with_arrow():
+    pa = pytest.importorskip("pyarrow")
+    dates = pa.array(["20220131", "bad", None])
+    assert di.add(dates, days=1, errors="coerce").to_pylist() == [
+        "20220201",
+        None,
+        None,
+    ]
+    assert di.add(dates, days=1, errors="ignore").to_pylist() == [
+        "20220201",
+        "bad",
+        None,
+    ]
+    assert di.validate(dates).to_pylist() == [True, False, False]
+
+
+def test_weekday_with_errors():
+    dates = pd.Series([20220131, 20220231, 20220201])
+    assert di.weekday(dates, errors="coerce").tolist()[::2] == [0, 1]
+    assert di.isoweekday(dates, errors="coerce").isna().tolist() == [
+        False,
+        True,
+        False,
+    ]
+    assert di.weekday([20220131, 1], fmt="%Y%m%d", errors="coerce") == [0, None]
+    with pytest.raises(ValueError, match="ignore"):
+        di.weekday(dates, errors="ignore")
+
+
+@pytest.mark.parametrize(
+    ["dates", "out"],
+    [
+        (np.array([20220131, 20220228, 20221231, 20240229]), np.empty(4, np.int64)),
+        (np.array(["20220131", "20220228", "20221231", "20240229"]), np.empty(4, "U8")),
+        (
+            pd.Series([20220131, 20220228, 20221231, 20240229], index=[3, 2, 1, 0]),
+            pd.Series(np.zeros(4, np.int64)),
+        ),
+        (
+            pd.Series(["20220131", None, "20221231", "20240229"], dtype="string"),
+            pd.Series([""] * 4, dtype="string"),
+        ),
+    ],
+)
+def test_add_with_out(monkeypatch, dates, out):
+    monkeypatch.setattr(config, "BLOCK_SIZE", 3)
+    exp_result = di.add(dates, months=1, days=1)
+    result = di.add(dates, months=1, days=1, out=out)
+    assert result is out
+    assert list(out) == list(exp_result)
+
+
+def test_add_inplace():
+    dates = pd.Series([20220131, 20220228], index=[10, 20], name="dt")
+    assert di.add(dates, months=1, inplace=True) is None
+    assert dates.equals(pd.Series([20220228, 20220328], index=[10, 20], name="dt"))
+    values = np.array(["20220131", "20220228"])
+    assert di.sub(values, days=1, inplace=True) is None
+    assert values.tolist() == ["20220130", "20220227"]
+
+
+def test_weekday_with_out():
+    dates = pd.Series([20220131, 20220201, 20220206])
+    out = np.empty(3, dtype=np.int8)
+    assert di.isoweekday(dates, out=out) is out
+    assert out.tolist() == [1, 2, 7]
+    di.weekday(dates, inplace=True)
+    assert dates.tolist() == [0, 1, 6]
+
+
+@pytest.mark.parametrize(
+    ["date", "out", "exception"],
+    [
+        (20220131, np.empty(1, np.int64), TypeError),
+        ([20220131], np.empty(1, np.int64), TypeError),
+        (np.array([20220131]), [0], TypeError),
+        (np.array([20220131, 20220201]), np.empty(1, np.int64), ValueError),
+    ],
+)
+def test_add_with_invalid_out(date, out, exception):
+    with pytest.raises(exception):
+        di.add(date, days=1, out=out)
+
+
+@pytest.mark.parametrize(
+    ["date", "kwargs", "out", "exception"],
+    [
+        (
+            np.array(["20220131"]),
+            {"out_fmt": "%Y-%m-%d"},
+            np.empty(1, "U8"),
+            ValueError,
+        ),
+        (pd.Series(["20220131"]), {}, np.empty(1, "U7"), ValueError),
+        (np.array([20220131120000]), {}, np.empty(1, np.int32), ValueError),
+        (np.array([20220131]), {}, np.empty(1, np.int8), ValueError),
+        (np.array([20220131]), {}, np.empty(1, np.bool_), TypeError),
+        (pd.Series([20220131, None]), {}, np.empty(2, np.int64), TypeError),
+        (
+            pd.Series([20220131, 20220231]),
+            {"errors": "coerce"},
+            pd.Series([0, 0]),
+            TypeError,
+        ),
+        (np.array([20220131, 20220231]), {"errors": "coerce"}, np.empty(2), None),
+        (
+            pd.Series([20220131, 20220231]),
+            {"errors": "coerce"},
+            pd.Series([0, 0], dtype="Int64"),
+            None,
+        ),
+    ],
+)
+def test_add_with_out_of_other_dtype(date, kwargs, out, exception):
+    original = out.copy()
+    if exception is None:
+        di.add(date, days=1, out=out, **kwargs)
+        assert list(out)[0] == 20220201
+        assert pd.isna(list(out)[1])
+        return
+    with pytest.raises(exception):
+        di.add(date, days=1, out=out, **kwargs)
+    # nothing is written, and the dtype is kept
+    assert out.dtype == original.dtype
+    np.testing.assert_array_equal(np.asarray(out), np.asarray(original))
+
+
+def test_add_inplace_with_wider_out_fmt():
+    values = np.array(["20220131", "20220228"])
+    with pytest.raises(ValueError, match="U8"):
+        di.add(values, days=1, out_fmt="%Y-%m-%d", inplace=True)
+    assert values.tolist() == ["20220131", "20220228"]
+
+
+def test_weekday_with_missing_values_into_integer_out():
+    with pytest.raises(TypeError):
+        di.weekday(pd.Series([20220131, None]), out=np.empty(2, np.int8))
+    out = np.empty(2)
+    di.weekday(pd.Series([20220131, None]), out=out)
+    assert out[0] == 0 and np.isnan(out[1])
+
+
+@pytest.mark.parametrize(
+    ["operation", "out_dtype"],
+    [
+        (partial(di.add, months=1, days=1), np.int64),
+        (partial(di.sub, years=1), np.int64),
+        (di.weekday, np.int8),
+    ],
+)
+def test_out_allocates_no_temporary_of_input_size(operation, out_dtype):
+    days = np.arange(2_000_000) % 20_000
+    dates = from_ordinal(Ordinal(days, 0), "%Y%m%d")
+    out = np.empty(len(dates), dtype=out_dtype)
+    operation(dates[:10], out=out[:10])
+
+    tracemalloc.start()
+    try:
+        operation(dates, out=out)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < dates.nbytes
+
+
+@pytest.mark.parametrize(
+    ["value", "exp_result"],
+    [
+        ("20220131", "20220228"),
+        ("202201", "202202"),
+        ("20220131235959", "20220228235959"),
+        ("20220131 235959", "20220228 235959"),
+        (20220131.0, 20220228.0),
+    ],
+)
+def test_add_keeps_scalar_type(value, exp_result):
+    result = di.add(value, months=1)
+    assert result == exp_result
+    assert type(result) is type(exp_result)
+
+
+def test_today_with_fmt():
+    assert di.today(fmt="%Y%m") == int(datetime.date.today().strftime("%Y%m"))
+
+
+@pytest.mark.parametrize(
+    ["value", "fmt", "out_fmt", "exp_result"],
+    [
+        (20220131, "%Y%m%d", None, 20220228),
+        (1022022, "%d%m%Y", None, 1032022),
+        ("31/01/2022", "%d/%m/%Y", None, "28/02/2022"),
+        ("31 Jan 2022", "%d %b %Y", None, "28 Feb 2022"),
+        (20220131, "%Y%m%d", "%Y%m", 202202),
+        ("20220131", "%Y%m%d", "%Y-%m-%d", "2022-02-28"),
+        ("20220131", "%Y%m%d", "%d %b %Y", "28 Feb 2022"),
+        (
+            pd.Series([20220131, 20220130]),
+            "%Y%m%d",
+            "%Y%m",
+            pd.Series([202202, 202202]),
+        ),
+        (
+            pd.Series(["31/01/2022", "30/01/2022"]),
+            "%d/%m/%Y",
+            "%Y%m%d",
+            pd.Series(["20220228", "20220228"]),
+        ),
+    ],
+)
+def test_add_with_fmt(value, fmt, out_fmt, exp_result):
+    result = di.add(value, months=1, fmt=fmt, out_fmt=out_fmt)
+    if isinstance(exp_result, pd.Series):
+        assert list(result) == list(exp_result)
+    else:
+        assert result == exp_result
+        assert type(result) is type(exp_result)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        20220131,
+        20220131.0,
+        [20220131],
+        np.array([20220131]),
+        pd.Series([20220131]),
+        pd.Series([20220131, None], dtype="Int64"),
+    ],
+)
+def test_add_with_non_numeric_out_fmt_of_numeric_value(value):
+    with pytest.raises(ValueError, match='out_fmt "%Y-%m-%d"'):
+        di.add(value, days=1, out_fmt="%Y-%m-%d")
+    with pytest.raises(ValueError, match='out_fmt "%Y-%m-%d"'):
+        di.add(value, days=1, out_fmt="%Y-%m-%d", errors="coerce")
+
+
+def test_range_with_non_numeric_out_fmt_of_numeric_start():
+    with pytest.raises(ValueError, match='out_fmt "%Y-%m-%d"'):
+        di.range(20220131, 20220202, out_fmt="%Y-%m-%d")
+
+
+def test_add_with_fmt_not_matching_value():
+    with pytest.raises(FormatError):
+        di.add(20220131, days=1, fmt="%Y%m")
+
+
+@pytest.mark.parametrize(
+    ["date", "fmt", "exp_weekday"],
+    [
+        (202207, None, 4),
+        (20220703, None, 6),
+        (20220703235959, None, 6),
+        ("20220703 235959", None, 6),
+        (3072022, "%d%m%Y", 6),
+        ("03 Jul 2022", "%d %b %Y", 6),
+    ],
+)
+def test_weekday_with_fmt(date, fmt, exp_weekday):
+    assert di.weekday(date, fmt=fmt) == exp_weekday
+    assert di.isoweekday(date, fmt=fmt) == exp_weekday + 1
+
+
+@pytest.mark.parametrize(
+    ["dates", "fmt"],
+    [
+        (pd.Series([202207, 202208]), None),
+        (pd.Series(["202207", "202208"]), None),
+        (pd.Series([1072022, 1082022]), "%d%m%Y"),
+    ],
+)
+def test_weekday_with_pandas_and_fmt(dates, fmt):
+    assert list(di.weekday(dates, fmt=fmt)) == [4, 0]
+    assert list(di.isoweekday(dates, fmt=fmt)) == [5, 1]
+
+
+@pytest.mark.parametrize(
+    ["dates"],
+    [
+        (pd.Series([20220131, 20220131, 20220228, 20220131], dtype="int32"),),
+        (pd.Series(["20220131", "20220131", "20220228", "20220131"]),),
+        (pd.Series([20220131.0, 20220131.0, 20220228.0, None]),),
+    ],
+)
+@pytest.mark.parametrize("unique", [None, False, True])
+def test_add_with_unique(dates, unique):
+    dates = dates.set_axis([10, 20, 30, 40]).rename("dt")
+    result = di.add(dates, months=1, days=1, unique=unique)
+    exp_result = di.add(dates, months=1, days=1, unique=False)
+    assert result.equals(exp_result)
+    assert result.name == "dt"
+
+
+@pytest.mark.parametrize(
+    ["dates"],
+    [
+        (pd.Series([20220703, 20220704]),),
+        (pd.Series(["20220703", "20220704"]),),
+        (pd.Series(["20220703 235959", "20220704 000000"]),),
+    ],
+)
+def test_weekday_with_pandas_is_int8(dates):
+    dates = dates.set_axis([10, 20]).rename("dt")
+    result = di.weekday(dates)
+    assert result.dtype == "int8"
+    assert list(result) == [6, 0]
+    assert list(result.index) == [10, 20]
+    assert result.name == "dt"
+    assert di.isoweekday(dates).dtype == "int8"
+
+
+def test_weekday_with_pandas_and_missing_values():
+    dates = pd.Series(["20220703", None], dtype=object)
+    assert list(di.weekday(dates).fillna(-1)) == [6, -1]
+
+
+@pytest.mark.parametrize(
+    ["dates", "fmt"],
+    [
+        (np.array([20220703, 20220704], dtype="int32"), None),
+        (np.array([20220703, 20220704]), None),
+        (np.array(["20220703", "20220704"]), None),
+        (np.array([b"20220703", b"20220704"]), None),
+        (np.array(["03/07/2022", "04/07/2022"]), "%d/%m/%Y"),
+        (np.array(["03 Jul 2022", "04 Jul 2022"]), "%d %b %Y"),
+    ],
+)
+def test_weekday_with_numpy(dates, fmt):
+    result = di.weekday(dates, fmt=fmt)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == "int8"
+    assert list(result) == [6, 0]
+    assert list(di.isoweekday(dates, fmt=fmt)) == [7, 1]
+
+
+def test_weekday_with_invalid_string_series():
+    with pytest.raises(FormatError):
+        di.weekday(pd.Series(["20220703", "202207031"]))
+
+
+@pytest.mark.parametrize(
+    ["dates", "fmt", "out_fmt", "exp_result"],
+    [
+        (
+            np.array([20220131, 20220228], dtype="int32"),
+            None,
+            None,
+            np.array([20220228, 20220328], dtype="int32"),
+        ),
+        (
+            np.array(["20220131", "20220228"]),
+            None,
+            None,
+            np.array(["20220228", "20220328"]),
+        ),
+        (
+            np.array([b"20220131", b"20220228"]),
+            None,
+            None,
+            np.array([b"20220228", b"20220328"]),
+        ),
+        (
+            np.array(["20220131", "20220228"]),
+            None,
+            "%Y-%m-%d",
+            np.array(["2022-02-28", "2022-03-28"]),
+        ),
+        (
+            np.array(["31 Jan 2022", "28 Feb 2022"]),
+            "%d %b %Y",
+            None,
+            np.array(["28 Feb 2022", "28 Mar 2022"]),
+        ),
+        (
+            np.array([20220131.0, 20220228.0]),
+            None,
+            None,
+            np.array([20220228.0, 20220328.0]),
+        ),
+    ],
+)
+def test_add_with_numpy(dates, fmt, out_fmt, exp_result):
+    result = di.add(dates, months=1, fmt=fmt, out_fmt=out_fmt)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == exp_result.dtype
+    assert list(result) == list(exp_result)
+    shifted = di.add(dates, days=1, fmt=fmt, out_fmt=out_fmt)
+    assert list(di.sub(shifted, days=1, fmt=out_fmt or fmt)) == list(
+        di.add(dates, fmt=fmt, out_fmt=out_fmt)
+    )
+
+
+@pytest.mark.parametrize(
+    ["dates", "exp_result"],
+    [
+        ([20220131, 20220228], [20220228, 20220328]),
+        (("20220131", "20220228"), ("20220228", "20220328")),
+        ([20220131.0], [20220228.0]),
+    ],
+)
+def test_add_with_sequence(dates, exp_result):
+    result = di.add(dates, months=1)
+    assert result == exp_result
+    assert [type(r) for r in result] == [type(r) for r in exp_result]
+    assert di.weekday(dates) == type(dates)(
+        datetime.date(int(str(d)[:4]), int(str(d)[4:6]), int(str(d)[6:8])).weekday()
+        for d in dates
+    )
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        np.array([], dtype=np.int64),
+        np.array([], dtype="U8"),
+        np.array([], dtype=np.float64),
+        [],
+        (),
+    ],
+)
+def test_empty_sequence(dates):
+    for result in (di.add(dates, days=1), di.sub(dates, months=1)):
+        assert type(result) is type(dates)
+        assert len(result) == 0
+        if isinstance(dates, np.ndarray):
+            assert result.dtype == dates.dtype
+    assert len(di.weekday(dates)) == 0
+    assert len(di.validate(dates)) == 0
+    assert len(di.add(dates, days=1, errors="coerce")) == 0
+
+
+@pytest.mark.parametrize(
+    ["date", "other", "unit", "exp_result"],
+    [
+        (20220510, 20220425, "days", 15),
+        (20220425, 20220510, "days", -15),
+        ("20220510 000000", "20220509 000001", "days", 0),
+        ("20220509 000001", "20220510 000000", "days", 0),
+        (20220228, 20220131, "months", 1),
+        (20220131, 20220228, "months", 0),
+        (20220331, 20220131, "months", 2),
+        (202201, 202112, "months", 1),
+        (20240228, 20230301, "years", 0),
+        (20240229, 20200229, "years", 4),
+        (20200229, 20240229, "years", -4),
+        ("20220110 120000", 20211231, "days", 10),
+    ],
+)
+def test_diff(date, other, unit, exp_result):
+    result = di.diff(date, other, unit=unit)
+    assert type(result) is int
+    assert result == exp_result
+
+
+@given(
+    st.datetimes(datetime.datetime(1800, 1, 1), datetime.datetime(2300, 1, 1)),
+    st.datetimes(datetime.datetime(1800, 1, 1), datetime.datetime(2300, 1, 1)),
+)
+def test_diff_matches_relativedelta(date, other):
+    from dateutil.relativedelta import relativedelta
+
+    fmt = "%Y%m%d%H%M%S"
+    date, other = date.replace(microsecond=0), other.replace(microsecond=0)
+    delta = relativedelta(date, other)
+    dates = pd.Series([date.strftime(fmt)] * 2)
+    for unit, exp_result in [
+        ("days", int((date - other).total_seconds() / 86400)),
+        ("months", delta.years * 12 + delta.months),
+        ("years", delta.years),
+    ]:
+        assert di.diff(date.strftime(fmt), other.strftime(fmt), unit=unit) == exp_result
+        result = di.diff(dates, int(other.strftime(fmt)), unit=unit, fmt=fmt)
+        assert result.tolist() == [exp_result] * 2
+
+
+@pytest.mark.parametrize(
+    ["date", "other"],
+    [
+        (20220228, 20220131),
+        (20220131, 20220228),
+        (20220430, 20220331),
+        (20220331, 20220430),
+        (20220227, 20220131),
+        (20240229, 20240131),
+        (20230228, 20200229),
+        (20200229, 20230228),
+        (20240229, 20200229),
+        (20240228, 20200229),
+        (20200228, 20240229),
+        ("20220228 000000", "20220131 000001"),
+        ("20220228 120000", "20220131 120000"),
+    ],
+)
+def test_diff_at_month_end_matches_relativedelta(date, other):
+    from dateutil.relativedelta import relativedelta
+
+    fmt = "%Y%m%d" if isinstance(date, int) else "%Y%m%d %H%M%S"
+    date_time = datetime.datetime.strptime(str(date), fmt)
+    other_time = datetime.datetime.strptime(str(other), fmt)
+    delta = relativedelta(date_time, other_time)
+    assert di.diff(date, other, unit="months") == delta.years * 12 + delta.months
+    assert di.diff(date, other, unit="years") == delta.years
+    dates = np.array([date, date])
+    assert (
+        di.diff(dates, other, unit="months").tolist()
+        == [delta.years * 12 + delta.months] * 2
+    )
+
+
+def test_diff_with_pandas():
+    dates = pd.Series(["20220310", None, "20220105"], index=[3, 2, 1], name="date")
+    others = np.array([20220301, 20220301, 20220301])
+    result = di.diff(dates, others, unit="months", other_fmt="%Y%m%d")
+    exp_result = pd.Series([0, np.nan, -1], index=[3, 2, 1], name="date")
+    pd.testing.assert_series_equal(result, exp_result)
+
+
+@pytest.mark.parametrize(
+    ["date", "other", "exp_result"],
+    [
+        ([20220110, 20220201], 20220101, [9, 31]),
+        (20220101, (20220110, 20220201), (-9, -31)),
+        (np.array(["20220110"]), np.array([20220101]), np.array([9])),
+    ],
+)
+def test_diff_with_sequences(date, other, exp_result):
+    result = di.diff(date, other)
+    assert type(result) is type(exp_result)
+    assert list(result) == list(exp_result)
+
+
+def test_diff_with_invalid_unit():
+    with pytest.raises(ValueError, match="business_days"):
+        di.diff(20220110, 20220101, unit="weeks")
+    with pytest.raises(ValueError, match="business_days"):
+        di.diff([20220110], [20220101], unit="weeks")
+
+
+@pytest.mark.parametrize(
+    ["start", "end", "kwargs", "exp_result"],
+    [
+        (20220130, 20220202, {}, [20220130, 20220131, 20220201, 20220202]),
+        (202211, 202302, {}, [202211, 202212, 202301, 202302]),
+        (2020, 2022, {"fmt": "%Y"}, [2020, 2021, 2022]),
+        (
+            "20220131",
+            "20220430",
+            {"step_months": 1, "out_fmt": "%Y-%m-%d"},
+            ["2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30"],
+        ),
+        (20220301, 20220215, {"step_days": -7}, [20220301, 20220222, 20220215]),
+        (20220105, 20220101, {}, []),
+        (20200229, 20240229, {"step_years": 2}, [20200229, 20220228, 20240229]),
+        (
+            "20220101 120000",
+            "20220103 115959",
+            {},
+            ["20220101 120000", "20220102 120000"],
+        ),
+        (
+            "2022-01-01T10:00",
+            "2022-01-02T10:00",
+            {"fmt": "%Y-%m-%dT%H:%M"},
+            ["2022-01-01T10:00", "2022-01-02T10:00"],
+        ),
+    ],
+)
+def test_range(start, end, kwargs, exp_result):
+    result = di.range(start, end, **kwargs)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == exp_result
+    assert list(di.range(start, end, lazy=True, **kwargs)) == exp_result
+
+
+def test_range_preserves_type():
+    assert di.range(20220101, 20220102).dtype == np.int64
+    assert di.range(20220101.0, 20220102.0).tolist() == [20220101.0, 20220102.0]
+    result = di.range("20220101", "20220102", lazy=True)
+    assert next(result) == "20220101"
+
+
+def test_range_is_lazy():
+    result = di.range(20220101, 99991231, lazy=True)
+    assert [next(result) for _ in range(3)] == [20220101, 20220102, 20220103]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"step_years": 1, "step_months": -12}, {"step_months": 1, "step_days": -1}],
+)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_range_with_invalid_step(kwargs, lazy):
+    with pytest.raises(ValueError):
+        di.range(20220101, 20221231, lazy=lazy, **kwargs)
+
+
+@given(
+    start=st.dates(datetime.date(1900, 1, 1), datetime.date(2100, 1, 1)),
+    days=st.integers(0, 1000),
+    step_months=st.integers(0, 24),
+    step_days=st.integers(1, 100),
+)
+def test_range_matches_add(start, days, step_months, step_days):
+    end = start + datetime.timedelta(days=days)
+    start_int, end_int = int(start.strftime("%Y%m%d")), int(end.strftime("%Y%m%d"))
+    result = di.range(start_int, end_int, step_months=step_months, step_days=step_days)
+    steps = np.arange(len(result))
+    exp_result = [
+        di.add(start_int, months=step * step_months, days=step * step_days)
+        for step in steps.tolist()
+    ]
+    assert result.tolist() == exp_result
+    assert result[-1] <= end_int
+    # every step is added to the start, not to the previous date
+    step = len(result)
+    assert di.add(start_int, months=step * step_months, days=step * step_days) > end_int
+
+
+@pytest.mark.parametrize(
+    ["date", "unit", "exp_start", "exp_end"],
+    [
+        (20220510, "month", 20220501, 20220531),
+        (20200215, "month", 20200201, 20200229),
+        (20220510, "quarter", 20220401, 20220630),
+        (20221115, "quarter", 20221001, 20221231),
+        (20220510, "year", 20220101, 20221231),
+        (20220510, "week", 20220509, 20220515),
+        (20221231, "week", 20221226, 20230101),
+        (202205, "quarter", 202204, 202206),
+        (20220510101010, "month", 20220501000000, 20220531235959),
+        ("20220510 101010", "year", "20220101 000000", "20221231 235959"),
+        (18000101, "week", 17991230, 18000105),
+    ],
+)
+def test_start_and_end_of(date, unit, exp_start, exp_end):
+    assert di.start_of(date, unit) == exp_start
+    assert di.end_of(date, unit) == exp_end
+
+
+@pytest.mark.parametrize("unit", ["week", "month", "quarter", "year"])
+def test_start_and_end_of_with_pandas(unit):
+    dates = pd.Series(["May 10 2022 10:10", None], index=[1, 0], name="date")
+    fmt = "%b %d %Y %H:%M"
+    starts = di.start_of(dates, unit, fmt=fmt)
+    ends = di.end_of(dates, unit, fmt=fmt)
+    assert starts.index.tolist() == ends.index.tolist() == [1, 0]
+    assert starts.name == ends.name == "date"
+    assert pd.isna(starts[0]) and pd.isna(ends[0])
+    exp_start = di.start_of("May 10 2022 10:10", unit, fmt=fmt)
+    exp_end = di.end_of("May 10 2022 10:10", unit, fmt=fmt)
+    assert (starts[1], ends[1]) == (exp_start, exp_end)
+
+
+def test_start_of_with_invalid_unit():
+    with pytest.raises(ValueError):
+        di.start_of(20220510, "day")
+
+
+@given(
+    date=st.datetimes(datetime.datetime(1800, 1, 1), datetime.datetime(2300, 1, 1)),
+    unit=st.sampled_from(["week", "month", "quarter", "year"]),
+)
+def test_start_and_end_of_match_pandas(date, unit):
+    date = date.replace(microsecond=0)
+    freq = {"week": "W", "month": "M", "quarter": "Q", "year": "Y"}[unit]
+    period = pd.Period(date, freq=freq)
+    fmt = "%Y%m%d%H%M%S"
+    value = int(date.strftime(fmt))
+    assert di.start_of(value, unit) == int(period.start_time.strftime(fmt))
+    assert di.end_of(value, unit) == int(period.end_time.strftime(fmt))
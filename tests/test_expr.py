@@ -0,0 +1,110 @@
+import datetime
+
+import pandas as pd
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+import dateint as di
+from dateint import convert
+from dateint.expr import _fuse
+
+
+def test_expr_is_lazy():
+    expression = di.expr(20220131).add(months=1).sub(days=1)
+    assert expression.operations == (("shift", 0, 1, 0, 0), ("shift", 0, 0, -1, 0))
+    assert expression.start_of("week").operations[-1] == ("start_of", "week")
+    assert len(expression.operations) == 2
+
+
+@pytest.mark.parametrize(
+    ["operations", "exp_operations"],
+    [
+        (
+            [("shift", 0, 1, 0, 0), ("shift", 0, 0, 1, 0), ("shift", 0, 0, -3, 0)],
+            [("shift", 0, 1, -2, 0)],
+        ),
+        (
+            [("shift", 0, 1, 0, 0), ("shift", 0, 0, 1, 3600), ("shift", 0, 0, 0, -60)],
+            [("shift", 0, 1, 1, 3540)],
+        ),
+        (
+            [("shift", 0, 1, 0, 0), ("shift", 0, 1, 0, 0)],
+            [("shift", 0, 1, 0, 0), ("shift", 0, 1, 0, 0)],
+        ),
+        (
+            [("shift", 0, 0, 1, 0), ("shift", 1, 0, 0, 0)],
+            [("shift", 0, 0, 1, 0), ("shift", 1, 0, 0, 0)],
+        ),
+        (
+            [("shift", 0, 0, 1, 0), ("start_of", "month"), ("shift", 0, 0, 1, 0)],
+            [("shift", 0, 0, 1, 0), ("start_of", "month"), ("shift", 0, 0, 1, 0)],
+        ),
+    ],
+)
+def test_fuse(operations, exp_operations):
+    assert _fuse(tuple(operations)) == tuple(exp_operations)
+
+
+@pytest.mark.parametrize(
+    ["date", "fmt", "exp_result"],
+    [
+        (20220115, None, 20220131),
+        ("20220210 101010", None, "20220228 000000"),
+        ("Feb 10 2022", "%b %d %Y", "Feb 28 2022"),
+        ([20220115, 20221201], None, [20220131, 20221231]),
+    ],
+)
+def test_compute(date, fmt, exp_result):
+    expression = di.expr(date, fmt=fmt).add(months=1).start_of("month").sub(days=1)
+    assert expression.compute() == exp_result
+
+
+def test_compute_with_time():
+    expression = di.expr("20220131 233000").add(months=1, hours=1).sub(minutes=45)
+    assert expression.compute() == "20220228 234500"
+    assert expression.compute(out_fmt="%Y%m%d") == "20220228"
+
+
+def test_compute_with_pandas():
+    dates = pd.Series(["May 10 2022 10:10", None], index=[1, 0], name="date")
+    result = (
+        di.expr(dates, fmt="%b %d %Y %H:%M")
+        .end_of("week")
+        .add_business_days(1)
+        .compute(out_fmt="%Y-%m-%d %H:%M")
+    )
+    assert result[1] == "2022-05-17 23:59"
+    assert pd.isna(result[0])
+    assert result.name == "date"
+
+
+def test_compute_parses_once(monkeypatch):
+    calls = []
+    to_datetime = convert._to_datetime
+
+    def count_to_datetime(value, fmt):
+        calls.append(fmt)
+        return to_datetime(value, fmt)
+
+    monkeypatch.setattr(convert, "_to_datetime", count_to_datetime)
+    dates = pd.Series(["Feb 10 2022", "Mar 31 2022"])
+    result = di.expr(dates, fmt="%b %d %Y").add(months=1).sub(days=1).compute()
+    assert len(calls) == 1
+    assert result.tolist() == ["Mar 09 2022", "Apr 29 2022"]
+
+
+@given(
+    date=st.dates(datetime.date(1900, 1, 1), datetime.date(2100, 1, 1)),
+    offsets=st.lists(
+        st.tuples(st.integers(-30, 30), st.integers(-100, 100)), min_size=1
+    ),
+)
+def test_compute_matches_sequential_operations(date, offsets):
+    value = int(date.strftime("%Y%m%d"))
+    expression = di.expr(value)
+    exp_result = value
+    for months, days in offsets:
+        expression = expression.add(months=months).sub(days=days)
+        exp_result = di.sub(di.add(exp_result, months=months), days=days)
+    assert expression.compute() == exp_result
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import dateint as di
+from dateint.exception import FormatError
+from dateint.extension import DateintArray, DateintDtype
+
+
+@pytest.fixture
+def dates():
+    return pd.Series([20220131, 20220228, None], index=[2, 1, 0], name="date").astype(
+        "dateint[%Y%m%d]"
+    )
+
+
+def test_dtype():
+    dtype = pd.api.types.pandas_dtype("dateint[%Y-%m-%d]")
+    assert dtype == DateintDtype("%Y-%m-%d")
+    assert dtype.name == "dateint[%Y-%m-%d]"
+    assert dtype.type is str
+    assert pd.api.types.pandas_dtype("dateint") == DateintDtype("%Y%m%d")
+    assert DateintDtype("%Y%m").type is int
+
+
+@pytest.mark.parametrize("fmt", ["%Y%m%d%H%M%S", "%b %d %Y"])
+def test_dtype_with_invalid_format(fmt):
+    with pytest.raises(ValueError):
+        DateintDtype(fmt)
+
+
+def test_array_is_compact(dates):
+    assert dates.array._ordinals.dtype == np.int32
+    assert dates.nbytes == 4 * len(dates)
+    assert dates.tolist() == [20220131, 20220228, pd.NA]
+
+
+@pytest.mark.parametrize(
+    ["values", "dtype"],
+    [
+        (["2022-01-31", None, "2022-02-28"], "dateint[%Y-%m-%d]"),
+        ([20220131, None, 20220228], "dateint[%Y%m%d]"),
+        (["20220131", None, "20220228"], "dateint[%Y%m%d]"),
+        (pd.to_datetime(["2022-01-31 10:00", None, "2022-02-28 00:00"]), "dateint"),
+    ],
+)
+def test_astype_from_values(values, dtype):
+    result = pd.Series(values).astype(dtype)
+    assert result.array.to_ordinal().days.tolist() == [19023, 0, 19051]
+    assert result.isna().tolist() == [False, True, False]
+
+
+def test_astype_with_invalid_values():
+    with pytest.raises(FormatError):
+        pd.Series([20220230]).astype("dateint")
+
+
+def test_astype_to_values(dates):
+    dates = dates.dropna()
+    assert dates.astype(np.int64).tolist() == [20220131, 20220228]
+    assert dates.astype("dateint[%Y-%m-%d]").astype(str).tolist() == [
+        "2022-01-31",
+        "2022-02-28",
+    ]
+    assert dates.astype("datetime64[s]").tolist() == [
+        pd.Timestamp("2022-01-31"),
+        pd.Timestamp("2022-02-28"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt", "exp_result"],
+    [
+        (pd.Series([20220115, 20220101, None]).astype("dateint"), "%Y%m", 202201),
+        (pd.Series([20220115, 20221231, None]).astype("dateint"), "%Y", 2022),
+        (pd.Series(pd.to_datetime(["2022-01-15", "2022-01-01", None])), "%Y%m", 202201),
+    ],
+)
+def test_astype_to_coarser_format(values, fmt, exp_result):
+    result = values.astype(f"dateint[{fmt}]")
+    assert result.tolist() == [exp_result, exp_result, pd.NA]
+    assert (result == exp_result).tolist() == [True, True, False]
+    assert result.value_counts().to_dict() == {exp_result: 2}
+    # the dates are the first day of their month/year, 2022-01-01 (a Saturday)
+    assert di.weekday(result).tolist() == [5, 5, pd.NA]
+
+
+def test_comparisons(dates):
+    assert (dates > 20220201).tolist() == [False, True, False]
+    assert (dates == "20220131").tolist() == [True, False, False]
+    assert (dates != dates).tolist() == [False, False, True]
+
+
+def test_methods(dates):
+    assert dates.min() == 20220131
+    assert dates.max() == 20220228
+    assert dates.sort_values(ascending=False).index.tolist() == [1, 2, 0]
+    assert dates.value_counts().to_dict() == {20220131: 1, 20220228: 1}
+    assert pd.concat([dates, dates]).dtype == dates.dtype
+    assert dates.take([1, -1]).tolist() == [20220228, pd.NA]
+
+
+@pytest.mark.parametrize(
+    ["operation", "kwargs", "exp_result"],
+    [
+        (di.add, {"months": 1}, [20220228, 20220328, pd.NA]),
+        (di.sub, {"days": 1}, [20220130, 20220227, pd.NA]),
+        (di.start_of, {"unit": "quarter"}, [20220101, 20220101, pd.NA]),
+        (di.add_business_days, {"days": 1}, [20220201, 20220301, pd.NA]),
+    ],
+)
+def test_operations_keep_dtype(dates, operation, kwargs, exp_result):
+    result = operation(dates, **kwargs)
+    assert result.dtype == dates.dtype
+    assert result.index.tolist() == [2, 1, 0]
+    assert result.name == "date"
+    assert result.tolist() == exp_result
+
+
+def test_operations_do_not_parse(dates, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed")
+
+    monkeypatch.setattr(di.convert, "_vector_to_ordinal", fail)
+    monkeypatch.setattr(di.convert, "_detect_format", fail)
+    result = di.expr(dates).add(months=1).end_of("month").compute(out_fmt="%Y-%m-%d")
+    assert result.dtype == DateintDtype("%Y-%m-%d")
+    assert result.tolist() == ["2022-02-28", "2022-03-31", pd.NA]
+
+
+def test_weekday_and_diff(dates):
+    result = di.weekday(dates)
+    assert result.dtype == "Int64"
+    assert result.tolist() == [0, 0, pd.NA]
+    assert di.isoweekday(dates).tolist() == [1, 1, pd.NA]
+    assert di.weekday(dates.dropna()).dtype == np.int8
+    result = di.diff(dates, 20220101)
+    assert result.tolist()[:2] == [30, 58]
+    assert pd.isna(result[0])
+
+
+def test_from_ordinal():
+    ordinal = di.numeric.Ordinal(np.array([19023, 19051]), 0)
+    result = DateintArray.from_ordinal(
+        ordinal, DateintDtype("%Y%m"), np.array([False, True])
+    )
+    assert list(result) == [202201, pd.NA]
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import dateint as di
+from dateint import frame
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "dt_open": [20220131, 20220228, 20221231],
+            "dt_close": [20220201, 20220301, 20230101],
+            "dt_ref": ["202201", "202202", "202212"],
+            "dt_time": ["20220131 101010", None, "20221231 235959"],
+            "other": ["a", "b", "c"],
+        },
+        index=[3, 2, 1],
+    )
+
+
+@pytest.mark.parametrize(
+    ["operation", "kwargs"],
+    [
+        (di.add, {"months": 1}),
+        (di.sub, {"years": 1, "days": 1}),
+        (di.weekday, {}),
+        (di.isoweekday, {}),
+    ],
+)
+def test_operation_matches_series(df, operation, kwargs):
+    columns = ["dt_open", "dt_close", "dt_ref", "dt_time"]
+    result = operation(df, columns=columns, **kwargs)
+    for column in columns:
+        pd.testing.assert_series_equal(result[column], operation(df[column], **kwargs))
+    pd.testing.assert_series_equal(result["other"], df["other"])
+
+
+def test_operation_does_not_modify_frame(df):
+    original = df.copy()
+    di.add(df, days=1, columns=["dt_open", "dt_ref"])
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_operation_inplace(df):
+    assert di.add(df, months=1, columns=["dt_open", "dt_ref"], inplace=True) is None
+    assert df["dt_open"].tolist() == [20220228, 20220328, 20230131]
+    assert df["dt_ref"].tolist() == ["202202", "202203", "202301"]
+    assert df["dt_close"].tolist() == [20220201, 20220301, 20230101]
+
+
+def test_operation_with_per_column_offsets(df):
+    result = di.add(
+        df,
+        months={"dt_open": 1},
+        days={"dt_close": -1},
+        columns=["dt_open", "dt_close"],
+    )
+    assert result["dt_open"].tolist() == [20220228, 20220328, 20230131]
+    assert result["dt_close"].tolist() == [20220131, 20220228, 20221231]
+
+
+def test_operation_on_every_column():
+    df = pd.DataFrame({"a": [20220101], "b": [202201]})
+    result = di.weekday(df)
+    assert result.dtypes.tolist() == [np.int8, np.int8]
+    assert result.iloc[0].tolist() == [5, 5]
+
+
+def test_formats_are_detected_once_per_column(df, monkeypatch):
+    calls = []
+
+    def first_matching_format(values):
+        calls.append(values.name)
+        return di.convert._first_matching_format(values)
+
+    monkeypatch.setattr(frame, "_first_matching_format", first_matching_format)
+    di.add(df, days=1, columns=["dt_open", "dt_close", "dt_ref"])
+    assert calls == ["dt_open", "dt_close", "dt_ref"]
+
+
+def test_integer_columns_are_operated_as_one_block(df):
+    calls = []
+
+    def operation(values, **kwargs):
+        calls.append(len(values))
+        return di.add(values, **kwargs)
+
+    df["dt_month"] = [202201, 202202, 202203]
+    result = frame.apply(
+        operation, df, ["dt_open", "dt_close", "dt_month", "dt_ref"], days=1
+    )
+    # dt_open and dt_close share a block, dt_month has another format
+    assert sorted(calls) == [3, 3, 6]
+    assert result["dt_close"].tolist() == [20220202, 20220302, 20230102]
+    assert result["dt_month"].tolist() == [202201, 202202, 202203]
+
+
+def test_operation_with_errors():
+    df = pd.DataFrame({"a": [20220131, 20220231], "b": ["20220131", "20221331"]})
+    result = di.add(df, days=1, errors="coerce")
+    assert result["a"].tolist()[0] == 20220201
+    assert result["b"].tolist()[0] == "20220201"
+    assert result.isna().to_numpy().tolist() == [[False, False], [True, True]]
+
+
+def test_operation_with_errors_and_invalid_first_values():
+    df = pd.DataFrame({"a": [20220231, 20220131], "b": ["bad", "20220131"]})
+    result = di.add(df, days=1, errors="coerce")
+    assert result.isna().to_numpy().tolist() == [[True, True], [False, False]]
+    assert result.iloc[1].tolist() == [20220201, "20220201"]
+
+
+@pytest.mark.parametrize("operation", [di.add, di.sub, di.weekday, di.isoweekday])
+def test_operation_with_out(df, operation):
+    with pytest.raises(TypeError, match="inplace"):
+        operation(df, columns=["dt_open"], out=np.empty(len(df)))
+
+
+@pytest.mark.parametrize(
+    ["frame_columns", "columns"],
+    [
+        (["a", "a", "b"], None),
+        (["a", "a", "b"], ["a"]),
+        (["a", "b", "c"], ["a", "a"]),
+    ],
+)
+def test_operation_with_duplicated_columns(frame_columns, columns):
+    df = pd.DataFrame([[20220131] * 3], columns=frame_columns)
+    with pytest.raises(ValueError, match="Duplicated"):
+        di.add(df, days=1, columns=columns)
+    # columns that are not duplicated are operated
+    if columns is None:
+        result = di.add(df, days=1, columns=["b"])
+        assert result["b"].tolist() == [20220201]
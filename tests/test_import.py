@@ -0,0 +1,87 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules(code: str) -> set:
+    """Run `code` in a new interpreter and return the modules it imports."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines are like "import time:  self [us] | cumulative | imported package"
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    ["code"],
+    [
+        ("import dateint",),
+        (
+            "import dateint as di; di.today(); di.add(20220131, months=1); "
+            "di.sub('20220131 235959', days=1); di.weekday(20220131); "
+            "di.isoweekday(202201)",
+        ),
+        (
+            "import numpy as np; import dateint as di; "
+            "di.add(np.array([20220131, 20220228]), months=1); "
+            "di.sub(np.array(['20220131 235959']), days=1); "
+            "di.weekday(np.array([20220131.0, np.nan])); "
+            "di.add(np.array([20220131]), days=1, out=np.empty(1, np.int64)); "
+            "di.diff(np.array([20220131]), 20220101, unit='months')",
+        ),
+        (
+            "import dateint as di; di.add([20220131], months=1); "
+            "di.weekday(('20220131',))",
+        ),
+        (
+            "import dateint as di; list(di.range(20220101, 20220110)); "
+            "di.range(202201, 202212, lazy=False)",
+        ),
+        (
+            "import numpy as np; import dateint as di; di.validate(20220131); "
+            "di.validate(np.array([20220131, 20220231])); "
+            "di.add(20220231, days=1, errors='coerce'); "
+            "di.add(np.array(['20220131', '20220231']), days=1, errors='coerce')",
+        ),
+    ],
+)
+def test_usage_without_series_does_not_import_pandas(code):
+    modules = _imported_modules(code)
+    assert "dateint" in modules
+    assert "pandas" not in modules
+    assert "pyarrow" not in modules
+    assert "dateutil" not in modules
+
+
+def test_import_does_not_import_process_pool():
+    modules = _imported_modules("import dateint as di; di.add(20220131, days=1)")
+    assert "dateint.parallel" not in modules
+    assert "concurrent.futures.process" not in modules
+    assert "multiprocessing.shared_memory" not in modules
+
+
+def test_series_usage_imports_pandas():
+    modules = _imported_modules(
+        "import pandas as pd; import dateint as di; "
+        "di.add(pd.Series([20220131]), days=1)"
+    )
+    assert "pandas" in modules
+
+
+def test_arrow_usage_does_not_import_pandas():
+    pytest.importorskip("polars")
+    modules = _imported_modules(
+        "import polars as pl; import dateint as di; "
+        "di.add(pl.Series([20220131, None]), months=1); "
+        "di.weekday(pl.Series(['20220131']).to_arrow())"
+    )
+    assert "pyarrow" in modules
+    assert "pandas" not in modules
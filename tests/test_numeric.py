@@ -0,0 +1,269 @@
+import datetime
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+from hypothesis import given
+from hypothesis import strategies as st
+
+from dateint.exception import FormatError
+from dateint.numeric import (
+    Ordinal,
+    from_ordinal,
+    is_numeric_format,
+    is_valid,
+    is_valid_text,
+    ordinal_to_text,
+    scalar_from_ordinal,
+    scalar_ordinal_to_text,
+    scalar_text_to_ordinal,
+    scalar_to_ordinal,
+    shift,
+    text_to_ordinal,
+    to_ordinal,
+)
+
+
+@pytest.mark.parametrize(
+    ["fmt", "exp_result"],
+    [
+        ("%Y%m", True),
+        ("%Y%m%d", True),
+        ("%Y%m%d%H%M%S", True),
+        ("%d%m%Y", True),
+        ("%Y%m%d %H%M%S", False),
+        ("%Y-%m-%d", False),
+        ("%y%m%d", False),
+        ("%m%d", False),
+        ("", False),
+    ],
+)
+def test_is_numeric_format(fmt, exp_result):
+    assert is_numeric_format(fmt) is exp_result
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt", "exp_days", "exp_seconds"],
+    [
+        ([19700101, 19691231, 20000301], "%Y%m%d", [0, -1, 11017], [0, 0, 0]),
+        ([197001, 197002], "%Y%m", [0, 31], [0, 0]),
+        ([19700102010203], "%Y%m%d%H%M%S", [1], [3723]),
+        ([2011970], "%d%m%Y", [1], [0]),
+    ],
+)
+def test_to_ordinal(values, fmt, exp_days, exp_seconds):
+    ordinal = to_ordinal(np.array(values), fmt)
+    assert list(ordinal.days) == exp_days
+    assert list(np.broadcast_to(ordinal.seconds, len(values))) == exp_seconds
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt"],
+    [
+        ([20220101, 20220230], "%Y%m%d"),
+        ([20221301], "%Y%m%d"),
+        ([20220100], "%Y%m%d"),
+        ([202200], "%Y%m"),
+        ([20220101240000], "%Y%m%d%H%M%S"),
+    ],
+)
+def test_to_ordinal_with_invalid_values(values, fmt):
+    with pytest.raises(FormatError, match=str(values[-1])):
+        to_ordinal(np.array(values), fmt)
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt", "exp_result"],
+    [
+        ([20220228, 20220229, 20240229], "%Y%m%d", [True, False, True]),
+        ([20221301, 20220100, -20220101], "%Y%m%d", [False, False, False]),
+        ([202212, 202200], "%Y%m", [True, False]),
+        ([20220101235959, 20220101236000], "%Y%m%d%H%M%S", [True, False]),
+    ],
+)
+def test_is_valid(values, fmt, exp_result):
+    assert is_valid(np.array(values), fmt).tolist() == exp_result
+
+
+@given(
+    st.lists(st.integers(0, 99999999), min_size=1, max_size=20),
+)
+def test_is_valid_matches_to_ordinal(values):
+    valid = is_valid(np.array(values), "%Y%m%d")
+    for value, value_valid in zip(values, valid):
+        try:
+            to_ordinal(np.array([value]), "%Y%m%d")
+        except FormatError:
+            assert not value_valid
+        else:
+            assert value_valid
+
+
+@given(
+    st.lists(
+        st.dates(
+            min_value=datetime.date(1, 1, 1), max_value=datetime.date(9999, 12, 31)
+        ),
+        min_size=1,
+        max_size=20,
+    )
+)
+def test_ordinal_roundtrip(dates):
+    values = np.array([int(d.strftime("%Y%m%d")) for d in dates])
+    ordinal = to_ordinal(values, "%Y%m%d")
+    epoch = datetime.date(1970, 1, 1).toordinal()
+    assert list(ordinal.days) == [d.toordinal() - epoch for d in dates]
+    assert list(from_ordinal(ordinal, "%Y%m%d")) == list(values)
+
+
+@given(
+    st.lists(
+        st.dates(
+            min_value=datetime.date(1900, 1, 1), max_value=datetime.date(2100, 1, 1)
+        ),
+        min_size=1,
+        max_size=20,
+    ),
+    st.integers(-100, 100),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+)
+def test_shift_matches_relativedelta(dates, years, months, days):
+    values = np.array([int(d.strftime("%Y%m%d")) for d in dates])
+    ordinal = shift(to_ordinal(values, "%Y%m%d"), years=years, months=months, days=days)
+    delta = relativedelta(years=years, months=months, days=days)
+    exp_result = [int((d + delta).strftime("%Y%m%d")) for d in dates]
+    assert list(from_ordinal(ordinal, "%Y%m%d")) == exp_result
+
+
+def test_from_ordinal_out_of_range():
+    ordinal = shift(to_ordinal(np.array([99991231]), "%Y%m%d"), days=1)
+    with pytest.raises(OverflowError):
+        from_ordinal(ordinal, "%Y%m%d")
+
+
+@pytest.mark.parametrize(
+    ["value", "fmt", "exp_result"],
+    [
+        (19700101, "%Y%m%d", (0, 0)),
+        (20000301, "%Y%m%d", (11017, 0)),
+        (197002, "%Y%m", (31, 0)),
+        (19700102010203, "%Y%m%d%H%M%S", (1, 3723)),
+        (20220230, "%Y%m%d", None),
+        (20221301, "%Y%m%d", None),
+        (202200, "%Y%m", None),
+        (20220101246000, "%Y%m%d%H%M%S", None),
+    ],
+)
+def test_scalar_to_ordinal(value, fmt, exp_result):
+    assert scalar_to_ordinal(value, fmt) == exp_result
+
+
+@given(
+    st.dates(min_value=datetime.date(1, 1, 1), max_value=datetime.date(9999, 12, 31)),
+    st.integers(-100, 100),
+    st.integers(-100, 100),
+    st.integers(-1000, 1000),
+)
+def test_scalar_shift_matches_relativedelta(date, years, months, days):
+    delta = relativedelta(years=years, months=months, days=days)
+    try:
+        exp_result = int((date + delta).strftime("%Y%m%d"))
+    except (OverflowError, ValueError):
+        return
+
+    ordinal = scalar_to_ordinal(int(date.strftime("%Y%m%d")), "%Y%m%d")
+    result = shift(ordinal, years=years, months=months, days=days)
+    assert scalar_from_ordinal(result, "%Y%m%d") == exp_result
+
+
+@pytest.mark.parametrize(
+    ["text", "fmt", "exp_result"],
+    [
+        ("20220110", "%Y%m%d", (19002, 0)),
+        ("2022-01-10", "%Y-%m-%d", (19002, 0)),
+        ("10/01/2022", "%d/%m/%Y", (19002, 0)),
+        ("20220110 010203", "%Y%m%d %H%M%S", (19002, 3723)),
+        ("2022-01-10", "%Y/%m/%d", None),
+        ("2022-01-1a", "%Y-%m-%d", None),
+        ("2022011", "%Y%m%d", None),
+    ],
+)
+def test_scalar_text_to_ordinal(text, fmt, exp_result):
+    assert scalar_text_to_ordinal(text, fmt) == exp_result
+
+
+@pytest.mark.parametrize(
+    ["ordinal", "fmt", "exp_result"],
+    [
+        ((19002, 0), "%Y%m%d", "20220110"),
+        ((19002, 0), "%d/%m/%Y", "10/01/2022"),
+        ((19002, 3723), "%Y-%m-%d %H:%M:%S", "2022-01-10 01:02:03"),
+        ((-700000, 0), "%Y%m%d", "00530619"),
+    ],
+)
+def test_scalar_ordinal_to_text(ordinal, fmt, exp_result):
+    assert scalar_ordinal_to_text(Ordinal(*ordinal), fmt) == exp_result
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt", "exp_days", "exp_seconds"],
+    [
+        (["20220110", "19700101"], "%Y%m%d", [19002, 0], [0, 0]),
+        ([b"20220110", b"19700101"], "%Y%m%d", [19002, 0], [0, 0]),
+        (["2022-01-10"], "%Y-%m-%d", [19002], [0]),
+        (["20220110 010203"], "%Y%m%d %H%M%S", [19002], [3723]),
+        (np.array(["197002"], dtype="U10"), "%Y%m", [31], [0]),
+        (np.array([], dtype="U8"), "%Y%m%d", [], []),
+    ],
+)
+def test_text_to_ordinal(values, fmt, exp_days, exp_seconds):
+    ordinal = text_to_ordinal(np.array(values), fmt)
+    assert list(ordinal.days) == exp_days
+    assert list(np.broadcast_to(ordinal.seconds, len(values))) == exp_seconds
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt"],
+    [
+        (["20220110", "2022011"], "%Y%m%d"),
+        (["20220110", "202201100"], "%Y%m%d"),
+        (["2022011a"], "%Y%m%d"),
+        (["2022/01/10"], "%Y-%m-%d"),
+        (["2022-1-10"], "%Y%m%d"),
+        (["20220230"], "%Y%m%d"),
+    ],
+)
+def test_text_to_ordinal_with_invalid_values(values, fmt):
+    with pytest.raises(FormatError, match=values[-1]):
+        text_to_ordinal(np.array(values), fmt)
+
+
+@pytest.mark.parametrize(
+    ["values", "fmt", "exp_result"],
+    [
+        (["20220110", "2022011", "202201100"], "%Y%m%d", [True, False, False]),
+        (["2022011a", "20220230", "20240229"], "%Y%m%d", [False, False, True]),
+        (["2022-01-10", "2022/01/10"], "%Y-%m-%d", [True, False]),
+        ([b"20221231 235959", b"20221231 240000"], "%Y%m%d %H%M%S", [True, False]),
+        (np.array([], dtype="U8"), "%Y%m%d", []),
+    ],
+)
+def test_is_valid_text(values, fmt, exp_result):
+    assert is_valid_text(np.array(values), fmt).tolist() == exp_result
+
+
+@pytest.mark.parametrize(
+    ["days", "seconds", "fmt", "kind", "exp_result"],
+    [
+        ([19002, 0], 0, "%Y%m%d", "U", ["20220110", "19700101"]),
+        ([19002, -700000], 0, "%Y%m%d", "S", [b"20220110", b"00530619"]),
+        ([19002], [3723], "%Y-%m-%d %H:%M:%S", "U", ["2022-01-10 01:02:03"]),
+        ([19002], 0, "%d/%m/%Y", "U", ["10/01/2022"]),
+        ([], 0, "%Y%m%d", "U", []),
+    ],
+)
+def test_ordinal_to_text(days, seconds, fmt, kind, exp_result):
+    result = ordinal_to_text(Ordinal(np.array(days), np.array(seconds)), fmt, kind)
+    assert result.dtype.kind == kind
+    assert list(result) == exp_result
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dateint import add, isoweekday, sub, weekday
+from dateint.exception import FormatError
+from dateint.parallel import get_workers, map_blocks
+
+
+@pytest.mark.parametrize(["n_jobs", "exp_workers"], [(1, 1), (4, 4), (-1, 8), (-2, 7)])
+def test_get_workers(monkeypatch, n_jobs, exp_workers):
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    assert get_workers(n_jobs) == exp_workers
+
+
+def test_get_workers_with_zero():
+    with pytest.raises(ValueError):
+        get_workers(0)
+
+
+@pytest.mark.parametrize(
+    ["function", "values"],
+    [
+        (np.negative, np.arange(10)),
+        (np.negative, np.arange(1)),
+        (np.char.str_len, np.array(["a", "bb", "ccc"] * 3)),
+    ],
+)
+def test_map_blocks(function, values):
+    result = map_blocks(function, values, 3)
+    exp_result = function(values)
+    assert result.dtype == exp_result.dtype
+    assert list(result) == list(exp_result)
+
+
+@pytest.mark.parametrize(
+    ["dates"],
+    [
+        (pd.Series([20220131, 20200229, 20221231] * 5, index=range(10, 25), name="d"),),
+        (pd.Series(["20220131", "20200229", "20221231"] * 5, dtype=object),),
+        (pd.Series(["20220131", "20200229", "20221231"] * 5, dtype="str"),),
+        (pd.Series(["20220131", None, "20221231"] * 5, dtype="str"),),
+    ],
+)
+@pytest.mark.parametrize(
+    ["function", "kwargs"],
+    [
+        (add, {"months": 1}),
+        (sub, {"years": 1, "days": 1, "out_fmt": "%Y%m"}),
+        (weekday, {}),
+        (isoweekday, {}),
+    ],
+)
+def test_parallel_matches_serial(dates, function, kwargs):
+    result = function(dates, n_jobs=2, **kwargs)
+    pd.testing.assert_series_equal(result, function(dates, **kwargs))
+
+
+def test_parallel_with_invalid_values():
+    with pytest.raises(FormatError, match="2022023"):
+        add(pd.Series(["20220131", "2022023"] * 3), days=1, n_jobs=2)
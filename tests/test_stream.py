@@ -0,0 +1,138 @@
+import pandas as pd
+import pytest
+
+from dateint import stream
+from dateint.__main__ import main
+from dateint.exception import FormatError
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("id,date,other\n1,20220131,a\n2,,b\n3,20200229,c\n4,20221231,d\n")
+    return path
+
+
+def test_transform_detects_format_once():
+    chunks = [
+        pd.DataFrame({"date": pd.Series([], dtype=int)}),
+        pd.DataFrame({"date": [20220131, 20220228]}),
+        # would be detected as %Y%m%d %H%M%S on its own
+        pd.DataFrame({"date": [20220131235959]}),
+    ]
+    result = stream.transform(chunks, ["date"], "add", months=1)
+    # the empty chunk is kept as is
+    assert next(result)["date"].tolist() == []
+    assert next(result)["date"].tolist() == [20220228, 20220328]
+    with pytest.raises(FormatError):
+        next(result)
+
+
+@pytest.mark.parametrize("arrow", [False, True])
+def test_transform_detects_format_after_null_chunks(arrow):
+    chunks = [
+        pd.DataFrame({"date": pd.Series([None, None], dtype=object)}),
+        # would be handled as %Y%m%d, the format of missing values, if locked in
+        pd.DataFrame({"date": [None, "20220131 101010"]}),
+        pd.DataFrame({"date": ["20220228 000000"]}),
+    ]
+    if arrow:
+        pa = pytest.importorskip("pyarrow")
+        chunks = [pa.RecordBatch.from_pandas(c, preserve_index=False) for c in chunks]
+
+    def get_dates(chunk):
+        dates = chunk.column("date").to_pylist() if arrow else chunk["date"].tolist()
+        return [None if pd.isna(d) else d for d in dates]
+
+    result = list(stream.transform(chunks, ["date"], "add", days=1))
+    assert get_dates(result[0]) == [None, None]
+    assert get_dates(result[1]) == [None, "20220201 101010"]
+    assert get_dates(result[2]) == ["20220301 000000"]
+
+
+def test_transform_is_lazy():
+    def chunks():
+        yield pd.DataFrame({"date": [20220131]})
+        raise AssertionError("second chunk read")
+
+    result = stream.transform(chunks(), ["date"], "weekday")
+    assert next(result)["date"].tolist() == [0]
+
+
+@pytest.mark.parametrize(
+    ["operation", "kwargs", "exp_dates"],
+    [
+        ("add", {"months": 1}, ["20220228", "", "20200329", "20230131"]),
+        (
+            "sub",
+            {"years": 1, "out_fmt": "%Y-%m"},
+            ["2021-01", "", "2019-02", "2021-12"],
+        ),
+        ("isoweekday", {}, ["1", "", "6", "6"]),
+    ],
+)
+def test_transform_csv_file(csv_path, tmp_path, operation, kwargs, exp_dates):
+    output_path = tmp_path / "output.csv"
+    stream.transform_file(
+        csv_path, output_path, ["date"], operation, chunksize=1, **kwargs
+    )
+    result = pd.read_csv(output_path, dtype=str, keep_default_na=False)
+    assert result["date"].tolist() == exp_dates
+    assert result["other"].tolist() == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 4])
+def test_transform_csv_file_weekday_does_not_depend_on_chunksize(
+    csv_path, tmp_path, chunksize
+):
+    output_path = tmp_path / "output.csv"
+    stream.transform_file(
+        csv_path, output_path, ["date"], "weekday", chunksize=chunksize
+    )
+    assert output_path.read_text().splitlines()[1:] == [
+        "1,0,a",
+        "2,,b",
+        "3,5,c",
+        "4,5,d",
+    ]
+
+
+@pytest.mark.parametrize("content", ["id,date\n", "id,date\n1,\n2,\n"])
+def test_transform_csv_file_without_dates(tmp_path, content):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(content)
+    output_path = tmp_path / "output.csv"
+    stream.transform_file(input_path, output_path, ["date"], "add", days=1)
+    assert output_path.read_text() == content
+
+
+def test_transform_parquet_file(csv_path, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    stream.transform_file(csv_path, input_path, ["id"], "add", fmt="%d", days=1)
+    stream.transform_file(input_path, output_path, ["date"], "weekday", chunksize=3)
+    table = pq.read_table(output_path)
+    assert table.column("id").to_pylist() == ["02", "03", "04", "05"]
+    assert table.column("date").type == pa.int8()
+    assert table.column("date").to_pylist() == [0, None, 5, 5]
+    assert table.column("other").to_pylist() == ["a", "b", "c", "d"]
+
+    csv_output_path = tmp_path / "output.csv"
+    stream.transform_file(input_path, csv_output_path, ["date"], "add", days=1)
+    result = pd.read_csv(csv_output_path, dtype=str, keep_default_na=False)
+    assert result["date"].tolist() == ["20220201", "", "20200301", "20230101"]
+
+
+def test_main(csv_path, tmp_path):
+    output_path = tmp_path / "output.csv"
+    main(["add", str(csv_path), str(output_path), "-c", "date", "--days", "1"])
+    result = pd.read_csv(output_path, dtype=str, keep_default_na=False)
+    assert result["date"].tolist() == ["20220201", "", "20200301", "20230101"]
+
+
+def test_main_with_invalid_arguments(csv_path, tmp_path):
+    output_path = tmp_path / "output.csv"
+    with pytest.raises(SystemExit):
+        main(["weekday", str(csv_path), str(output_path), "-c", "date", "--days", "1"])